@@ -18,25 +18,41 @@ from sagemaker_ai_mcp_server.helpers.domains import (
 from sagemaker_ai_mcp_server.helpers.endpoints import (
     delete_endpoint,
     delete_endpoint_config,
+    delete_endpoint_configs,
+    delete_endpoints,
     describe_endpoint,
     describe_endpoint_config,
+    describe_endpoints_many,
+    list_all_endpoints,
     list_endpoint_configs,
     list_endpoints,
 )
 from sagemaker_ai_mcp_server.helpers.jobs import (
     describe_inference_recommendations_job,
     describe_processing_job,
+    describe_processing_jobs_many,
     describe_training_job,
+    describe_training_jobs_many,
     describe_transform_job,
+    describe_transform_jobs_many,
+    iter_training_jobs,
+    list_all_jobs,
     list_inference_recommendations_job_steps,
     list_inference_recommendations_jobs,
     list_processing_jobs,
+    list_processing_jobs_with_details,
     list_training_jobs,
+    list_training_jobs_fast,
+    list_training_jobs_with_details,
     list_transform_jobs,
+    list_transform_jobs_with_details,
     stop_inference_recommendations_job,
     stop_processing_job,
+    stop_processing_jobs,
     stop_training_job,
+    stop_training_jobs,
     stop_transform_job,
+    stop_transform_jobs,
 )
 from sagemaker_ai_mcp_server.helpers.mlflow_managed import (
     create_mlflow_tracking_server,
@@ -54,18 +70,34 @@ from sagemaker_ai_mcp_server.helpers.model_cards import (
     list_model_card_versions,
     list_model_cards,
 )
-from sagemaker_ai_mcp_server.helpers.models import delete_model, describe_model, list_models
+from sagemaker_ai_mcp_server.helpers.models import (
+    delete_model,
+    describe_model,
+    describe_models_many,
+    iter_models,
+    list_models,
+)
 from sagemaker_ai_mcp_server.helpers.pipelines import (
     delete_pipeline,
+    describe_all_pipelines,
     describe_pipeline,
     describe_pipeline_definition_for_execution,
     describe_pipeline_execution,
+    describe_pipeline_executions_many,
+    describe_pipelines_many,
+    digest_definition,
+    iter_pipeline_execution_steps,
+    iter_pipeline_executions,
+    iter_pipelines,
+    list_all_executions_for_pipelines,
     list_pipeline_execution_steps,
     list_pipeline_executions,
+    list_pipeline_executions_with_details,
     list_pipeline_parameters_for_execution,
     list_pipelines,
     start_pipeline_execution,
     stop_pipeline_execution,
+    stop_pipeline_executions,
 )
 from sagemaker_ai_mcp_server.helpers.profiles_spaces import list_spaces, list_user_profiles
 
@@ -80,25 +112,44 @@ __all__ = [
     'delete_domain',
     'delete_endpoint',
     'delete_endpoint_config',
+    'delete_endpoint_configs',
+    'delete_endpoints',
     'delete_mlflow_tracking_server',
     'delete_model',
     'delete_model_card',
     'delete_pipeline',
+    'describe_all_pipelines',
     'describe_app',
     'describe_app_image_config',
     'describe_domain',
     'describe_endpoint',
     'describe_endpoint_config',
+    'describe_endpoints_many',
     'describe_inference_recommendations_job',
     'describe_mlflow_tracking_server',
     'describe_model',
     'describe_model_card',
+    'describe_models_many',
     'describe_pipeline',
     'describe_pipeline_definition_for_execution',
     'describe_pipeline_execution',
+    'describe_pipeline_executions_many',
+    'describe_pipelines_many',
     'describe_processing_job',
+    'describe_processing_jobs_many',
     'describe_training_job',
+    'describe_training_jobs_many',
     'describe_transform_job',
+    'describe_transform_jobs_many',
+    'digest_definition',
+    'iter_models',
+    'iter_pipeline_execution_steps',
+    'iter_pipeline_executions',
+    'iter_pipelines',
+    'iter_training_jobs',
+    'list_all_endpoints',
+    'list_all_executions_for_pipelines',
+    'list_all_jobs',
     'list_apps',
     'list_domains',
     'list_endpoint_configs',
@@ -112,19 +163,28 @@ __all__ = [
     'list_models',
     'list_pipeline_execution_steps',
     'list_pipeline_executions',
+    'list_pipeline_executions_with_details',
     'list_pipeline_parameters_for_execution',
     'list_pipelines',
     'list_processing_jobs',
+    'list_processing_jobs_with_details',
     'list_spaces',
     'list_training_jobs',
+    'list_training_jobs_fast',
+    'list_training_jobs_with_details',
     'list_transform_jobs',
+    'list_transform_jobs_with_details',
     'list_user_profiles',
     'start_mlflow_tracking_server',
     'start_pipeline_execution',
     'stop_inference_recommendations_job',
     'stop_mlflow_tracking_server',
     'stop_pipeline_execution',
+    'stop_pipeline_executions',
     'stop_processing_job',
+    'stop_processing_jobs',
     'stop_training_job',
+    'stop_training_jobs',
     'stop_transform_job',
+    'stop_transform_jobs',
 ]
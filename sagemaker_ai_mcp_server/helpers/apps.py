@@ -1,10 +1,46 @@
 """Helper Functions for SageMaker Apps."""
 
 from loguru import logger
-from sagemaker_ai_mcp_server.helpers.utils import get_sagemaker_client
-from typing import Any, Dict, List, Literal
+from sagemaker_ai_mcp_server.helpers.cache import (
+    LONG_TTL_SECONDS,
+    SHORT_TTL_SECONDS,
+    STALE_TTL_SECONDS,
+    clear_cache,
+    invalidate,
+    ttl_cache,
+)
+from sagemaker_ai_mcp_server.helpers.utils import get_sagemaker_client, paginate, run_in_executor
+from typing import Any, Dict, List, Literal, get_args
+
+
+# The app types accepted by the SageMaker App APIs.
+AppType = Literal[
+    'JupyterServer',
+    'KernelGateway',
+    'RStudioServerPro',
+    'RSessionGateway',
+    'Canvas',
+    'JupyterLab',
+    'CodeEditor',
+    'TensorBoard',
+    'DetailedProfiler',
+]
+APP_TYPES = frozenset(get_args(AppType))
+
+
+def _validate_app_type(app_type: str) -> None:
+    """Reject unknown app types before any SageMaker request is made.
+
+    Args:
+        app_type (str): The app type to check.
+    """
+    if app_type not in APP_TYPES:
+        raise ValueError(
+            f'Invalid app type {app_type!r}, expected one of: {", ".join(sorted(APP_TYPES))}.'
+        )
 
 
+@ttl_cache(SHORT_TTL_SECONDS)
 async def list_apps() -> List[Dict[str, Any]]:
     """List all SageMaker Apps.
 
@@ -12,26 +48,15 @@ async def list_apps() -> List[Dict[str, Any]]:
         List[Dict[str, Any]]: A list of SageMaker Apps.
     """
     client = get_sagemaker_client()
-    logger.info('Listing SageMaker Apps...')
+    logger.debug('Listing SageMaker Apps...')
 
-    response = client.list_apps()
-    return response.get('Apps', [])
+    return await run_in_executor(paginate, client, 'list_apps', 'Apps')
 
 
 async def create_app(
     domain_id: str,
     user_profile_name: str,
-    app_type: Literal[
-        'JupyterServer',
-        'KernelGateway',
-        'RStudioServerPro',
-        'RSessionGateway',
-        'Canvas',
-        'JupyterLab',
-        'CodeEditor',
-        'TensorBoard',
-        'DetailedProfiler',
-    ],
+    app_type: AppType,
     app_name: str,
     resource_spec: Dict[str, Any] = None,
 ) -> Dict[str, Any]:
@@ -47,9 +72,14 @@ async def create_app(
     Returns:
         Dict[str, Any]: The details of the created SageMaker App.
     """
+    _validate_app_type(app_type)
     client = get_sagemaker_client()
     logger.info(
-        f'Creating SageMaker App: {app_name} of type {app_type} for user {user_profile_name} in domain {domain_id}'
+        'Creating SageMaker App: {} of type {} for user {} in domain {}',
+        app_name,
+        app_type,
+        user_profile_name,
+        domain_id,
     )
 
     create_params = {
@@ -62,8 +92,10 @@ async def create_app(
     if resource_spec:
         create_params['ResourceSpec'] = resource_spec
 
-    response = client.create_app(**create_params)
-    logger.info(f'App {app_name} creation initiated successfully.')
+    response = await run_in_executor(client.create_app, **create_params)
+    invalidate('describe_app', domain_id, user_profile_name, app_type, app_name)
+    clear_cache('list_apps')
+    logger.info('App {} creation initiated successfully.', app_name)
     return response.get('AppArn', {})
 
 
@@ -82,29 +114,21 @@ async def create_presigned_notebook_instance_url(
     """
     client = get_sagemaker_client()
     logger.info(
-        f'Creating presigned URL for SageMaker Notebook Instance: {notebook_instance_name}'
+        'Creating presigned URL for SageMaker Notebook Instance: {}', notebook_instance_name
     )
-    response = client.create_presigned_notebook_instance_url(
+    response = await run_in_executor(
+        client.create_presigned_notebook_instance_url,
         NotebookInstanceName=notebook_instance_name,
         SessionExpirationDurationInSeconds=session_expiration_duration_in_seconds,
     )
     return response.get('AuthorizedUrl', '')
 
 
+@ttl_cache(SHORT_TTL_SECONDS, stale=STALE_TTL_SECONDS)
 async def describe_app(
     domain_id: str,
     user_profile_name: str,
-    app_type: Literal[
-        'JupyterServer',
-        'KernelGateway',
-        'RStudioServerPro',
-        'RSessionGateway',
-        'Canvas',
-        'JupyterLab',
-        'CodeEditor',
-        'TensorBoard',
-        'DetailedProfiler',
-    ],
+    app_type: AppType,
     app_name: str,
 ) -> Dict[str, Any]:
     """Describe a SageMaker App.
@@ -118,11 +142,17 @@ async def describe_app(
     Returns:
         Dict[str, Any]: The details of the SageMaker App.
     """
+    _validate_app_type(app_type)
     client = get_sagemaker_client()
-    logger.info(
-        f'Describing SageMaker App: {app_name} of type {app_type} for user {user_profile_name} in domain {domain_id}'
+    logger.debug(
+        'Describing SageMaker App: {} of type {} for user {} in domain {}',
+        app_name,
+        app_type,
+        user_profile_name,
+        domain_id,
     )
-    response = client.describe_app(
+    response = await run_in_executor(
+        client.describe_app,
         DomainId=domain_id,
         UserProfileName=user_profile_name,
         AppType=app_type,
@@ -131,6 +161,7 @@ async def describe_app(
     return response
 
 
+@ttl_cache(LONG_TTL_SECONDS, stale=STALE_TTL_SECONDS)
 async def describe_app_image_config(app_image_config_name: str) -> Dict[str, Any]:
     """Describe a SageMaker App Image Config.
 
@@ -141,25 +172,17 @@ async def describe_app_image_config(app_image_config_name: str) -> Dict[str, Any
         Dict[str, Any]: The details of the SageMaker App Image Config.
     """
     client = get_sagemaker_client()
-    logger.info(f'Describing SageMaker App Image Config: {app_image_config_name}')
-    response = client.describe_app_image_config(AppImageConfigName=app_image_config_name)
+    logger.debug('Describing SageMaker App Image Config: {}', app_image_config_name)
+    response = await run_in_executor(
+        client.describe_app_image_config, AppImageConfigName=app_image_config_name
+    )
     return response
 
 
 async def delete_app(
     domain_id: str,
     user_profile_name: str,
-    app_type: Literal[
-        'JupyterServer',
-        'KernelGateway',
-        'RStudioServerPro',
-        'RSessionGateway',
-        'Canvas',
-        'JupyterLab',
-        'CodeEditor',
-        'TensorBoard',
-        'DetailedProfiler',
-    ],
+    app_type: AppType,
     app_name: str,
 ) -> None:
     """Delete a SageMaker App.
@@ -170,17 +193,25 @@ async def delete_app(
         app_type (str): The type of app to delete, e.g., 'JupyterServer', 'KernelGateway'.
         app_name (str): The name of the app to delete.
     """
+    _validate_app_type(app_type)
     client = get_sagemaker_client()
     logger.info(
-        f'Deleting SageMaker App: {app_name} of type {app_type} for user {user_profile_name} in domain {domain_id}'
+        'Deleting SageMaker App: {} of type {} for user {} in domain {}',
+        app_name,
+        app_type,
+        user_profile_name,
+        domain_id,
     )
-    client.delete_app(
+    await run_in_executor(
+        client.delete_app,
         DomainId=domain_id,
         UserProfileName=user_profile_name,
         AppType=app_type,
         AppName=app_name,
     )
-    logger.info(f'App {app_name} deletion initiated successfully.')
+    invalidate('describe_app', domain_id, user_profile_name, app_type, app_name)
+    clear_cache('list_apps')
+    logger.info('App {} deletion initiated successfully.', app_name)
 
 
 async def delete_app_image_config(app_image_config_name: str) -> None:
@@ -190,6 +221,7 @@ async def delete_app_image_config(app_image_config_name: str) -> None:
         app_image_config_name (str): The name of the SageMaker App Image Config to delete.
     """
     client = get_sagemaker_client()
-    logger.info(f'Deleting SageMaker App Image Config: {app_image_config_name}')
-    client.delete_app_image_config(AppImageConfigName=app_image_config_name)
-    logger.info(f'App Image Config {app_image_config_name} deleted successfully.')
+    logger.info('Deleting SageMaker App Image Config: {}', app_image_config_name)
+    await run_in_executor(client.delete_app_image_config, AppImageConfigName=app_image_config_name)
+    invalidate('describe_app_image_config', app_image_config_name)
+    logger.info('App Image Config {} deleted successfully.', app_image_config_name)
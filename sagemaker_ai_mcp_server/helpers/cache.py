@@ -0,0 +1,321 @@
+"""TTL Cache for SageMaker API responses."""
+
+import asyncio
+import functools
+import inspect
+import time
+import weakref
+from botocore.exceptions import ClientError
+from collections import OrderedDict
+from loguru import logger
+from sagemaker_ai_mcp_server.helpers.utils import (
+    get_client_override,
+    get_region,
+    is_transient_error,
+)
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple, Union
+
+
+# How long a cached response is served before SageMaker is called again. Jobs and executions
+# change state quickly, so they use the short TTL; Models, Domains, Model Cards and Pipelines
+# rarely change outside of this server, so they use the long one.
+SHORT_TTL_SECONDS = 5
+DEFAULT_TTL_SECONDS = 15
+LONG_TTL_SECONDS = 60
+
+# How long responses that can no longer change are cached: Endpoint Configurations,
+# execution definitions, and jobs or executions that reached a terminal status.
+IMMUTABLE_TTL_SECONDS = 900
+
+# Statuses after which a job or pipeline execution no longer changes. Inference Recommender
+# jobs report theirs in upper case.
+TERMINAL_STATUSES = frozenset(
+    {'Completed', 'Failed', 'Stopped', 'Succeeded', 'COMPLETED', 'FAILED', 'STOPPED'}
+)
+
+# How long a response may still be served, marked as stale, when SageMaker is throttling
+# or unreachable.
+STALE_TTL_SECONDS = 300
+
+# Errors that repeat until the resource is created or the request is fixed. SageMaker
+# reports most missing resources as ValidationException. They are cached for a few
+# seconds, so an identical call retried right away fails without another API request.
+NEGATIVE_CACHE_ERROR_CODES = frozenset(
+    {'ResourceNotFound', 'ResourceNotFoundException', 'ValidationException'}
+)
+NEGATIVE_TTL_SECONDS = 10
+
+# Upper bound on the number of cached responses, oldest entries are evicted first.
+MAX_ENTRIES = 1024
+
+
+class TTLCache:
+    """A small LRU cache whose entries expire after a fixed number of seconds.
+
+    Entries can outlive their TTL by a stale period, during which get() misses but
+    get_stale() still returns them.
+    """
+
+    def __init__(self, maxsize: int = MAX_ENTRIES):
+        """Initialize the cache.
+
+        Args:
+            maxsize (int): The maximum number of entries kept in the cache.
+        """
+        self.maxsize = maxsize
+        self._entries: 'OrderedDict[Hashable, Tuple[float, float, Any]]' = OrderedDict()
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Look up a key.
+
+        Args:
+            key (Hashable): The cache key.
+
+        Returns:
+            Tuple[bool, Any]: Whether the key was found and not expired, and its value.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, stale_until, value = entry
+        now = time.monotonic()
+        if expires_at <= now:
+            if stale_until <= now:
+                del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def get_stale(self, key: Hashable) -> Tuple[bool, Any]:
+        """Look up a key, including values past their TTL but within their stale period.
+
+        Args:
+            key (Hashable): The cache key.
+
+        Returns:
+            Tuple[bool, Any]: Whether a value was found, and the value.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[1] <= time.monotonic():
+            return False, None
+        return True, entry[2]
+
+    def set(self, key: Hashable, value: Any, ttl: float, stale_ttl: float = 0) -> None:
+        """Store a value for the given number of seconds.
+
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The value to cache.
+            ttl (float): The number of seconds the value stays valid.
+            stale_ttl (float, optional): The number of seconds the value is kept after it
+                expires, for get_stale(). Defaults to 0.
+        """
+        expires_at = time.monotonic() + ttl
+        self._entries[key] = (expires_at, expires_at + stale_ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a key from the cache, if present.
+
+        Args:
+            key (Hashable): The cache key.
+        """
+        self._entries.pop(key, None)
+
+    def keys(self) -> List[Hashable]:
+        """Return a snapshot of the cached keys."""
+        return list(self._entries)
+
+    def clear(self) -> None:
+        """Remove every entry from the cache."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of entries, including expired ones not yet evicted."""
+        return len(self._entries)
+
+
+class _CachedError:
+    """A cached error, raised again instead of being returned on a cache hit."""
+
+    def __init__(self, error: ClientError):
+        """Initialize the entry.
+
+        Args:
+            error (ClientError): The error raised by the helper.
+        """
+        self.error = error
+
+
+def _is_negative_cacheable(error: BaseException) -> bool:
+    """Tell whether an error should be cached for NEGATIVE_TTL_SECONDS."""
+    return (
+        isinstance(error, ClientError)
+        and error.response.get('Error', {}).get('Code') in NEGATIVE_CACHE_ERROR_CODES
+    )
+
+
+_CACHE = TTLCache()
+
+# Calls of cached helpers in progress, so concurrent identical calls share one request.
+# Tasks can only be awaited from their own event loop, so each loop gets its own map.
+_Calls = Dict[Hashable, 'asyncio.Future[Any]']
+_INFLIGHT: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _Calls]' = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_inflight() -> _Calls:
+    """Return the in-flight calls of the running event loop."""
+    return _INFLIGHT.setdefault(asyncio.get_running_loop(), {})
+
+
+def _is_current_call(key: Hashable) -> bool:
+    """Tell whether the running task is still the in-flight call for a key.
+
+    invalidate() and clear_cache() detach in-flight calls, whose responses may predate the
+    change that caused the invalidation, so those responses must not be cached.
+    """
+    return _get_inflight().get(key) is asyncio.current_task()
+
+
+def _forget_inflight(calls: _Calls, key: Hashable, task: 'asyncio.Future[Any]') -> None:
+    """Drop a finished call from the in-flight map, unless a newer call replaced it."""
+    if calls.get(key) is task:
+        del calls[key]
+
+
+def _make_key(operation: str, args: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """Build the cache key of an operation call in the current region."""
+    return (operation, get_region(), *args)
+
+
+def ttl_by_status(status_key: str, ttl: float = SHORT_TTL_SECONDS) -> Callable[[Any], float]:
+    """Build a TTL that keeps terminal jobs and executions for longer.
+
+    Args:
+        status_key (str): The key of the status in the describe response, e.g.
+            'TrainingJobStatus'.
+        ttl (float): The TTL of responses in any other status. Defaults to 5.
+
+    Returns:
+        Callable[[Any], float]: A function giving the TTL of a describe response.
+    """
+
+    def get_ttl(value: Any) -> float:
+        if isinstance(value, dict) and value.get(status_key) in TERMINAL_STATUSES:
+            return IMMUTABLE_TTL_SECONDS
+        return ttl
+
+    return get_ttl
+
+
+def ttl_cache(
+    ttl: Union[float, Callable[[Any], float]] = DEFAULT_TTL_SECONDS,
+    stale: float = 0,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """Cache the result of an async helper for a number of seconds.
+
+    Results are keyed by the helper name, the AWS region and the helper arguments, so
+    repeated calls for the same resource skip the SageMaker API round trip. Concurrent
+    calls with the same key share a single request. Helpers that mutate a resource must
+    call invalidate() for the cached reads they affect.
+
+    Not-found and validation errors are cached for NEGATIVE_TTL_SECONDS and raised again
+    by identical calls in that window.
+
+    With a stale period, a call that fails because SageMaker is throttling or unreachable
+    returns the last result instead, with '_stale': True added to dict results.
+
+    Args:
+        ttl (Union[float, Callable[[Any], float]]): The number of seconds a result stays
+            cached, or a function of the result giving it. Defaults to 15.
+        stale (float): The number of seconds an expired result may still be returned when
+            SageMaker is throttling or unreachable. Defaults to 0, which never does.
+
+    Returns:
+        Callable: A decorator for async helper functions.
+    """
+
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        signature = inspect.signature(func)
+
+        async def fetch(key, args, kwargs):
+            try:
+                value = await func(*args, **kwargs)
+            except Exception as e:
+                if _is_negative_cacheable(e):
+                    if _is_current_call(key):
+                        _CACHE.set(key, _CachedError(e), NEGATIVE_TTL_SECONDS)
+                    raise
+                if not stale or not is_transient_error(e):
+                    raise
+                hit, value = _CACHE.get_stale(key)
+                if not hit:
+                    raise
+                logger.warning('Serving a stale {} response: {}', func.__name__, e)
+                return {**value, '_stale': True} if isinstance(value, dict) else value
+            if _is_current_call(key):
+                _CACHE.set(key, value, ttl(value) if callable(ttl) else ttl, stale)
+            return value
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if get_client_override() is not None:
+                return await func(*args, **kwargs)
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = _make_key(func.__name__, tuple(bound.arguments.values()))
+            hit, value = _CACHE.get(key)
+            if hit:
+                if isinstance(value, _CachedError):
+                    # A new error each time, so tracebacks don't pile up on the cached one.
+                    raise ClientError(value.error.response, value.error.operation_name)
+                return value
+            calls = _get_inflight()
+            task = calls.get(key)
+            if task is None:
+                task = asyncio.ensure_future(fetch(key, args, kwargs))
+                calls[key] = task
+                task.add_done_callback(functools.partial(_forget_inflight, calls, key))
+            # Shielded so a cancelled caller doesn't cancel the call other callers await.
+            return await asyncio.shield(task)
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate(operation: str, *args: Any) -> None:
+    """Drop the cached result of a helper call.
+
+    Args:
+        operation (str): The name of the cached helper, e.g. 'describe_endpoint'.
+        *args: The arguments of the cached call, in the helper's parameter order.
+    """
+    key = _make_key(operation, args)
+    _CACHE.invalidate(key)
+    for calls in _INFLIGHT.values():
+        calls.pop(key, None)
+
+
+def clear_cache(operation: Optional[str] = None) -> None:
+    """Drop cached results.
+
+    Args:
+        operation (str, optional): Only drop the results of this helper. Defaults to None,
+                                   which drops everything.
+    """
+    if operation is None:
+        _CACHE.clear()
+        _INFLIGHT.clear()
+        return
+    for key in _CACHE.keys():
+        if key[0] == operation:
+            _CACHE.invalidate(key)
+    for calls in _INFLIGHT.values():
+        for key in list(calls):
+            if key[0] == operation:
+                del calls[key]
@@ -1,10 +1,18 @@
 """Helper Functions for SageMaker Domains."""
 
 from loguru import logger
-from sagemaker_ai_mcp_server.helpers.utils import get_sagemaker_client
+from sagemaker_ai_mcp_server.helpers.cache import (
+    LONG_TTL_SECONDS,
+    STALE_TTL_SECONDS,
+    clear_cache,
+    invalidate,
+    ttl_cache,
+)
+from sagemaker_ai_mcp_server.helpers.utils import get_sagemaker_client, paginate, run_in_executor
 from typing import Any, Dict, List
 
 
+@ttl_cache(LONG_TTL_SECONDS)
 async def list_domains() -> List[Dict[str, Any]]:
     """List all SageMaker Domains.
 
@@ -12,9 +20,8 @@ async def list_domains() -> List[Dict[str, Any]]:
         List[Dict[str, Any]]: A list of SageMaker Domains.
     """
     client = get_sagemaker_client()
-    logger.info('Listing SageMaker Domains...')
-    response = client.list_domains()
-    return response.get('Domains', [])
+    logger.debug('Listing SageMaker Domains...')
+    return await run_in_executor(paginate, client, 'list_domains', 'Domains')
 
 
 async def create_presigned_domain_url(
@@ -33,8 +40,9 @@ async def create_presigned_domain_url(
         str: The presigned URL for the SageMaker Domain.
     """
     client = get_sagemaker_client()
-    logger.info(f'Creating presigned URL for SageMaker Domain: {domain_id}')
-    response = client.create_presigned_domain_url(
+    logger.info('Creating presigned URL for SageMaker Domain: {}', domain_id)
+    response = await run_in_executor(
+        client.create_presigned_domain_url,
         DomainId=domain_id,
         UserProfileName=user_profile_name,
         ExpirationSeconds=expiration_seconds,
@@ -42,6 +50,7 @@ async def create_presigned_domain_url(
     return response.get('AuthorizedUrl', '')
 
 
+@ttl_cache(LONG_TTL_SECONDS, stale=STALE_TTL_SECONDS)
 async def describe_domain(domain_id: str) -> Dict[str, Any]:
     """Describe a specific SageMaker Domain.
 
@@ -52,8 +61,8 @@ async def describe_domain(domain_id: str) -> Dict[str, Any]:
         Dict[str, Any]: The details of the specified SageMaker Domain.
     """
     client = get_sagemaker_client()
-    logger.info(f'Describing SageMaker Domain: {domain_id}')
-    response = client.describe_domain(DomainId=domain_id)
+    logger.debug('Describing SageMaker Domain: {}', domain_id)
+    response = await run_in_executor(client.describe_domain, DomainId=domain_id)
     return response
 
 
@@ -64,6 +73,8 @@ async def delete_domain(domain_id: str) -> None:
         domain_id (str): The ID of the SageMaker Domain to delete.
     """
     client = get_sagemaker_client()
-    logger.info(f'Deleting SageMaker Domain: {domain_id}')
-    client.delete_domain(DomainId=domain_id)
-    logger.info(f'Domain {domain_id} deleted successfully.')
+    logger.info('Deleting SageMaker Domain: {}', domain_id)
+    await run_in_executor(client.delete_domain, DomainId=domain_id)
+    invalidate('describe_domain', domain_id)
+    clear_cache('list_domains')
+    logger.info('Domain {} deleted successfully.', domain_id)
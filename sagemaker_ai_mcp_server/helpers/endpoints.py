@@ -1,34 +1,89 @@
 """Helper Functions for SageMaker Endpoints."""
 
+import asyncio
 from loguru import logger
-from sagemaker_ai_mcp_server.helpers.utils import get_sagemaker_client
-from typing import Any, Dict, List
-
-
-async def list_endpoints() -> List[Dict[str, Any]]:
+from sagemaker_ai_mcp_server.helpers.cache import (
+    IMMUTABLE_TTL_SECONDS,
+    STALE_TTL_SECONDS,
+    clear_cache,
+    invalidate,
+    ttl_cache,
+)
+from sagemaker_ai_mcp_server.helpers.utils import (
+    DEFAULT_BATCH_CONCURRENCY,
+    api_filters,
+    describe_batch,
+    get_sagemaker_client,
+    paginate,
+    run_batch,
+    run_in_executor,
+)
+from typing import Any, Dict, List, Optional
+
+
+@ttl_cache()
+async def list_endpoints(
+    max_items: Optional[int] = None, name_contains: Optional[str] = None
+) -> List[Dict[str, Any]]:
     """List all SageMaker Endpoints that are available.
 
+    Args:
+        max_items (int, optional): The maximum number of Endpoints to return. Defaults to None.
+        name_contains (str, optional): Only return Endpoints whose name contains this string.
+            Defaults to None.
+
     Returns:
         List[Dict[str, Any]]: A list of SageMaker Endpoints.
     """
     client = get_sagemaker_client()
-    logger.info('Listing SageMaker Endpoints...')
-    response = client.list_endpoints()
-    return response.get('Endpoints', [])
+    logger.debug('Listing SageMaker Endpoints...')
+    filters = api_filters(NameContains=name_contains)
+    return await run_in_executor(
+        paginate, client, 'list_endpoints', 'Endpoints', max_items, **filters
+    )
 
 
-async def list_endpoint_configs() -> List[Dict[str, Any]]:
+@ttl_cache()
+async def list_endpoint_configs(
+    max_items: Optional[int] = None, name_contains: Optional[str] = None
+) -> List[Dict[str, Any]]:
     """List all SageMaker Endpoint Configurations.
 
+    Args:
+        max_items (int, optional): The maximum number of Endpoint Configurations to return.
+            Defaults to None.
+        name_contains (str, optional): Only return Endpoint Configurations whose name contains
+            this string. Defaults to None.
+
     Returns:
         List[Dict[str, Any]]: A list of SageMaker Endpoint Configurations.
     """
     client = get_sagemaker_client()
-    response = client.list_endpoint_configs()
-    logger.info('Listing SageMaker Endpoint Configurations...')
-    return response.get('EndpointConfigs', [])
+    logger.debug('Listing SageMaker Endpoint Configurations...')
+    filters = api_filters(NameContains=name_contains)
+    return await run_in_executor(
+        paginate, client, 'list_endpoint_configs', 'EndpointConfigs', max_items, **filters
+    )
+
 
+async def list_all_endpoints(max_items: Optional[int] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """List SageMaker Endpoints and Endpoint Configurations concurrently.
+
+    Args:
+        max_items (int, optional): The maximum number of items to return for each type.
+            Defaults to None, which returns all of them.
 
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: The resources keyed by 'Endpoints' and
+            'EndpointConfigs'.
+    """
+    endpoints, endpoint_configs = await asyncio.gather(
+        list_endpoints(max_items), list_endpoint_configs(max_items)
+    )
+    return {'Endpoints': endpoints, 'EndpointConfigs': endpoint_configs}
+
+
+@ttl_cache(stale=STALE_TTL_SECONDS)
 async def describe_endpoint(endpoint_name: str) -> Dict[str, Any]:
     """Describe a SageMaker Endpoint.
 
@@ -39,11 +94,28 @@ async def describe_endpoint(endpoint_name: str) -> Dict[str, Any]:
         Dict[str, Any]: The details of the SageMaker Endpoint.
     """
     client = get_sagemaker_client()
-    logger.info(f'Describing SageMaker Endpoint: {endpoint_name}')
-    response = client.describe_endpoint(EndpointName=endpoint_name)
+    logger.debug('Describing SageMaker Endpoint: {}', endpoint_name)
+    response = await run_in_executor(client.describe_endpoint, EndpointName=endpoint_name)
     return response
 
 
+async def describe_endpoints_many(
+    endpoint_names: List[str], concurrency: int = DEFAULT_BATCH_CONCURRENCY
+) -> Dict[str, Dict[str, Any]]:
+    """Describe several SageMaker Endpoints concurrently.
+
+    Args:
+        endpoint_names (List[str]): The names of the SageMaker Endpoints to describe.
+        concurrency (int, optional): The maximum number of concurrent requests. Defaults to 8.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: For each name, the details of the resource or {'Error': message}.
+    """
+    logger.debug('Describing {} SageMaker Endpoints', len(endpoint_names))
+    return await describe_batch(describe_endpoint, endpoint_names, concurrency)
+
+
+@ttl_cache(IMMUTABLE_TTL_SECONDS, stale=STALE_TTL_SECONDS)
 async def describe_endpoint_config(endpoint_config_name: str) -> Dict[str, Any]:
     """Describe a SageMaker Endpoint Configuration.
 
@@ -54,8 +126,10 @@ async def describe_endpoint_config(endpoint_config_name: str) -> Dict[str, Any]:
         Dict[str, Any]: The details of the SageMaker Endpoint Configuration.
     """
     client = get_sagemaker_client()
-    logger.info(f'Describing SageMaker Endpoint Config: {endpoint_config_name}')
-    response = client.describe_endpoint_config(EndpointConfigName=endpoint_config_name)
+    logger.debug('Describing SageMaker Endpoint Config: {}', endpoint_config_name)
+    response = await run_in_executor(
+        client.describe_endpoint_config, EndpointConfigName=endpoint_config_name
+    )
     return response
 
 
@@ -66,9 +140,11 @@ async def delete_endpoint(endpoint_name: str) -> None:
         endpoint_name (str): The name of the SageMaker Endpoint to delete.
     """
     client = get_sagemaker_client()
-    logger.info(f'Deleting SageMaker Endpoint: {endpoint_name}')
-    client.delete_endpoint(EndpointName=endpoint_name)
-    logger.info(f'Endpoint {endpoint_name} deleted successfully.')
+    logger.info('Deleting SageMaker Endpoint: {}', endpoint_name)
+    await run_in_executor(client.delete_endpoint, EndpointName=endpoint_name)
+    invalidate('describe_endpoint', endpoint_name)
+    clear_cache('list_endpoints')
+    logger.info('Endpoint {} deleted successfully.', endpoint_name)
 
 
 async def delete_endpoint_config(endpoint_config_name: str) -> None:
@@ -78,6 +154,48 @@ async def delete_endpoint_config(endpoint_config_name: str) -> None:
         endpoint_config_name (str): The name of the SageMaker Endpoint Configuration to delete.
     """
     client = get_sagemaker_client()
-    logger.info(f'Deleting SageMaker Endpoint Config: {endpoint_config_name}')
-    client.delete_endpoint_config(EndpointConfigName=endpoint_config_name)
-    logger.info(f'Endpoint Config {endpoint_config_name} deleted successfully.')
+    logger.info('Deleting SageMaker Endpoint Config: {}', endpoint_config_name)
+    await run_in_executor(client.delete_endpoint_config, EndpointConfigName=endpoint_config_name)
+    invalidate('describe_endpoint_config', endpoint_config_name)
+    clear_cache('list_endpoint_configs')
+    logger.info('Endpoint Config {} deleted successfully.', endpoint_config_name)
+
+
+async def delete_endpoints(
+    endpoint_names: List[str],
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    wait: bool = True,
+) -> Dict[str, Optional[str]]:
+    """Delete several SageMaker Endpoints concurrently.
+
+    Args:
+        endpoint_names (List[str]): The names of the SageMaker Endpoints to delete.
+        concurrency (int, optional): The maximum number of concurrent requests. Defaults to 8.
+        wait (bool, optional): Whether to wait for the requests to finish. Defaults to True.
+            With False, they run in the background and every name maps to None.
+
+    Returns:
+        Dict[str, Optional[str]]: For each name, None if the request succeeded or the error message.
+    """
+    logger.info('Deleting {} SageMaker Endpoints', len(endpoint_names))
+    return await run_batch(delete_endpoint, endpoint_names, concurrency, wait)
+
+
+async def delete_endpoint_configs(
+    endpoint_config_names: List[str],
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    wait: bool = True,
+) -> Dict[str, Optional[str]]:
+    """Delete several SageMaker Endpoint Configurations concurrently.
+
+    Args:
+        endpoint_config_names (List[str]): The names of the SageMaker Endpoint Configurations to delete.
+        concurrency (int, optional): The maximum number of concurrent requests. Defaults to 8.
+        wait (bool, optional): Whether to wait for the requests to finish. Defaults to True.
+            With False, they run in the background and every name maps to None.
+
+    Returns:
+        Dict[str, Optional[str]]: For each name, None if the request succeeded or the error message.
+    """
+    logger.info('Deleting {} SageMaker Endpoint Configurations', len(endpoint_config_names))
+    return await run_batch(delete_endpoint_config, endpoint_config_names, concurrency, wait)
@@ -1,56 +1,258 @@
 """Helper Functions for SageMaker Jobs(Training, Processing, Transform, Inference Recommender)."""
 
+import asyncio
+from datetime import datetime, timedelta, timezone
 from loguru import logger
-from sagemaker_ai_mcp_server.helpers.utils import get_sagemaker_client
-from typing import Any, Dict, List
+from sagemaker_ai_mcp_server.helpers.cache import (
+    SHORT_TTL_SECONDS,
+    STALE_TTL_SECONDS,
+    clear_cache,
+    invalidate,
+    ttl_by_status,
+    ttl_cache,
+)
+from sagemaker_ai_mcp_server.helpers.utils import (
+    DEFAULT_BATCH_CONCURRENCY,
+    api_filters,
+    describe_batch,
+    get_sagemaker_client,
+    is_transient_error,
+    iterate,
+    paginate,
+    run_batch,
+    run_hedged,
+    run_in_executor,
+)
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+
+@ttl_cache(SHORT_TTL_SECONDS)
+async def list_training_jobs(
+    max_items: Optional[int] = None,
+    status_equals: Optional[str] = None,
+    name_contains: Optional[str] = None,
+    creation_time_after: Optional[datetime] = None,
+    sort_by: Optional[str] = None,
+    sort_order: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """List all SageMaker Training Jobs, filtered server-side when filters are given.
 
-
-async def list_training_jobs() -> List[Dict[str, Any]]:
-    """List all SageMaker Training Jobs.
+    Args:
+        max_items (int, optional): The maximum number of Training Jobs to return. Defaults to None.
+        status_equals (str, optional): Only return Training Jobs with this status, e.g. 'InProgress'.
+            Defaults to None.
+        name_contains (str, optional): Only return Training Jobs whose name contains this string.
+            Defaults to None.
+        creation_time_after (datetime, optional): Only return Training Jobs created after this time.
+            Defaults to None.
+        sort_by (str, optional): 'Name', 'CreationTime' or 'Status'. Defaults to None, which
+            sorts by creation time.
+        sort_order (str, optional): 'Ascending' or 'Descending'. Defaults to None, which sorts
+            in descending order.
 
     Returns:
         List[Dict[str, Any]]: A list of SageMaker Training Jobs.
     """
+    filters = api_filters(
+        StatusEquals=status_equals,
+        NameContains=name_contains,
+        CreationTimeAfter=creation_time_after,
+        SortBy=sort_by,
+        SortOrder=sort_order,
+    )
+    return [job async for job in iter_training_jobs(max_items, **filters)]
+
+
+async def iter_training_jobs(
+    max_items: Optional[int] = None, **filters: Any
+) -> AsyncIterator[Dict[str, Any]]:
+    """Iterate over SageMaker Training Jobs, fetching one page at a time.
+
+    Args:
+        max_items (int, optional): The maximum number of Training Jobs to yield. Defaults to None.
+        **filters: Filters passed to the ListTrainingJobs API, e.g. StatusEquals='InProgress'.
+
+    Yields:
+        Dict[str, Any]: The summary of each SageMaker Training Job.
+    """
     client = get_sagemaker_client()
-    logger.info('Listing SageMaker Training Jobs...')
-    response = client.list_training_jobs()
-    return response.get('TrainingJobSummaries', [])
+    logger.debug('Listing SageMaker Training Jobs...')
+    async for job in iterate(
+        client, 'list_training_jobs', 'TrainingJobSummaries', max_items, **filters
+    ):
+        yield job
+
+
+# Upper bound on the parallel time windows of list_training_jobs_fast, to stay clear of throttling.
+MAX_LISTING_WINDOWS = 16
+
+
+async def list_training_jobs_fast(days: int = 30, buckets: int = 8) -> List[Dict[str, Any]]:
+    """List the SageMaker Training Jobs created in the last days, scanning time windows in parallel.
 
+    ListTrainingJobs can't be paginated in parallel, but it can be filtered by creation
+    time. The period is split into `buckets` windows that are paginated concurrently,
+    then merged. Windows that fail with a transient error, such as throttling, are
+    scanned again one by one.
 
-async def list_processing_jobs() -> List[Dict[str, Any]]:
-    """List all SageMaker Processing Jobs.
+    Args:
+        days (int, optional): How many days back to list Training Jobs for. Defaults to 30.
+        buckets (int, optional): The number of windows to scan in parallel, capped at 16.
+            Defaults to 8.
 
     Returns:
-        List[Dict[str, Any]]: A list of SageMaker Processing Jobs.
+        List[Dict[str, Any]]: The Training Jobs, most recently created first.
     """
+    if days < 1:
+        raise ValueError(f'days must be a positive integer, got {days}.')
+    buckets = max(1, min(buckets, MAX_LISTING_WINDOWS))
     client = get_sagemaker_client()
-    logger.info('Listing SageMaker Processing Jobs...')
-    response = client.list_processing_jobs()
-    return response.get('ProcessingJobSummaries', [])
-
+    logger.debug(
+        'Listing SageMaker Training Jobs of the last {} days in {} windows', days, buckets
+    )
+
+    end = datetime.now(timezone.utc)
+    step = timedelta(days=days) / buckets
+    # CreationTimeAfter/Before are exclusive, so windows overlap by a second and are deduplicated.
+    windows = [
+        (end - (buckets - index) * step - timedelta(seconds=1), end - (buckets - index - 1) * step)
+        for index in range(buckets)
+    ]
+
+    async def scan(window):
+        after, before = window
+        return await run_in_executor(
+            paginate,
+            client,
+            'list_training_jobs',
+            'TrainingJobSummaries',
+            CreationTimeAfter=after,
+            CreationTimeBefore=before + timedelta(seconds=1),
+        )
+
+    results = await asyncio.gather(*(scan(window) for window in windows), return_exceptions=True)
+    jobs: Dict[str, Dict[str, Any]] = {}
+    for window, result in zip(windows, results):
+        if isinstance(result, Exception) and is_transient_error(result):
+            logger.warning(
+                f'Transient error while listing Training Jobs, retrying window: {result}'
+            )
+            result = await scan(window)
+        elif isinstance(result, BaseException):
+            raise result
+        for job in result:
+            jobs[job.get('TrainingJobArn') or job['TrainingJobName']] = job
+    return sorted(jobs.values(), key=lambda job: job['CreationTime'], reverse=True)
+
+
+@ttl_cache(SHORT_TTL_SECONDS)
+async def list_processing_jobs(
+    max_items: Optional[int] = None,
+    status_equals: Optional[str] = None,
+    name_contains: Optional[str] = None,
+    creation_time_after: Optional[datetime] = None,
+    sort_by: Optional[str] = None,
+    sort_order: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """List all SageMaker Processing Jobs, filtered server-side when filters are given.
 
-async def list_transform_jobs() -> List[Dict[str, Any]]:
-    """List all SageMaker Transform Jobs.
+    Args:
+        max_items (int, optional): The maximum number of Processing Jobs to return. Defaults to None.
+        status_equals (str, optional): Only return Processing Jobs with this status, e.g. 'InProgress'.
+            Defaults to None.
+        name_contains (str, optional): Only return Processing Jobs whose name contains this string.
+            Defaults to None.
+        creation_time_after (datetime, optional): Only return Processing Jobs created after this time.
+            Defaults to None.
+        sort_by (str, optional): 'Name', 'CreationTime' or 'Status'. Defaults to None, which
+            sorts by creation time.
+        sort_order (str, optional): 'Ascending' or 'Descending'. Defaults to None, which sorts
+            in descending order.
 
     Returns:
-        List[Dict[str, Any]]: A list of SageMaker Transform Jobs.
+        List[Dict[str, Any]]: A list of SageMaker Processing Jobs.
     """
     client = get_sagemaker_client()
-    logger.info('Listing SageMaker Transform Jobs...')
-    response = client.list_transform_jobs()
-    return response.get('TransformJobSummaries', [])
+    logger.debug('Listing SageMaker Processing Jobs...')
+    filters = api_filters(
+        StatusEquals=status_equals,
+        NameContains=name_contains,
+        CreationTimeAfter=creation_time_after,
+        SortBy=sort_by,
+        SortOrder=sort_order,
+    )
+    return await run_in_executor(
+        paginate, client, 'list_processing_jobs', 'ProcessingJobSummaries', max_items, **filters
+    )
+
+
+@ttl_cache(SHORT_TTL_SECONDS)
+async def list_transform_jobs(
+    max_items: Optional[int] = None,
+    status_equals: Optional[str] = None,
+    name_contains: Optional[str] = None,
+    creation_time_after: Optional[datetime] = None,
+    sort_by: Optional[str] = None,
+    sort_order: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """List all SageMaker Transform Jobs, filtered server-side when filters are given.
 
+    Args:
+        max_items (int, optional): The maximum number of Transform Jobs to return. Defaults to None.
+        status_equals (str, optional): Only return Transform Jobs with this status, e.g. 'InProgress'.
+            Defaults to None.
+        name_contains (str, optional): Only return Transform Jobs whose name contains this string.
+            Defaults to None.
+        creation_time_after (datetime, optional): Only return Transform Jobs created after this time.
+            Defaults to None.
+        sort_by (str, optional): 'Name', 'CreationTime' or 'Status'. Defaults to None, which
+            sorts by creation time.
+        sort_order (str, optional): 'Ascending' or 'Descending'. Defaults to None, which sorts
+            in descending order.
 
-async def list_inference_recommendations_jobs() -> List[Dict[str, Any]]:
+    Returns:
+        List[Dict[str, Any]]: A list of SageMaker Transform Jobs.
+    """
+    client = get_sagemaker_client()
+    logger.debug('Listing SageMaker Transform Jobs...')
+    filters = api_filters(
+        StatusEquals=status_equals,
+        NameContains=name_contains,
+        CreationTimeAfter=creation_time_after,
+        SortBy=sort_by,
+        SortOrder=sort_order,
+    )
+    return await run_in_executor(
+        paginate, client, 'list_transform_jobs', 'TransformJobSummaries', max_items, **filters
+    )
+
+
+@ttl_cache(SHORT_TTL_SECONDS)
+async def list_inference_recommendations_jobs(
+    max_items: Optional[int] = None, name_contains: Optional[str] = None
+) -> List[Dict[str, Any]]:
     """List all SageMaker Inference Recommender Jobs.
 
+    Args:
+        max_items (int, optional): The maximum number of Inference Recommender Jobs to return.
+            Defaults to None, which returns all of them.
+        name_contains (str, optional): Only return Inference Recommender Jobs whose name
+            contains this string. Defaults to None.
+
     Returns:
         List[Dict[str, Any]]: A list of SageMaker Inference Recommender Jobs.
     """
     client = get_sagemaker_client()
-    logger.info('Listing SageMaker Inference Recommender Jobs...')
-    response = client.list_inference_recommendations_jobs()
-    return response.get('InferenceRecommendationsJobs', [])
+    logger.debug('Listing SageMaker Inference Recommender Jobs...')
+    filters = api_filters(NameContains=name_contains)
+    return await run_in_executor(
+        paginate,
+        client,
+        'list_inference_recommendations_jobs',
+        'InferenceRecommendationsJobs',
+        max_items,
+        **filters,
+    )
 
 
 async def list_inference_recommendations_job_steps(job_name: str) -> List[Dict[str, Any]]:
@@ -64,19 +266,66 @@ async def list_inference_recommendations_job_steps(job_name: str) -> List[Dict[s
         Recommender Job.
     """
     client = get_sagemaker_client()
-    logger.info(f'Listing steps for Inference Recommender Job: {job_name}')
-    response = client.list_inference_recommendations_job_steps(JobName=job_name)
-    return response.get('Steps', [])
+    logger.debug('Listing steps for Inference Recommender Job: {}', job_name)
+    return await run_in_executor(
+        paginate, client, 'list_inference_recommendations_job_steps', 'Steps', JobName=job_name
+    )
+
+
+async def list_all_jobs(max_items: Optional[int] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """List SageMaker Training, Processing, Transform and Inference Recommender Jobs at once.
 
+    The four list operations run concurrently, so the inventory takes as long as the
+    slowest of them rather than their sum.
 
+    Args:
+        max_items (int, optional): The maximum number of jobs to return for each type.
+            Defaults to None, which returns all of them.
+
+    Returns:
+        Dict[str, List[Dict[str, Any]]]: The jobs of each type, keyed by 'TrainingJobs',
+            'ProcessingJobs', 'TransformJobs' and 'InferenceRecommendationsJobs'.
+    """
+    training, processing, transform, recommendations = await asyncio.gather(
+        list_training_jobs(max_items),
+        list_processing_jobs(max_items),
+        list_transform_jobs(max_items),
+        list_inference_recommendations_jobs(max_items),
+    )
+    return {
+        'TrainingJobs': training,
+        'ProcessingJobs': processing,
+        'TransformJobs': transform,
+        'InferenceRecommendationsJobs': recommendations,
+    }
+
+
+@ttl_cache(ttl_by_status('TrainingJobStatus'), stale=STALE_TTL_SECONDS)
 async def describe_training_job(training_job_name: str) -> Dict[str, Any]:
     """Describe a SageMaker Training Job."""
     client = get_sagemaker_client()
-    logger.info(f'Describing SageMaker Training Job: {training_job_name}')
-    response = client.describe_training_job(TrainingJobName=training_job_name)
+    logger.debug('Describing SageMaker Training Job: {}', training_job_name)
+    response = await run_hedged(client.describe_training_job, TrainingJobName=training_job_name)
     return response
 
 
+async def describe_training_jobs_many(
+    training_job_names: List[str], concurrency: int = DEFAULT_BATCH_CONCURRENCY
+) -> Dict[str, Dict[str, Any]]:
+    """Describe several SageMaker Training Jobs concurrently.
+
+    Args:
+        training_job_names (List[str]): The names of the SageMaker Training Jobs to describe.
+        concurrency (int, optional): The maximum number of concurrent requests. Defaults to 8.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: For each name, the details of the resource or {'Error': message}.
+    """
+    logger.debug('Describing {} SageMaker Training Jobs', len(training_job_names))
+    return await describe_batch(describe_training_job, training_job_names, concurrency)
+
+
+@ttl_cache(ttl_by_status('ProcessingJobStatus'), stale=STALE_TTL_SECONDS)
 async def describe_processing_job(processing_job_name: str) -> Dict[str, Any]:
     """Describe a SageMaker Processing Job.
 
@@ -87,11 +336,30 @@ async def describe_processing_job(processing_job_name: str) -> Dict[str, Any]:
         Dict[str, Any]: The details of the SageMaker Processing Job.
     """
     client = get_sagemaker_client()
-    logger.info(f'Describing SageMaker Processing Job: {processing_job_name}')
-    response = client.describe_processing_job(ProcessingJobName=processing_job_name)
+    logger.debug('Describing SageMaker Processing Job: {}', processing_job_name)
+    response = await run_hedged(
+        client.describe_processing_job, ProcessingJobName=processing_job_name
+    )
     return response
 
 
+async def describe_processing_jobs_many(
+    processing_job_names: List[str], concurrency: int = DEFAULT_BATCH_CONCURRENCY
+) -> Dict[str, Dict[str, Any]]:
+    """Describe several SageMaker Processing Jobs concurrently.
+
+    Args:
+        processing_job_names (List[str]): The names of the SageMaker Processing Jobs to describe.
+        concurrency (int, optional): The maximum number of concurrent requests. Defaults to 8.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: For each name, the details of the resource or {'Error': message}.
+    """
+    logger.debug('Describing {} SageMaker Processing Jobs', len(processing_job_names))
+    return await describe_batch(describe_processing_job, processing_job_names, concurrency)
+
+
+@ttl_cache(ttl_by_status('TransformJobStatus'), stale=STALE_TTL_SECONDS)
 async def describe_transform_job(transform_job_name: str) -> Dict[str, Any]:
     """Describe a SageMaker Transform Job.
 
@@ -102,11 +370,83 @@ async def describe_transform_job(transform_job_name: str) -> Dict[str, Any]:
         Dict[str, Any]: The details of the SageMaker Transform Job.
     """
     client = get_sagemaker_client()
-    logger.info(f'Describing SageMaker Transform Job: {transform_job_name}')
-    response = client.describe_transform_job(TransformJobName=transform_job_name)
+    logger.debug('Describing SageMaker Transform Job: {}', transform_job_name)
+    response = await run_hedged(client.describe_transform_job, TransformJobName=transform_job_name)
     return response
 
 
+async def describe_transform_jobs_many(
+    transform_job_names: List[str], concurrency: int = DEFAULT_BATCH_CONCURRENCY
+) -> Dict[str, Dict[str, Any]]:
+    """Describe several SageMaker Transform Jobs concurrently.
+
+    Args:
+        transform_job_names (List[str]): The names of the SageMaker Transform Jobs to describe.
+        concurrency (int, optional): The maximum number of concurrent requests. Defaults to 8.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: For each name, the details of the resource or {'Error': message}.
+    """
+    logger.debug('Describing {} SageMaker Transform Jobs', len(transform_job_names))
+    return await describe_batch(describe_transform_job, transform_job_names, concurrency)
+
+
+async def list_training_jobs_with_details(
+    max_items: Optional[int] = None, concurrency: int = DEFAULT_BATCH_CONCURRENCY
+) -> Dict[str, Dict[str, Any]]:
+    """List SageMaker Training Jobs and describe them concurrently.
+
+    Args:
+        max_items (int, optional): The maximum number of Training Jobs to describe, most
+            recent first. Defaults to None, which describes all of them.
+        concurrency (int, optional): The maximum number of concurrent requests. Defaults to 8.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: For each Training Job name, its details or {'Error': message}.
+    """
+    jobs = await list_training_jobs(max_items)
+    return await describe_training_jobs_many([job['TrainingJobName'] for job in jobs], concurrency)
+
+
+async def list_processing_jobs_with_details(
+    max_items: Optional[int] = None, concurrency: int = DEFAULT_BATCH_CONCURRENCY
+) -> Dict[str, Dict[str, Any]]:
+    """List SageMaker Processing Jobs and describe them concurrently.
+
+    Args:
+        max_items (int, optional): The maximum number of Processing Jobs to describe, most
+            recent first. Defaults to None, which describes all of them.
+        concurrency (int, optional): The maximum number of concurrent requests. Defaults to 8.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: For each Processing Job name, its details or {'Error': message}.
+    """
+    jobs = await list_processing_jobs(max_items)
+    return await describe_processing_jobs_many(
+        [job['ProcessingJobName'] for job in jobs], concurrency
+    )
+
+
+async def list_transform_jobs_with_details(
+    max_items: Optional[int] = None, concurrency: int = DEFAULT_BATCH_CONCURRENCY
+) -> Dict[str, Dict[str, Any]]:
+    """List SageMaker Transform Jobs and describe them concurrently.
+
+    Args:
+        max_items (int, optional): The maximum number of Transform Jobs to describe, most
+            recent first. Defaults to None, which describes all of them.
+        concurrency (int, optional): The maximum number of concurrent requests. Defaults to 8.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: For each Transform Job name, its details or {'Error': message}.
+    """
+    jobs = await list_transform_jobs(max_items)
+    return await describe_transform_jobs_many(
+        [job['TransformJobName'] for job in jobs], concurrency
+    )
+
+
+@ttl_cache(ttl_by_status('Status'), stale=STALE_TTL_SECONDS)
 async def describe_inference_recommendations_job(job_name: str) -> Dict[str, Any]:
     """Describe a SageMaker Inference Recommender Job.
 
@@ -118,8 +458,8 @@ async def describe_inference_recommendations_job(job_name: str) -> Dict[str, Any
         Dict[str, Any]: The details of the specified Inference Recommender Job.
     """
     client = get_sagemaker_client()
-    logger.info(f'Describing SageMaker Inference Recommender Job: {job_name}')
-    response = client.describe_inference_recommendations_job(JobName=job_name)
+    logger.debug('Describing SageMaker Inference Recommender Job: {}', job_name)
+    response = await run_hedged(client.describe_inference_recommendations_job, JobName=job_name)
     return response
 
 
@@ -130,9 +470,11 @@ async def stop_training_job(training_job_name: str) -> None:
         training_job_name (str): The name of the SageMaker Training Job to stop.
     """
     client = get_sagemaker_client()
-    logger.info(f'Stopping SageMaker Training Job: {training_job_name}')
-    client.stop_training_job(TrainingJobName=training_job_name)
-    logger.info(f'Training Job {training_job_name} stopped successfully.')
+    logger.info('Stopping SageMaker Training Job: {}', training_job_name)
+    await run_in_executor(client.stop_training_job, TrainingJobName=training_job_name)
+    invalidate('describe_training_job', training_job_name)
+    clear_cache('list_training_jobs')
+    logger.info('Training Job {} stopped successfully.', training_job_name)
 
 
 async def stop_processing_job(processing_job_name: str) -> None:
@@ -142,9 +484,11 @@ async def stop_processing_job(processing_job_name: str) -> None:
         processing_job_name (str): The name of the SageMaker Processing Job to stop.
     """
     client = get_sagemaker_client()
-    logger.info(f'Stopping SageMaker Processing Job: {processing_job_name}')
-    client.stop_processing_job(ProcessingJobName=processing_job_name)
-    logger.info(f'Processing Job {processing_job_name} stopped successfully.')
+    logger.info('Stopping SageMaker Processing Job: {}', processing_job_name)
+    await run_in_executor(client.stop_processing_job, ProcessingJobName=processing_job_name)
+    invalidate('describe_processing_job', processing_job_name)
+    clear_cache('list_processing_jobs')
+    logger.info('Processing Job {} stopped successfully.', processing_job_name)
 
 
 async def stop_transform_job(transform_job_name: str) -> None:
@@ -154,8 +498,10 @@ async def stop_transform_job(transform_job_name: str) -> None:
         transform_job_name (str): The name of the SageMaker Transform Job to stop.
     """
     client = get_sagemaker_client()
-    logger.info(f'Stopping SageMaker Transform Job: {transform_job_name}')
-    client.stop_transform_job(TransformJobName=transform_job_name)
+    logger.info('Stopping SageMaker Transform Job: {}', transform_job_name)
+    await run_in_executor(client.stop_transform_job, TransformJobName=transform_job_name)
+    invalidate('describe_transform_job', transform_job_name)
+    clear_cache('list_transform_jobs')
 
 
 async def stop_inference_recommendations_job(job_name: str) -> None:
@@ -166,6 +512,68 @@ async def stop_inference_recommendations_job(job_name: str) -> None:
             to stop.
     """
     client = get_sagemaker_client()
-    logger.info(f'Stopping SageMaker Inference Recommender Job: {job_name}')
-    client.stop_inference_recommendations_job(JobName=job_name)
-    logger.info(f'Inference Recommender Job {job_name} stopped successfully.')
+    logger.info('Stopping SageMaker Inference Recommender Job: {}', job_name)
+    await run_in_executor(client.stop_inference_recommendations_job, JobName=job_name)
+    invalidate('describe_inference_recommendations_job', job_name)
+    clear_cache('list_inference_recommendations_jobs')
+    logger.info('Inference Recommender Job {} stopped successfully.', job_name)
+
+
+async def stop_training_jobs(
+    training_job_names: List[str],
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    wait: bool = True,
+) -> Dict[str, Optional[str]]:
+    """Stop several SageMaker Training Jobs concurrently.
+
+    Args:
+        training_job_names (List[str]): The names of the SageMaker Training Jobs to stop.
+        concurrency (int, optional): The maximum number of concurrent requests. Defaults to 8.
+        wait (bool, optional): Whether to wait for the requests to finish. Defaults to True.
+            With False, they run in the background and every name maps to None.
+
+    Returns:
+        Dict[str, Optional[str]]: For each name, None if the request succeeded or the error message.
+    """
+    logger.info('Stopping {} SageMaker Training Jobs', len(training_job_names))
+    return await run_batch(stop_training_job, training_job_names, concurrency, wait)
+
+
+async def stop_processing_jobs(
+    processing_job_names: List[str],
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    wait: bool = True,
+) -> Dict[str, Optional[str]]:
+    """Stop several SageMaker Processing Jobs concurrently.
+
+    Args:
+        processing_job_names (List[str]): The names of the SageMaker Processing Jobs to stop.
+        concurrency (int, optional): The maximum number of concurrent requests. Defaults to 8.
+        wait (bool, optional): Whether to wait for the requests to finish. Defaults to True.
+            With False, they run in the background and every name maps to None.
+
+    Returns:
+        Dict[str, Optional[str]]: For each name, None if the request succeeded or the error message.
+    """
+    logger.info('Stopping {} SageMaker Processing Jobs', len(processing_job_names))
+    return await run_batch(stop_processing_job, processing_job_names, concurrency, wait)
+
+
+async def stop_transform_jobs(
+    transform_job_names: List[str],
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    wait: bool = True,
+) -> Dict[str, Optional[str]]:
+    """Stop several SageMaker Transform Jobs concurrently.
+
+    Args:
+        transform_job_names (List[str]): The names of the SageMaker Transform Jobs to stop.
+        concurrency (int, optional): The maximum number of concurrent requests. Defaults to 8.
+        wait (bool, optional): Whether to wait for the requests to finish. Defaults to True.
+            With False, they run in the background and every name maps to None.
+
+    Returns:
+        Dict[str, Optional[str]]: For each name, None if the request succeeded or the error message.
+    """
+    logger.info('Stopping {} SageMaker Transform Jobs', len(transform_job_names))
+    return await run_batch(stop_transform_job, transform_job_names, concurrency, wait)
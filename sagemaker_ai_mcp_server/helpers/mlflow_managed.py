@@ -1,13 +1,23 @@
 """Helper Functions for SageMaker Managed MLflow."""
 
 from loguru import logger
+from sagemaker_ai_mcp_server.helpers.cache import (
+    SHORT_TTL_SECONDS,
+    STALE_TTL_SECONDS,
+    clear_cache,
+    invalidate,
+    ttl_cache,
+)
 from sagemaker_ai_mcp_server.helpers.utils import (
     get_sagemaker_client,
     get_sagemaker_execution_role_arn,
+    paginate,
+    run_in_executor,
 )
 from typing import Any, Dict, List, Literal
 
 
+@ttl_cache()
 async def list_mlflow_tracking_servers() -> List[Dict[str, Any]]:
     """List all MLflow Tracking Servers in SageMaker.
 
@@ -15,9 +25,10 @@ async def list_mlflow_tracking_servers() -> List[Dict[str, Any]]:
         List[Dict[str, Any]]: A list of MLflow Tracking Servers.
     """
     client = get_sagemaker_client()
-    logger.info('Listing MLflow Tracking Servers...')
-    response = client.list_mlflow_tracking_servers()
-    return response.get('TrackingServerSummaries', [])
+    logger.debug('Listing MLflow Tracking Servers...')
+    return await run_in_executor(
+        paginate, client, 'list_mlflow_tracking_servers', 'TrackingServerSummaries'
+    )
 
 
 async def create_mlflow_tracking_server(
@@ -37,14 +48,17 @@ async def create_mlflow_tracking_server(
     """
     client = get_sagemaker_client()
     role_arn = get_sagemaker_execution_role_arn()
-    logger.info(f'Creating MLflow Tracking Server: {tracking_server_name}')
-    response = client.create_mlflow_tracking_server(
+    logger.info('Creating MLflow Tracking Server: {}', tracking_server_name)
+    response = await run_in_executor(
+        client.create_mlflow_tracking_server,
         TrackingServerName=tracking_server_name,
         ArtifactStoreUri=artifact_store_uri,
         TrackingServerSize=tracking_server_size,
         RoleArn=role_arn,
     )
-    logger.info(f'MLflow Tracking Server {tracking_server_name} created successfully.')
+    invalidate('describe_mlflow_tracking_server', tracking_server_name)
+    clear_cache('list_mlflow_tracking_servers')
+    logger.info('MLflow Tracking Server {} created successfully.', tracking_server_name)
     return response.get('TrackingServerArn', '')
 
 
@@ -62,14 +76,16 @@ async def create_presigned_mlflow_tracking_server_url(
         str: The presigned URL for the MLflow Tracking Server.
     """
     client = get_sagemaker_client()
-    logger.info(f'Creating presigned URL for MLflow Tracking Server: {tracking_server_name}')
-    response = client.create_presigned_mlflow_tracking_server_url(
+    logger.info('Creating presigned URL for MLflow Tracking Server: {}', tracking_server_name)
+    response = await run_in_executor(
+        client.create_presigned_mlflow_tracking_server_url,
         TrackingServerName=tracking_server_name,
         ExpirationSeconds=expiration_seconds,
     )
     return response.get('PresignedUrl', '')
 
 
+@ttl_cache(SHORT_TTL_SECONDS, stale=STALE_TTL_SECONDS)
 async def describe_mlflow_tracking_server(
     tracking_server_name: str,
 ) -> Dict[str, Any]:
@@ -82,8 +98,10 @@ async def describe_mlflow_tracking_server(
         Dict[str, Any]: The details of the specified MLflow Tracking Server.
     """
     client = get_sagemaker_client()
-    logger.info(f'Describing MLflow Tracking Server: {tracking_server_name}')
-    response = client.describe_mlflow_tracking_server(TrackingServerName=tracking_server_name)
+    logger.debug('Describing MLflow Tracking Server: {}', tracking_server_name)
+    response = await run_in_executor(
+        client.describe_mlflow_tracking_server, TrackingServerName=tracking_server_name
+    )
     return response
 
 
@@ -99,8 +117,12 @@ async def start_mlflow_tracking_server(
         Dict[str, Any]: The details of the started MLflow Tracking Server.
     """
     client = get_sagemaker_client()
-    logger.info(f'Starting MLflow Tracking Server: {tracking_server_name}')
-    response = client.start_mlflow_tracking_server(TrackingServerName=tracking_server_name)
+    logger.info('Starting MLflow Tracking Server: {}', tracking_server_name)
+    response = await run_in_executor(
+        client.start_mlflow_tracking_server, TrackingServerName=tracking_server_name
+    )
+    invalidate('describe_mlflow_tracking_server', tracking_server_name)
+    clear_cache('list_mlflow_tracking_servers')
     return response
 
 
@@ -116,8 +138,12 @@ async def stop_mlflow_tracking_server(
         Dict[str, Any]: The details of the stopped MLflow Tracking Server.
     """
     client = get_sagemaker_client()
-    logger.info(f'Stopping MLflow Tracking Server: {tracking_server_name}')
-    response = client.stop_mlflow_tracking_server(TrackingServerName=tracking_server_name)
+    logger.info('Stopping MLflow Tracking Server: {}', tracking_server_name)
+    response = await run_in_executor(
+        client.stop_mlflow_tracking_server, TrackingServerName=tracking_server_name
+    )
+    invalidate('describe_mlflow_tracking_server', tracking_server_name)
+    clear_cache('list_mlflow_tracking_servers')
     return response
 
 
@@ -128,6 +154,10 @@ async def delete_mlflow_tracking_server(tracking_server_name: str) -> None:
         tracking_server_name (str): The name of the MLflow Tracking Server to delete.
     """
     client = get_sagemaker_client()
-    logger.info(f'Deleting MLflow Tracking Server: {tracking_server_name}')
-    client.delete_mlflow_tracking_server(TrackingServerName=tracking_server_name)
-    logger.info(f'MLflow Tracking Server {tracking_server_name} deleted successfully.')
+    logger.info('Deleting MLflow Tracking Server: {}', tracking_server_name)
+    await run_in_executor(
+        client.delete_mlflow_tracking_server, TrackingServerName=tracking_server_name
+    )
+    invalidate('describe_mlflow_tracking_server', tracking_server_name)
+    clear_cache('list_mlflow_tracking_servers')
+    logger.info('MLflow Tracking Server {} deleted successfully.', tracking_server_name)
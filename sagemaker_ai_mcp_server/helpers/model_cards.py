@@ -1,20 +1,43 @@
 """Helper Functions for SageMaker Model Cards."""
 
 from loguru import logger
-from sagemaker_ai_mcp_server.helpers.utils import get_sagemaker_client
-from typing import Any, Dict, List
-
-
-async def list_model_cards() -> List[Dict[str, Any]]:
+from sagemaker_ai_mcp_server.helpers.cache import (
+    LONG_TTL_SECONDS,
+    STALE_TTL_SECONDS,
+    clear_cache,
+    invalidate,
+    ttl_cache,
+)
+from sagemaker_ai_mcp_server.helpers.utils import (
+    api_filters,
+    get_sagemaker_client,
+    paginate,
+    run_in_executor,
+)
+from typing import Any, Dict, List, Optional
+
+
+@ttl_cache(LONG_TTL_SECONDS)
+async def list_model_cards(
+    max_items: Optional[int] = None, name_contains: Optional[str] = None
+) -> List[Dict[str, Any]]:
     """List all SageMaker Model Cards.
 
+    Args:
+        max_items (int, optional): The maximum number of Model Cards to return. Defaults to
+            None, which returns all of them.
+        name_contains (str, optional): Only return Model Cards whose name contains this
+            string. Defaults to None.
+
     Returns:
         List[Dict[str, Any]]: A list of SageMaker Model Cards.
     """
     client = get_sagemaker_client()
-    logger.info('Listing SageMaker Model Cards...')
-    response = client.list_model_cards()
-    return response.get('ModelCardSummaries', [])
+    logger.debug('Listing SageMaker Model Cards...')
+    filters = api_filters(NameContains=name_contains)
+    return await run_in_executor(
+        paginate, client, 'list_model_cards', 'ModelCardSummaries', max_items, **filters
+    )
 
 
 async def list_model_card_export_jobs() -> List[Dict[str, Any]]:
@@ -24,9 +47,10 @@ async def list_model_card_export_jobs() -> List[Dict[str, Any]]:
         List[Dict[str, Any]]: A list of SageMaker Model Card Export Jobs.
     """
     client = get_sagemaker_client()
-    logger.info('Listing SageMaker Model Card Export Jobs...')
-    response = client.list_model_card_export_jobs()
-    return response.get('ModelCardExportJobSummaries', [])
+    logger.debug('Listing SageMaker Model Card Export Jobs...')
+    return await run_in_executor(
+        paginate, client, 'list_model_card_export_jobs', 'ModelCardExportJobSummaries'
+    )
 
 
 async def list_model_card_versions(model_card_name: str) -> List[Dict[str, Any]]:
@@ -39,11 +63,17 @@ async def list_model_card_versions(model_card_name: str) -> List[Dict[str, Any]]
         List[Dict[str, Any]]: A list of versions of the specified Model Card.
     """
     client = get_sagemaker_client()
-    logger.info(f'Listing versions for Model Card: {model_card_name}')
-    response = client.list_model_card_versions(ModelCardName=model_card_name)
-    return response.get('ModelCardVersionSummaryList', [])
+    logger.debug('Listing versions for Model Card: {}', model_card_name)
+    return await run_in_executor(
+        paginate,
+        client,
+        'list_model_card_versions',
+        'ModelCardVersionSummaryList',
+        ModelCardName=model_card_name,
+    )
 
 
+@ttl_cache(LONG_TTL_SECONDS, stale=STALE_TTL_SECONDS)
 async def describe_model_card(model_card_name: str) -> Dict[str, Any]:
     """Describe a SageMaker Model Card.
 
@@ -54,8 +84,8 @@ async def describe_model_card(model_card_name: str) -> Dict[str, Any]:
         Dict[str, Any]: The details of the SageMaker Model Card.
     """
     client = get_sagemaker_client()
-    logger.info(f'Describing SageMaker Model Card: {model_card_name}')
-    response = client.describe_model_card(ModelCardName=model_card_name)
+    logger.debug('Describing SageMaker Model Card: {}', model_card_name)
+    response = await run_in_executor(client.describe_model_card, ModelCardName=model_card_name)
     return response
 
 
@@ -66,6 +96,8 @@ async def delete_model_card(model_card_name: str) -> None:
         model_card_name (str): The name of the SageMaker Model Card to delete.
     """
     client = get_sagemaker_client()
-    logger.info(f'Deleting SageMaker Model Card: {model_card_name}')
-    client.delete_model_card(ModelCardName=model_card_name)
-    logger.info(f'Model Card {model_card_name} deleted successfully.')
+    logger.info('Deleting SageMaker Model Card: {}', model_card_name)
+    await run_in_executor(client.delete_model_card, ModelCardName=model_card_name)
+    invalidate('describe_model_card', model_card_name)
+    clear_cache('list_model_cards')
+    logger.info('Model Card {} deleted successfully.', model_card_name)
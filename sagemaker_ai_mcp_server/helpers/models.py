@@ -1,22 +1,65 @@
 """Helper Functions for SageMaker Models."""
 
 from loguru import logger
-from sagemaker_ai_mcp_server.helpers.utils import get_sagemaker_client
-from typing import Any, Dict, List
+from sagemaker_ai_mcp_server.helpers.cache import (
+    LONG_TTL_SECONDS,
+    STALE_TTL_SECONDS,
+    clear_cache,
+    invalidate,
+    ttl_cache,
+)
+from sagemaker_ai_mcp_server.helpers.utils import (
+    DEFAULT_BATCH_CONCURRENCY,
+    api_filters,
+    describe_batch,
+    get_sagemaker_client,
+    iterate,
+    paginate,
+    run_in_executor,
+)
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 
-async def list_models() -> List[Dict[str, Any]]:
+@ttl_cache(LONG_TTL_SECONDS)
+async def list_models(
+    max_items: Optional[int] = None, name_contains: Optional[str] = None
+) -> List[Dict[str, Any]]:
     """List all SageMaker Models.
 
+    Args:
+        max_items (int, optional): The maximum number of Models to return. Defaults to None,
+            which returns all of them.
+        name_contains (str, optional): Only return Models whose name contains this string.
+            Defaults to None.
+
     Returns:
         List[Dict[str, Any]]: A list of SageMaker Models.
     """
     client = get_sagemaker_client()
-    logger.info('Listing SageMaker Models...')
-    response = client.list_models()
-    return response.get('Models', [])
+    logger.debug('Listing SageMaker Models...')
+    filters = api_filters(NameContains=name_contains)
+    return await run_in_executor(paginate, client, 'list_models', 'Models', max_items, **filters)
+
+
+async def iter_models(
+    max_items: Optional[int] = None, **filters: Any
+) -> AsyncIterator[Dict[str, Any]]:
+    """Iterate over SageMaker Models, fetching one page at a time.
+
+    Args:
+        max_items (int, optional): The maximum number of Models to yield. Defaults to None.
+        **filters: Filters passed to the ListModels API, e.g. NameContains='xgboost'.
+
+    Yields:
+        Dict[str, Any]: The summary of each SageMaker Model.
+    """
+    client = get_sagemaker_client()
+    logger.debug('Listing SageMaker Models...')
+    async for model in iterate(client, 'list_models', 'Models', max_items, **filters):
+        yield model
 
 
+@ttl_cache(LONG_TTL_SECONDS, stale=STALE_TTL_SECONDS)
 async def describe_model(model_name: str) -> Dict[str, Any]:
     """Describe a SageMaker Model.
 
@@ -27,11 +70,27 @@ async def describe_model(model_name: str) -> Dict[str, Any]:
         Dict[str, Any]: The details of the SageMaker Model.
     """
     client = get_sagemaker_client()
-    logger.info(f'Describing SageMaker Model: {model_name}')
-    response = client.describe_model(ModelName=model_name)
+    logger.debug('Describing SageMaker Model: {}', model_name)
+    response = await run_in_executor(client.describe_model, ModelName=model_name)
     return response
 
 
+async def describe_models_many(
+    model_names: List[str], concurrency: int = DEFAULT_BATCH_CONCURRENCY
+) -> Dict[str, Dict[str, Any]]:
+    """Describe several SageMaker Models concurrently.
+
+    Args:
+        model_names (List[str]): The names of the SageMaker Models to describe.
+        concurrency (int, optional): The maximum number of concurrent requests. Defaults to 8.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: For each name, the details of the resource or {'Error': message}.
+    """
+    logger.debug('Describing {} SageMaker Models', len(model_names))
+    return await describe_batch(describe_model, model_names, concurrency)
+
+
 async def delete_model(model_name: str) -> None:
     """Delete a SageMaker Model.
 
@@ -39,6 +98,8 @@ async def delete_model(model_name: str) -> None:
         model_name (str): The name of the SageMaker Model to delete.
     """
     client = get_sagemaker_client()
-    logger.info(f'Deleting SageMaker Model: {model_name}')
-    client.delete_model(ModelName=model_name)
-    logger.info(f'Model {model_name} deleted successfully.')
+    logger.info('Deleting SageMaker Model: {}', model_name)
+    await run_in_executor(client.delete_model, ModelName=model_name)
+    invalidate('describe_model', model_name)
+    clear_cache('list_models')
+    logger.info('Model {} deleted successfully.', model_name)
@@ -1,20 +1,91 @@
 """Helper Functions for SageMaker Pipelines."""
 
+import hashlib
+from datetime import datetime
 from loguru import logger
-from sagemaker_ai_mcp_server.helpers.utils import get_sagemaker_client
-from typing import Any, Dict, List
-
+from sagemaker_ai_mcp_server.helpers.cache import (
+    IMMUTABLE_TTL_SECONDS,
+    LONG_TTL_SECONDS,
+    SHORT_TTL_SECONDS,
+    STALE_TTL_SECONDS,
+    clear_cache,
+    invalidate,
+    ttl_by_status,
+    ttl_cache,
+)
+from sagemaker_ai_mcp_server.helpers.utils import (
+    DEFAULT_BATCH_CONCURRENCY,
+    api_filters,
+    describe_batch,
+    get_sagemaker_client,
+    iterate,
+    paginate,
+    run_batch,
+    run_in_executor,
+)
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+
+@ttl_cache(LONG_TTL_SECONDS)
+async def list_pipelines(
+    max_items: Optional[int] = None,
+    name_prefix: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    sort_by: Optional[str] = None,
+    sort_order: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """List SageMaker Pipelines, filtered by SageMaker.
 
-async def list_pipelines() -> List[Dict[str, Any]]:
-    """List all SageMaker Pipelines.
+    Args:
+        max_items (int, optional): The maximum number of Pipelines to return. Defaults to None,
+            which returns all of them.
+        name_prefix (str, optional): Only return Pipelines whose name starts with this prefix.
+            Defaults to None.
+        created_after (datetime, optional): Only return Pipelines created after this time.
+            Defaults to None.
+        created_before (datetime, optional): Only return Pipelines created before this time.
+            Defaults to None.
+        sort_by (str, optional): 'Name' or 'CreationTime'. Defaults to None, which sorts by
+            creation time.
+        sort_order (str, optional): 'Ascending' or 'Descending'. Defaults to None, which sorts
+            in descending order.
 
     Returns:
         List[Dict[str, Any]]: A list of SageMaker Pipelines.
     """
     client = get_sagemaker_client()
-    logger.info('Listing SageMaker Pipelines...')
-    response = client.list_pipelines()
-    return response.get('PipelineSummaries', [])
+    logger.debug('Listing SageMaker Pipelines...')
+    filters = api_filters(
+        PipelineNamePrefix=name_prefix,
+        CreatedAfter=created_after,
+        CreatedBefore=created_before,
+        SortBy=sort_by,
+        SortOrder=sort_order,
+    )
+    return await run_in_executor(
+        paginate, client, 'list_pipelines', 'PipelineSummaries', max_items, **filters
+    )
+
+
+async def iter_pipelines(
+    max_items: Optional[int] = None, **filters: Any
+) -> AsyncIterator[Dict[str, Any]]:
+    """Iterate over SageMaker Pipelines, fetching one page at a time.
+
+    Args:
+        max_items (int, optional): The maximum number of Pipelines to yield. Defaults to None.
+        **filters: Filters passed to the ListPipelines API, e.g. PipelineNamePrefix='train'.
+
+    Yields:
+        Dict[str, Any]: The summary of each SageMaker Pipeline.
+    """
+    client = get_sagemaker_client()
+    logger.debug('Listing SageMaker Pipelines...')
+    async for pipeline in iterate(
+        client, 'list_pipelines', 'PipelineSummaries', max_items, **filters
+    ):
+        yield pipeline
 
 
 async def list_pipeline_parameters_for_execution(
@@ -29,26 +100,86 @@ async def list_pipeline_parameters_for_execution(
         List[Dict[str, Any]]: A list of parameters for the specified Pipeline Execution.
     """
     client = get_sagemaker_client()
-    logger.info(f'Listing parameters for Pipeline Execution: {pipeline_execution_arn}')
-    response = client.list_pipeline_parameters_for_execution(
-        PipelineExecutionArn=pipeline_execution_arn
+    logger.debug('Listing parameters for Pipeline Execution: {}', pipeline_execution_arn)
+    return await run_in_executor(
+        paginate,
+        client,
+        'list_pipeline_parameters_for_execution',
+        'PipelineParameters',
+        PipelineExecutionArn=pipeline_execution_arn,
     )
-    return response.get('PipelineParameters', [])
 
 
-async def list_pipeline_executions(pipeline_name: str) -> List[Dict[str, Any]]:
+@ttl_cache(SHORT_TTL_SECONDS)
+async def list_pipeline_executions(
+    pipeline_name: str,
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    sort_by: Optional[str] = None,
+    sort_order: Optional[str] = None,
+    max_items: Optional[int] = None,
+) -> List[Dict[str, Any]]:
     """List all executions of a specific SageMaker Pipeline.
 
     Args:
         pipeline_name (str): The name of the SageMaker Pipeline.
+        created_after (datetime, optional): Only return executions started after this time.
+            Defaults to None.
+        created_before (datetime, optional): Only return executions started before this time.
+            Defaults to None.
+        sort_by (str, optional): 'CreationTime' or 'PipelineExecutionArn'. Defaults to None,
+            which sorts by creation time.
+        sort_order (str, optional): 'Ascending' or 'Descending'. Defaults to None, which sorts
+            in descending order.
+        max_items (int, optional): The maximum number of executions to return. Defaults to
+            None, which returns all of them.
 
     Returns:
         List[Dict[str, Any]]: A list of Pipeline Executions for the specified Pipeline.
     """
     client = get_sagemaker_client()
-    logger.info(f'Listing executions for Pipeline: {pipeline_name}')
-    response = client.list_pipeline_executions(PipelineName=pipeline_name)
-    return response.get('PipelineExecutionSummaries', [])
+    logger.debug('Listing executions for Pipeline: {}', pipeline_name)
+    filters = api_filters(
+        CreatedAfter=created_after,
+        CreatedBefore=created_before,
+        SortBy=sort_by,
+        SortOrder=sort_order,
+    )
+    return await run_in_executor(
+        paginate,
+        client,
+        'list_pipeline_executions',
+        'PipelineExecutionSummaries',
+        max_items,
+        PipelineName=pipeline_name,
+        **filters,
+    )
+
+
+async def iter_pipeline_executions(
+    pipeline_name: str, max_items: Optional[int] = None, **filters: Any
+) -> AsyncIterator[Dict[str, Any]]:
+    """Iterate over the executions of a SageMaker Pipeline, fetching one page at a time.
+
+    Args:
+        pipeline_name (str): The name of the SageMaker Pipeline.
+        max_items (int, optional): The maximum number of executions to yield. Defaults to None.
+        **filters: Filters passed to the ListPipelineExecutions API, e.g. SortOrder='Ascending'.
+
+    Yields:
+        Dict[str, Any]: The summary of each Pipeline Execution.
+    """
+    client = get_sagemaker_client()
+    logger.debug('Listing executions for Pipeline: {}', pipeline_name)
+    async for execution in iterate(
+        client,
+        'list_pipeline_executions',
+        'PipelineExecutionSummaries',
+        max_items,
+        PipelineName=pipeline_name,
+        **filters,
+    ):
+        yield execution
 
 
 async def list_pipeline_execution_steps(
@@ -63,11 +194,41 @@ async def list_pipeline_execution_steps(
         List[Dict[str, Any]]: A list of steps for the specified Pipeline Execution.
     """
     client = get_sagemaker_client()
-    logger.info(f'Listing steps for Pipeline Execution: {pipeline_execution_arn}')
-    response = client.list_pipeline_execution_steps(PipelineExecutionArn=pipeline_execution_arn)
-    return response.get('PipelineExecutionSteps', [])
+    logger.debug('Listing steps for Pipeline Execution: {}', pipeline_execution_arn)
+    return await run_in_executor(
+        paginate,
+        client,
+        'list_pipeline_execution_steps',
+        'PipelineExecutionSteps',
+        PipelineExecutionArn=pipeline_execution_arn,
+    )
 
 
+async def iter_pipeline_execution_steps(
+    pipeline_execution_arn: str, max_items: Optional[int] = None
+) -> AsyncIterator[Dict[str, Any]]:
+    """Iterate over the steps of a SageMaker Pipeline Execution, fetching one page at a time.
+
+    Args:
+        pipeline_execution_arn (str): The ARN of the SageMaker Pipeline Execution.
+        max_items (int, optional): The maximum number of steps to yield. Defaults to None.
+
+    Yields:
+        Dict[str, Any]: Each step of the Pipeline Execution.
+    """
+    client = get_sagemaker_client()
+    logger.debug('Listing steps for Pipeline Execution: {}', pipeline_execution_arn)
+    async for step in iterate(
+        client,
+        'list_pipeline_execution_steps',
+        'PipelineExecutionSteps',
+        max_items,
+        PipelineExecutionArn=pipeline_execution_arn,
+    ):
+        yield step
+
+
+@ttl_cache(LONG_TTL_SECONDS, stale=STALE_TTL_SECONDS)
 async def describe_pipeline(pipeline_name: str) -> Dict[str, Any]:
     """Describe a SageMaker Pipeline.
 
@@ -78,11 +239,65 @@ async def describe_pipeline(pipeline_name: str) -> Dict[str, Any]:
         Dict[str, Any]: The details of the SageMaker Pipeline.
     """
     client = get_sagemaker_client()
-    logger.info(f'Describing SageMaker Pipeline: {pipeline_name}')
-    response = client.describe_pipeline(PipelineName=pipeline_name)
+    logger.debug('Describing SageMaker Pipeline: {}', pipeline_name)
+    response = await run_in_executor(client.describe_pipeline, PipelineName=pipeline_name)
     return response
 
 
+async def describe_pipelines_many(
+    pipeline_names: List[str], concurrency: int = DEFAULT_BATCH_CONCURRENCY
+) -> Dict[str, Dict[str, Any]]:
+    """Describe several SageMaker Pipelines concurrently.
+
+    Args:
+        pipeline_names (List[str]): The names of the SageMaker Pipelines to describe.
+        concurrency (int, optional): The maximum number of concurrent requests. Defaults to 8.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: For each name, the details of the resource or {'Error': message}.
+    """
+    logger.debug('Describing {} SageMaker Pipelines', len(pipeline_names))
+    return await describe_batch(describe_pipeline, pipeline_names, concurrency)
+
+
+async def describe_all_pipelines(
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> Dict[str, Dict[str, Any]]:
+    """Describe every SageMaker Pipeline in the account, with the describes run concurrently.
+
+    Args:
+        concurrency (int, optional): The maximum number of concurrent requests. Defaults to 8.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: For each Pipeline name, its details or {'Error': message}.
+    """
+    pipelines = await list_pipelines()
+    return await describe_pipelines_many(
+        [pipeline['PipelineName'] for pipeline in pipelines], concurrency
+    )
+
+
+async def list_all_executions_for_pipelines(
+    pipeline_names: Optional[List[str]] = None,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> Dict[str, Any]:
+    """List the executions of several SageMaker Pipelines concurrently.
+
+    Args:
+        pipeline_names (List[str], optional): The names of the SageMaker Pipelines. Defaults
+            to None, which lists the executions of every Pipeline in the account.
+        concurrency (int, optional): The maximum number of concurrent requests. Defaults to 8.
+
+    Returns:
+        Dict[str, Any]: For each Pipeline name, its list of executions or {'Error': message}.
+    """
+    if pipeline_names is None:
+        pipeline_names = [pipeline['PipelineName'] for pipeline in await list_pipelines()]
+    logger.debug('Listing executions for {} SageMaker Pipelines', len(pipeline_names))
+    return await describe_batch(list_pipeline_executions, pipeline_names, concurrency)
+
+
+@ttl_cache(ttl_by_status('PipelineExecutionStatus'), stale=STALE_TTL_SECONDS)
 async def describe_pipeline_execution(
     pipeline_execution_arn: str,
 ) -> Dict[str, Any]:
@@ -95,11 +310,52 @@ async def describe_pipeline_execution(
         Dict[str, Any]: The details of the specified Pipeline Execution.
     """
     client = get_sagemaker_client()
-    logger.info(f'Describing Pipeline Execution: {pipeline_execution_arn}')
-    response = client.describe_pipeline_execution(PipelineExecutionArn=pipeline_execution_arn)
+    logger.debug('Describing Pipeline Execution: {}', pipeline_execution_arn)
+    response = await run_in_executor(
+        client.describe_pipeline_execution, PipelineExecutionArn=pipeline_execution_arn
+    )
     return response
 
 
+async def describe_pipeline_executions_many(
+    pipeline_execution_arns: List[str], concurrency: int = DEFAULT_BATCH_CONCURRENCY
+) -> Dict[str, Dict[str, Any]]:
+    """Describe several SageMaker Pipeline Executions concurrently.
+
+    Args:
+        pipeline_execution_arns (List[str]): The ARNs of the Pipeline Executions to describe.
+        concurrency (int, optional): The maximum number of concurrent requests. Defaults to 8.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: For each ARN, the details of the resource or {'Error': message}.
+    """
+    logger.debug('Describing {} Pipeline Executions', len(pipeline_execution_arns))
+    return await describe_batch(describe_pipeline_execution, pipeline_execution_arns, concurrency)
+
+
+async def list_pipeline_executions_with_details(
+    pipeline_name: str,
+    max_items: Optional[int] = None,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> Dict[str, Dict[str, Any]]:
+    """List the executions of a SageMaker Pipeline and describe them concurrently.
+
+    Args:
+        pipeline_name (str): The name of the SageMaker Pipeline.
+        max_items (int, optional): The maximum number of executions to describe, most recent
+            first. Defaults to None, which describes all of them.
+        concurrency (int, optional): The maximum number of concurrent requests. Defaults to 8.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: For each execution ARN, its details or {'Error': message}.
+    """
+    executions = await list_pipeline_executions(pipeline_name, max_items=max_items)
+    return await describe_pipeline_executions_many(
+        [execution['PipelineExecutionArn'] for execution in executions], concurrency
+    )
+
+
+@ttl_cache(IMMUTABLE_TTL_SECONDS)
 async def describe_pipeline_definition_for_execution(
     pipeline_execution_arn: str,
 ) -> Dict[str, Any]:
@@ -112,16 +368,40 @@ async def describe_pipeline_definition_for_execution(
         Dict[str, Any]: The definition of the specified Pipeline Execution.
     """
     client = get_sagemaker_client()
-    logger.info(f'Describing Pipeline Definition for Execution: {pipeline_execution_arn}')
-    response = client.describe_pipeline_definition_for_execution(
-        PipelineExecutionArn=pipeline_execution_arn
+    logger.debug('Describing Pipeline Definition for Execution: {}', pipeline_execution_arn)
+    response = await run_in_executor(
+        client.describe_pipeline_definition_for_execution,
+        PipelineExecutionArn=pipeline_execution_arn,
     )
     return response
 
 
+def digest_definition(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace the PipelineDefinition of a describe response with its SHA-256 digest.
+
+    Pipeline definitions can be hundreds of KB; callers that only need to know whether
+    two definitions differ can compare digests instead.
+
+    Args:
+        response (Dict[str, Any]): A DescribePipeline or DescribePipelineDefinitionForExecution
+            response.
+
+    Returns:
+        Dict[str, Any]: A copy of the response with 'PipelineDefinitionSha256' in place of
+            'PipelineDefinition', or the response itself when it has no definition.
+    """
+    if 'PipelineDefinition' not in response:
+        return response
+    result = {key: value for key, value in response.items() if key != 'PipelineDefinition'}
+    result['PipelineDefinitionSha256'] = hashlib.sha256(
+        response['PipelineDefinition'].encode()
+    ).hexdigest()
+    return result
+
+
 async def start_pipeline_execution(
     pipeline_name: str,
-    pipeline_parameters: List[Dict[str, Any]] = None,
+    pipeline_parameters: Optional[List[Dict[str, Any]]] = None,
 ) -> Dict[str, Any]:
     """Start a new execution of a SageMaker Pipeline.
 
@@ -133,11 +413,14 @@ async def start_pipeline_execution(
         Dict[str, Any]: The details of the started Pipeline Execution.
     """
     client = get_sagemaker_client()
-    logger.info(f'Starting Pipeline Execution for: {pipeline_name}')
-    response = client.start_pipeline_execution(
-        PipelineName=pipeline_name,
-        PipelineParameters=pipeline_parameters or [],
-    )
+    logger.info('Starting Pipeline Execution for: {}', pipeline_name)
+    start_params = {'PipelineName': pipeline_name}
+
+    if pipeline_parameters:
+        start_params['PipelineParameters'] = pipeline_parameters
+
+    response = await run_in_executor(client.start_pipeline_execution, **start_params)
+    clear_cache('list_pipeline_executions')
     return response
 
 
@@ -148,9 +431,33 @@ async def stop_pipeline_execution(pipeline_execution_arn: str) -> None:
         pipeline_execution_arn (str): The ARN of the SageMaker Pipeline Execution to stop.
     """
     client = get_sagemaker_client()
-    logger.info(f'Stopping Pipeline Execution: {pipeline_execution_arn}')
-    client.stop_pipeline_execution(PipelineExecutionArn=pipeline_execution_arn)
-    logger.info(f'Pipeline Execution {pipeline_execution_arn} stopped successfully.')
+    logger.info('Stopping Pipeline Execution: {}', pipeline_execution_arn)
+    await run_in_executor(
+        client.stop_pipeline_execution, PipelineExecutionArn=pipeline_execution_arn
+    )
+    invalidate('describe_pipeline_execution', pipeline_execution_arn)
+    clear_cache('list_pipeline_executions')
+    logger.info('Pipeline Execution {} stopped successfully.', pipeline_execution_arn)
+
+
+async def stop_pipeline_executions(
+    pipeline_execution_arns: List[str],
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    wait: bool = True,
+) -> Dict[str, Optional[str]]:
+    """Stop several SageMaker Pipeline Executions concurrently.
+
+    Args:
+        pipeline_execution_arns (List[str]): The ARNs of the Pipeline Executions to stop.
+        concurrency (int, optional): The maximum number of concurrent requests. Defaults to 8.
+        wait (bool, optional): Whether to wait for the requests to finish. Defaults to True.
+            With False, they run in the background and every ARN maps to None.
+
+    Returns:
+        Dict[str, Optional[str]]: For each ARN, None if the request succeeded or the error message.
+    """
+    logger.info('Stopping {} SageMaker Pipeline Executions', len(pipeline_execution_arns))
+    return await run_batch(stop_pipeline_execution, pipeline_execution_arns, concurrency, wait)
 
 
 async def delete_pipeline(pipeline_name: str) -> None:
@@ -160,6 +467,8 @@ async def delete_pipeline(pipeline_name: str) -> None:
         pipeline_name (str): The name of the SageMaker Pipeline to delete.
     """
     client = get_sagemaker_client()
-    logger.info(f'Deleting SageMaker Pipeline: {pipeline_name}')
-    client.delete_pipeline(PipelineName=pipeline_name)
-    logger.info(f'Pipeline {pipeline_name} deleted successfully.')
+    logger.info('Deleting SageMaker Pipeline: {}', pipeline_name)
+    await run_in_executor(client.delete_pipeline, PipelineName=pipeline_name)
+    invalidate('describe_pipeline', pipeline_name)
+    clear_cache('list_pipelines')
+    logger.info('Pipeline {} deleted successfully.', pipeline_name)
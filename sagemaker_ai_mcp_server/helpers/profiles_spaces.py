@@ -1,7 +1,7 @@
 """Helper Functions for Profile Ops."""
 
 from loguru import logger
-from sagemaker_ai_mcp_server.helpers.utils import get_sagemaker_client
+from sagemaker_ai_mcp_server.helpers.utils import get_sagemaker_client, paginate, run_in_executor
 from typing import Any, Dict, List
 
 
@@ -12,9 +12,8 @@ async def list_user_profiles() -> List[Dict[str, Any]]:
         List[Dict[str, Any]]: A list of user profiles in the SageMaker Domain.
     """
     client = get_sagemaker_client()
-    logger.info('Listing SageMaker User Profiles...')
-    response = client.list_user_profiles()
-    return response.get('UserProfiles', [])
+    logger.debug('Listing SageMaker User Profiles...')
+    return await run_in_executor(paginate, client, 'list_user_profiles', 'UserProfiles')
 
 
 async def list_spaces() -> List[Dict[str, Any]]:
@@ -24,6 +23,5 @@ async def list_spaces() -> List[Dict[str, Any]]:
         List[Dict[str, Any]]: A list of SageMaker Spaces.
     """
     client = get_sagemaker_client()
-    logger.info('Listing SageMaker Spaces...')
-    response = client.list_spaces()
-    return response.get('Spaces', [])
+    logger.debug('Listing SageMaker Spaces...')
+    return await run_in_executor(paginate, client, 'list_spaces', 'Spaces')
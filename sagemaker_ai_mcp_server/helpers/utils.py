@@ -1,19 +1,68 @@
-"""Utils Functions for Region, Execution Role, Sessions, SageMaker client."""
+"""Utils Functions for Region, Execution Role, Sessions, SageMaker client and pagination."""
 
+import asyncio
 import boto3
+import contextlib
+import functools
 import os
+import threading
+import time
+import weakref
+from botocore.config import Config
+from botocore.exceptions import ClientError, HTTPClientError
+from botocore.exceptions import ConnectionError as BotoConnectionError
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
 from loguru import logger
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 
+@functools.lru_cache(maxsize=1)
 def get_region() -> str:
     """Get the AWS region from the environment variable or default to 'us-east-1'.
 
+    The environment is read once per process, call refresh_env() to pick up changes.
+
     Returns:
         str: The AWS region.
     """
     return os.getenv('AWS_REGION', 'us-east-1')
 
 
+@functools.lru_cache(maxsize=1)
+def _get_profile() -> Optional[str]:
+    """Get the AWS profile from the environment variable, if set.
+
+    Returns:
+        Optional[str]: The AWS profile name.
+    """
+    return os.environ.get('AWS_PROFILE')
+
+
+def refresh_env() -> None:
+    """Re-read the AWS environment variables and drop the clients built from them."""
+    get_region.cache_clear()
+    _get_profile.cache_clear()
+    get_sagemaker_execution_role_arn.cache_clear()
+    _get_session.cache_clear()
+    reset_client_cache()
+    _THROTTLES.clear()
+    _get_hedge_after_ms.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
 def get_sagemaker_execution_role_arn() -> str:
     """Get the SageMaker execution role ARN from the environment variable.
 
@@ -36,23 +85,161 @@ def get_aws_session(region_name=None) -> boto3.Session:
     Returns:
         boto3.Session: An AWS session object.
     """
-    profile_name = os.environ.get('AWS_PROFILE')
+    profile_name = _get_profile()
     region = region_name or get_region()
+    if profile_name:
+        logger.debug('Using AWS profile: {}', profile_name)
+        return boto3.Session(profile_name=profile_name, region_name=region)
+    logger.debug('Using default AWS credential chain')
+    return boto3.Session(region_name=region)
+
+
+def _get_env_int(name: str, default: int) -> int:
+    """Read a positive integer setting from the environment.
+
+    Args:
+        name (str): The name of the environment variable.
+        default (int): The value to use when the variable is not set.
+
+    Returns:
+        int: The configured value.
+    """
+    value = os.environ.get(name)
+    if not value:
+        return default
     try:
-        if profile_name:
-            logger.debug(f'Using AWS profile: {profile_name}')
-            return boto3.Session(profile_name=profile_name, region_name=region)
-        else:
-            logger.debug('Using default AWS credential chain')
-            return boto3.Session(region_name=region)
-    except Exception as e:
-        logger.error(f'Error creating AWS session: {e}')
-        raise RuntimeError(f'Failed to create AWS session: {e}')
+        parsed = int(value)
+    except ValueError:
+        raise ValueError(f'{name} must be an integer, got {value!r}.')
+    if parsed < 1:
+        raise ValueError(f'{name} must be a positive integer, got {parsed}.')
+    return parsed
+
+
+def _get_env_bool(name: str, default: bool) -> bool:
+    """Read a boolean setting from the environment.
+
+    Args:
+        name (str): The name of the environment variable.
+        default (bool): The value to use when the variable is not set.
+
+    Returns:
+        bool: The configured value.
+    """
+    value = os.environ.get(name)
+    if not value:
+        return default
+    if value.lower() in ('true', '1', 'yes'):
+        return True
+    if value.lower() in ('false', '0', 'no'):
+        return False
+    raise ValueError(f'{name} must be true or false, got {value!r}.')
+
+
+def get_client_config() -> Config:
+    """Build the botocore configuration used for the SageMaker client.
+
+    Uses adaptive retries, so bursts of list/describe calls back off with client-side
+    rate limiting instead of failing on ThrottlingException, and a connection pool
+    large enough for concurrent tool calls. Each value can be tuned through an
+    environment variable. Client-side parameter validation can be turned off with
+    SAGEMAKER_MCP_PARAMETER_VALIDATION=false when callers are trusted, since SageMaker
+    validates every request again anyway.
+
+    Returns:
+        Config: The botocore client configuration.
+    """
+    return Config(
+        retries={
+            'max_attempts': _get_env_int('SAGEMAKER_MCP_MAX_ATTEMPTS', 10),
+            'mode': os.environ.get('SAGEMAKER_MCP_RETRY_MODE', 'adaptive'),
+        },
+        connect_timeout=_get_env_int('SAGEMAKER_MCP_CONNECT_TIMEOUT', 5),
+        read_timeout=_get_env_int('SAGEMAKER_MCP_READ_TIMEOUT', 60),
+        tcp_keepalive=True,
+        max_pool_connections=_get_env_int('SAGEMAKER_MCP_MAX_POOL_CONNECTIONS', 64),
+        parameter_validation=_get_env_bool('SAGEMAKER_MCP_PARAMETER_VALIDATION', True),
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _get_session() -> boto3.Session:
+    """Get the AWS session shared by all clients, created once per process.
+
+    Reusing one session avoids re-reading the AWS config files and re-running the
+    credential provider chain for every client. Credentials are resolved here, once:
+    botocore keeps them on the session, and temporary ones (SSO, AssumeRole, instance
+    metadata) are refreshable, so clients built later renew them without another lookup.
+
+    Returns:
+        boto3.Session: The shared AWS session.
+    """
+    session = get_aws_session()
+    if session.get_credentials() is None:
+        logger.warning('No AWS credentials found, SageMaker API calls will fail.')
+    return session
+
+
+# boto3 sessions are not thread-safe, and lru_cache may run a function twice when it is
+# called concurrently, so clients are built under a lock.
+_CLIENT_LOCK = threading.Lock()
+
+# The clients built by _get_client(), so shutdown() can close them.
+_CLIENTS: List[Any] = []
+
+
+@functools.lru_cache(maxsize=None)
+def _get_client(region: str):
+    """Create the SageMaker client for a region, memoized for the process lifetime.
+
+    Args:
+        region (str): The AWS region of the client.
+
+    Returns:
+        boto3.client: A SageMaker client object.
+    """
+    client = _get_session().client('sagemaker', region_name=region, config=get_client_config())
+    _CLIENTS.append(client)
+    return client
+
+
+# Client set by use_sagemaker_client(), returned by get_sagemaker_client() in its context.
+_CLIENT_OVERRIDE: ContextVar[Optional[Any]] = ContextVar('sagemaker_client_override', default=None)
+
+
+def get_client_override() -> Optional[Any]:
+    """Return the client set by use_sagemaker_client() in the current context, if any."""
+    return _CLIENT_OVERRIDE.get()
+
+
+@contextlib.contextmanager
+def use_sagemaker_client(client) -> Iterator[Any]:
+    """Make every helper use the given SageMaker client within the context.
+
+    This lets tests drive the helpers with a botocore Stubber, without network calls or
+    patching each helper module. Cached helpers bypass the response cache while a client
+    is set, so stubbed responses are neither served from nor stored in it.
+
+    Args:
+        client (boto3.client): The SageMaker client to use.
+
+    Yields:
+        boto3.client: The client.
+    """
+    token = _CLIENT_OVERRIDE.set(client)
+    try:
+        yield client
+    finally:
+        _CLIENT_OVERRIDE.reset(token)
 
 
 def get_sagemaker_client(region_name=None):
     """Get a SageMaker client.
 
+    Clients are cached per region and built from one shared session, so every helper
+    shares one warm client (and its HTTP connection pool) instead of building a new one
+    on each call. Inside use_sagemaker_client(), the client it was given is returned.
+
     Args:
         region_name (str): The AWS region to use. Defaults to None, which uses the
                            region from the environment variable or defaults to 'us-east-1'.
@@ -60,5 +247,580 @@ def get_sagemaker_client(region_name=None):
     Returns:
         boto3.client: A SageMaker client object.
     """
-    session = get_aws_session(region_name)
-    return session.client('sagemaker')
+    override = _CLIENT_OVERRIDE.get()
+    if override is not None:
+        return override
+    region = region_name or get_region()
+    with _CLIENT_LOCK:
+        return _get_client(region)
+
+
+def reset_client_cache() -> None:
+    """Drop all cached SageMaker clients, forcing new ones to be built on next use."""
+    global _CONNECTION_PRIMED
+    _get_client.cache_clear()
+    _CLIENTS.clear()
+    _CONNECTION_PRIMED = False
+
+
+# Incremented by refresh_credentials(), so calls that failed with the same session only
+# rebuild it once.
+_SESSION_GENERATION = 0
+
+
+def _close_clients() -> None:
+    """Close the cached SageMaker clients and drop them. Must be called under _CLIENT_LOCK."""
+    for client in _CLIENTS:
+        client.close()
+    reset_client_cache()
+
+
+def refresh_credentials(generation: Optional[int] = None) -> None:
+    """Close the shared session's clients and drop it, so the next call resolves credentials again.
+
+    Args:
+        generation (int, optional): The value of _SESSION_GENERATION when the failing call
+            started. If the session was rebuilt since then, nothing is done. Defaults to None,
+            which always rebuilds it.
+    """
+    global _SESSION_GENERATION
+    with _CLIENT_LOCK:
+        if generation is not None and generation != _SESSION_GENERATION:
+            return
+        _SESSION_GENERATION += 1
+        _get_session.cache_clear()
+        _close_clients()
+
+
+# List operations whose paginators are built at startup.
+WARMUP_PAGINATORS = (
+    'list_endpoints',
+    'list_models',
+    'list_pipeline_executions',
+    'list_pipelines',
+    'list_processing_jobs',
+    'list_training_jobs',
+    'list_transform_jobs',
+)
+
+
+def warmup() -> None:
+    """Build the SageMaker client, its paginators and the thread pool ahead of the first call.
+
+    Loading the service model, resolving the endpoint and probing the credential chain
+    take a noticeable time on first use, so running them at startup keeps that cost out
+    of the first tool call. Failures are logged and left for the first call to report.
+    """
+    try:
+        client = get_sagemaker_client()
+        for operation_name in WARMUP_PAGINATORS:
+            client.get_paginator(operation_name)
+        _get_executor()
+    except Exception as e:
+        logger.warning('SageMaker client warmup failed: {}', e)
+
+
+# Whether prime_connection() already sent its request with the current clients.
+_CONNECTION_PRIMED = False
+
+
+async def prime_connection() -> None:
+    """Open the first HTTPS connection to SageMaker with a one-item ListPipelines request.
+
+    This gets the TLS handshake done before a tool needs it. The request is sent once per
+    process, and again only after the clients are rebuilt. It is meant to run in the
+    background, since a slow or unreachable endpoint would otherwise hold up whatever
+    awaits it. Set SAGEMAKER_MCP_WARMUP_REQUEST to false to skip it. Failures are logged.
+    """
+    global _CONNECTION_PRIMED
+    if _CONNECTION_PRIMED or not _get_env_bool('SAGEMAKER_MCP_WARMUP_REQUEST', True):
+        return
+    _CONNECTION_PRIMED = True
+    try:
+        await run_in_executor(get_sagemaker_client().list_pipelines, MaxResults=1)
+    except Exception as e:
+        logger.warning('SageMaker connection warmup failed: {}', e)
+
+
+def shutdown() -> None:
+    """Release the shared thread pool and close the cached SageMaker clients.
+
+    Called once, when the server process stops. Calls still queued on the pool are
+    cancelled, and the clients' HTTP connections are closed instead of being left to the
+    interpreter exit.
+    """
+    if _get_executor.cache_info().currsize:
+        _get_executor().shutdown(wait=False, cancel_futures=True)
+        _get_executor.cache_clear()
+    with _CLIENT_LOCK:
+        _close_clients()
+
+
+# Default number of threads running blocking boto3 calls.
+DEFAULT_MAX_WORKERS = 32
+
+
+# Default number of SageMaker calls in flight at once, across all helpers.
+DEFAULT_MAX_INFLIGHT = 16
+
+
+class _Throttle:
+    """Caps the SageMaker calls in flight and, optionally, the calls started per second.
+
+    The adaptive retry mode of the client backs off once SageMaker throttles; this gate
+    keeps fan-outs of tool calls from reaching the account's rate limits in the first place.
+    """
+
+    def __init__(self, max_inflight: int, max_rps: int = 0):
+        """Initialize the throttle.
+
+        Args:
+            max_inflight (int): The maximum number of calls in flight.
+            max_rps (int, optional): The maximum number of calls started per second.
+                Defaults to 0, which doesn't limit the rate.
+        """
+        self._semaphore = asyncio.Semaphore(max_inflight)
+        self._lock = asyncio.Lock()
+        self._min_interval = 1 / max_rps if max_rps else 0.0
+        self._last_call = 0.0
+
+    async def __aenter__(self) -> None:
+        await self._semaphore.acquire()
+        if not self._min_interval:
+            return
+        try:
+            async with self._lock:
+                delay = self._last_call + self._min_interval - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                self._last_call = time.monotonic()
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._semaphore.release()
+
+
+# asyncio primitives belong to one event loop, so each loop gets its own throttle.
+_THROTTLES: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _Throttle]' = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_throttle() -> _Throttle:
+    """Return the throttle of the running event loop, configured from the environment."""
+    loop = asyncio.get_running_loop()
+    throttle = _THROTTLES.get(loop)
+    if throttle is None:
+        throttle = _Throttle(
+            _get_env_int('SAGEMAKER_MCP_MAX_INFLIGHT', DEFAULT_MAX_INFLIGHT),
+            _get_env_int('SAGEMAKER_MCP_MAX_RPS', 0),
+        )
+        _THROTTLES[loop] = throttle
+    return throttle
+
+
+@functools.lru_cache(maxsize=1)
+def _get_executor() -> ThreadPoolExecutor:
+    """Return the thread pool shared by all helpers, sized by SAGEMAKER_MCP_MAX_WORKERS.
+
+    The pool never has more threads than the client has HTTP connections, since extra
+    threads would only open connections that urllib3 discards after each request.
+    """
+    max_workers = min(
+        _get_env_int('SAGEMAKER_MCP_MAX_WORKERS', DEFAULT_MAX_WORKERS),
+        get_client_config().max_pool_connections,
+    )
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='sagemaker-mcp')
+
+
+async def run_in_executor(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking call, such as a boto3 client method, on the shared thread pool.
+
+    Awaiting the call lets the event loop serve other tool invocations while the
+    request is in flight, so concurrent helpers overlap instead of running serially.
+    Calls wait for a slot of the throttle configured by SAGEMAKER_MCP_MAX_INFLIGHT and
+    SAGEMAKER_MCP_MAX_RPS first.
+
+    Args:
+        func (Callable[..., Any]): The blocking function to call.
+        *args: Positional arguments passed to the function.
+        **kwargs: Keyword arguments passed to the function.
+
+    Returns:
+        Any: The return value of the function.
+    """
+    loop = asyncio.get_running_loop()
+    async with _get_throttle():
+        return await loop.run_in_executor(
+            _get_executor(), functools.partial(func, *args, **kwargs)
+        )
+
+
+@functools.lru_cache(maxsize=1)
+def _get_hedge_after_ms() -> int:
+    """Get SAGEMAKER_MCP_HEDGE_AFTER_MS, read once per process until refresh_env() is called."""
+    return _get_env_int('SAGEMAKER_MCP_HEDGE_AFTER_MS', 0)
+
+
+async def run_hedged(func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run an idempotent blocking call, sending a second copy if the first is slow.
+
+    When SAGEMAKER_MCP_HEDGE_AFTER_MS is set and the call hasn't answered within that many
+    milliseconds, an identical call is started and the first successful response is
+    returned. This trims the latency tail of read-only calls at the cost of extra requests,
+    so it is off by default and must only be used for calls without side effects.
+
+    Args:
+        func (Callable[..., Any]): The blocking function to call.
+        *args: Positional arguments passed to the function.
+        **kwargs: Keyword arguments passed to the function.
+
+    Returns:
+        Any: The return value of the first call that succeeds.
+    """
+    hedge_after_ms = _get_hedge_after_ms()
+    first = asyncio.ensure_future(run_in_executor(func, *args, **kwargs))
+    if not hedge_after_ms:
+        return await first
+    pending = {first}
+    # Cancelled on the way out, including when the caller itself is cancelled, so no call
+    # keeps a throttle slot once its result is no longer wanted.
+    try:
+        done, pending = await asyncio.wait(pending, timeout=hedge_after_ms / 1000)
+        if done:
+            return first.result()
+        pending.add(asyncio.ensure_future(run_in_executor(func, *args, **kwargs)))
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+# Default number of SageMaker calls a batch helper keeps in flight at once.
+DEFAULT_BATCH_CONCURRENCY = 8
+
+
+async def gather_bounded(
+    func: Callable[[Any], Awaitable[Any]],
+    items: Iterable[Any],
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> List[Any]:
+    """Call an async function for every item, with at most `concurrency` calls in flight.
+
+    Exceptions are returned in place of results, so one failing item doesn't cancel
+    the rest of the batch.
+
+    Args:
+        func (Callable[[Any], Awaitable[Any]]): The async function to call for each item.
+        items (Iterable[Any]): The items to process.
+        concurrency (int): The maximum number of concurrent calls. Defaults to 8.
+
+    Returns:
+        List[Any]: The result or raised exception of each call, in the order of the items.
+    """
+    if concurrency < 1:
+        raise ValueError(f'concurrency must be a positive integer, got {concurrency}.')
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call(item):
+        async with semaphore:
+            return await func(item)
+
+    return await asyncio.gather(*(call(item) for item in items), return_exceptions=True)
+
+
+# Batches started with wait=False, referenced until done so they are not garbage collected.
+_BACKGROUND_TASKS: Set['asyncio.Task[Any]'] = set()
+
+
+def _log_background_batch(func_name: str, names: List[str], task: 'asyncio.Task[Any]') -> None:
+    """Log the failures of a batch that ran in the background."""
+    _BACKGROUND_TASKS.discard(task)
+    if task.cancelled():
+        return
+    for name, result in zip(names, task.result()):
+        if isinstance(result, BaseException):
+            logger.warning('{} failed for {}: {}', func_name, name, result)
+
+
+async def run_batch(
+    func: Callable[[str], Awaitable[Any]],
+    names: List[str],
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    wait: bool = True,
+) -> Dict[str, Optional[str]]:
+    """Run a single-resource stop or delete helper for many resources concurrently.
+
+    Args:
+        func (Callable[[str], Awaitable[Any]]): The helper to call with each resource name.
+        names (List[str]): The names of the resources.
+        concurrency (int): The maximum number of concurrent calls. Defaults to 8.
+        wait (bool): Whether to wait for the calls to finish. Defaults to True. With False,
+            the calls run in the background, their errors are only logged, and every name
+            maps to None.
+
+    Returns:
+        Dict[str, Optional[str]]: For each name, None if the call succeeded or the error message.
+    """
+    if not wait:
+        names = list(names)
+        task = asyncio.create_task(gather_bounded(func, names, concurrency))
+        _BACKGROUND_TASKS.add(task)
+        task.add_done_callback(functools.partial(_log_background_batch, func.__name__, names))
+        return dict.fromkeys(names)
+    results = await gather_bounded(func, names, concurrency)
+    return {
+        name: str(result) if isinstance(result, BaseException) else None
+        for name, result in zip(names, results)
+    }
+
+
+async def describe_batch(
+    func: Callable[[str], Awaitable[Dict[str, Any]]],
+    names: List[str],
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> Dict[str, Dict[str, Any]]:
+    """Run a single-resource describe helper for many resources concurrently.
+
+    Args:
+        func (Callable[[str], Awaitable[Dict[str, Any]]]): The helper to call with each name.
+        names (List[str]): The names of the resources.
+        concurrency (int): The maximum number of concurrent calls. Defaults to 8.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: For each name, the description of the resource, or
+            {'Error': message} if the call failed.
+    """
+    results = await gather_bounded(func, names, concurrency)
+    return {
+        name: {'Error': str(result)} if isinstance(result, BaseException) else result
+        for name, result in zip(names, results)
+    }
+
+
+# Error codes SageMaker returns when a caller exceeds its request rate.
+THROTTLING_ERROR_CODES = frozenset(
+    {'ThrottlingException', 'Throttling', 'TooManyRequestsException', 'RequestLimitExceeded'}
+)
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Tell whether an error comes from throttling, a server fault or the network.
+
+    Args:
+        error (BaseException): The error raised by a boto3 call.
+
+    Returns:
+        bool: True if the same call may succeed later, False otherwise.
+    """
+    if isinstance(error, (BotoConnectionError, HTTPClientError)):
+        return True
+    if isinstance(error, ClientError):
+        code = error.response.get('Error', {}).get('Code')
+        status = error.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0)
+        return code in THROTTLING_ERROR_CODES or status >= 500
+    return False
+
+
+# Error codes returned when a request was signed with expired or out-of-date credentials.
+CREDENTIAL_ERROR_CODES = frozenset(
+    {'ExpiredToken', 'ExpiredTokenException', 'InvalidSignatureException', 'RequestExpired'}
+)
+
+
+def is_credential_error(error: BaseException) -> bool:
+    """Tell whether an error comes from expired credentials or a stale request signature.
+
+    Errors raised while handling the boto3 error, such as the ValueError the tools
+    report failures with, are followed back to it.
+
+    Args:
+        error (BaseException): The error raised by a boto3 call.
+
+    Returns:
+        bool: True if the call may succeed with a freshly built client, False otherwise.
+    """
+    while error is not None:
+        if isinstance(error, ClientError):
+            return error.response.get('Error', {}).get('Code') in CREDENTIAL_ERROR_CODES
+        error = error.__cause__ or error.__context__
+    return False
+
+
+def retry_on_expired_credentials(
+    func: Callable[..., Awaitable[Any]],
+) -> Callable[..., Awaitable[Any]]:
+    """Retry an async call once with a new client when its credentials were rejected.
+
+    The server keeps its session and clients for its whole lifetime. If a request fails
+    because the credentials expired or the signature went stale, the session and clients
+    are rebuilt, unless a concurrent call already did, and the call is made once more.
+    SageMaker rejects such requests before acting on them, so retrying is safe for calls
+    with side effects too.
+
+    Args:
+        func (Callable[..., Awaitable[Any]]): The async function to wrap.
+
+    Returns:
+        Callable[..., Awaitable[Any]]: The wrapped function.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        generation = _SESSION_GENERATION
+        try:
+            return await func(*args, **kwargs)
+        except Exception as e:
+            if not is_credential_error(e):
+                raise
+            logger.warning('Credentials rejected by SageMaker, rebuilding the client: {}', e)
+            refresh_credentials(generation)
+        return await func(*args, **kwargs)
+
+    return wrapper
+
+
+def api_filters(**params: Any) -> Dict[str, Any]:
+    """Build the keyword arguments of an API call, leaving out the unset ones.
+
+    Args:
+        **params: The API parameters, None for the ones the caller didn't set.
+
+    Returns:
+        Dict[str, Any]: The parameters that are set.
+    """
+    return {name: value for name, value in params.items() if value is not None}
+
+
+def _project_path(value: Any, keys: List[str]) -> Tuple[bool, Any]:
+    """Extract one dotted path from a value, descending into every item of lists."""
+    if not keys:
+        return True, value
+    if isinstance(value, list):
+        return True, [_project_path(item, keys)[1] for item in value]
+    if isinstance(value, dict) and keys[0] in value:
+        found, inner = _project_path(value[keys[0]], keys[1:])
+        if found:
+            return True, {keys[0]: inner}
+    return False, {}
+
+
+def _merge(left: Any, right: Any) -> Any:
+    """Merge two projections of the same response."""
+    if isinstance(left, dict) and isinstance(right, dict):
+        merged = dict(left)
+        for key, value in right.items():
+            merged[key] = _merge(merged[key], value) if key in merged else value
+        return merged
+    if isinstance(left, list) and isinstance(right, list) and len(left) == len(right):
+        return [_merge(a, b) for a, b in zip(left, right)]
+    return right
+
+
+def project(response: Dict[str, Any], fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Keep only the requested fields of a describe response.
+
+    Fields are top-level keys or dotted paths to nested keys, e.g.
+    'ProductionVariants.CurrentInstanceCount'. Paths through a list apply to each item.
+    The '_stale' marker of cached fallback responses is always kept.
+
+    Args:
+        response (Dict[str, Any]): The describe response.
+        fields (List[str], optional): The fields to keep. Defaults to None, which keeps
+            the whole response.
+
+    Returns:
+        Dict[str, Any]: The response restricted to the fields it contains.
+    """
+    if not fields:
+        return response
+    projected: Dict[str, Any] = {}
+    for field in fields:
+        found, value = _project_path(response, field.split('.'))
+        if found:
+            projected = _merge(projected, value)
+    if '_stale' in response:
+        projected['_stale'] = response['_stale']
+    return projected
+
+
+# Largest page size accepted by the SageMaker list APIs.
+MAX_PAGE_SIZE = 100
+
+
+def _pagination_config(max_items: Optional[int]) -> Dict[str, int]:
+    """Build the botocore PaginationConfig for a list operation."""
+    pagination_config = {'PageSize': MAX_PAGE_SIZE}
+    if max_items:
+        pagination_config['MaxItems'] = max_items
+    return pagination_config
+
+
+def paginate(
+    client,
+    operation_name: str,
+    result_key: str,
+    max_items: Optional[int] = None,
+    **kwargs,
+) -> List[Dict[str, Any]]:
+    """Collect every item of a paginated SageMaker list operation.
+
+    Args:
+        client (boto3.client): The SageMaker client to use.
+        operation_name (str): The name of the list operation, e.g. 'list_endpoints'.
+        result_key (str): The key of the items in each response page, e.g. 'Endpoints'.
+        max_items (int, optional): The maximum number of items to return. Defaults to None,
+                                   which returns all items.
+        **kwargs: Additional parameters passed to the list operation.
+
+    Returns:
+        List[Dict[str, Any]]: The items of all pages.
+    """
+    paginator = client.get_paginator(operation_name)
+    items = []
+    for page in paginator.paginate(PaginationConfig=_pagination_config(max_items), **kwargs):
+        items.extend(page.get(result_key, []))
+    return items
+
+
+async def iterate(
+    client,
+    operation_name: str,
+    result_key: str,
+    max_items: Optional[int] = None,
+    **kwargs,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Lazily yield the items of a paginated SageMaker list operation.
+
+    Pages are fetched one at a time on the shared thread pool, and only when the
+    previous page has been consumed, so callers that stop early never request the
+    remaining pages.
+
+    Args:
+        client (boto3.client): The SageMaker client to use.
+        operation_name (str): The name of the list operation, e.g. 'list_training_jobs'.
+        result_key (str): The key of the items in each response page.
+        max_items (int, optional): The maximum number of items to yield. Defaults to None,
+                                   which yields all items.
+        **kwargs: Additional parameters passed to the list operation.
+
+    Yields:
+        Dict[str, Any]: The items of each page, in order.
+    """
+    paginator = client.get_paginator(operation_name)
+    pages = iter(paginator.paginate(PaginationConfig=_pagination_config(max_items), **kwargs))
+    while True:
+        page = await run_in_executor(next, pages, None)
+        if page is None:
+            return
+        for item in page.get(result_key, []):
+            yield item
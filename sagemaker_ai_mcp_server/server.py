@@ -1,9 +1,14 @@
 """The main file for the SageMaker AI MCP Server."""
 
+import asyncio
+import os
+import sys
+from contextlib import asynccontextmanager
 from loguru import logger
 from mcp.server.fastmcp import FastMCP
 from pydantic import Field
 from sagemaker_ai_mcp_server.helpers.apps import (
+    AppType,
     create_app,
     create_presigned_notebook_instance_url,
     delete_app,
@@ -23,6 +28,7 @@ from sagemaker_ai_mcp_server.helpers.endpoints import (
     delete_endpoint_config,
     describe_endpoint,
     describe_endpoint_config,
+    list_all_endpoints,
     list_endpoint_configs,
     list_endpoints,
 )
@@ -31,11 +37,15 @@ from sagemaker_ai_mcp_server.helpers.jobs import (
     describe_processing_job,
     describe_training_job,
     describe_transform_job,
+    list_all_jobs,
     list_inference_recommendations_job_steps,
     list_inference_recommendations_jobs,
     list_processing_jobs,
+    list_processing_jobs_with_details,
     list_training_jobs,
+    list_training_jobs_with_details,
     list_transform_jobs,
+    list_transform_jobs_with_details,
     stop_inference_recommendations_job,
     stop_processing_job,
     stop_training_job,
@@ -63,15 +73,24 @@ from sagemaker_ai_mcp_server.helpers.pipelines import (
     describe_pipeline,
     describe_pipeline_definition_for_execution,
     describe_pipeline_execution,
+    digest_definition,
     list_pipeline_execution_steps,
     list_pipeline_executions,
+    list_pipeline_executions_with_details,
     list_pipeline_parameters_for_execution,
     list_pipelines,
     start_pipeline_execution,
     stop_pipeline_execution,
 )
 from sagemaker_ai_mcp_server.helpers.profiles_spaces import list_spaces, list_user_profiles
-from typing import Annotated, Any, Dict, List, Literal
+from sagemaker_ai_mcp_server.helpers.utils import (
+    prime_connection,
+    project,
+    retry_on_expired_credentials,
+    shutdown,
+    warmup,
+)
+from typing import Annotated, Any, AsyncIterator, Dict, List, Literal, Optional
 
 
 SERVER_INSTRUCTIONS = """
@@ -95,19 +114,24 @@ SageMaker AI MCP server has tools to manage SageMaker resources, including:
 - SageMaker AI Apps
 
 ## List of Tools for SageMaker AI Endpoints and Endpoint Configurations
-- list_endpoints_sagemaker (List all SageMaker AI Endpoints)
-- list_endpoint_configs_sagemaker (List all SageMaker AI Endpoint Configurations)
+- list_endpoints_sagemaker (List the most recent SageMaker AI Endpoints, up to max_results)
+- list_endpoint_configs_sagemaker (List the most recent SageMaker AI Endpoint Configurations, up to max_results)
+- list_all_endpoints_sagemaker (List the most recent SageMaker AI Endpoints and Endpoint Configurations in one call, up to max_results of each)
 - describe_endpoint_sagemaker (Describe a SageMaker AI Endpoint)
 - describe_endpoint_config_sagemaker (Describe a SageMaker AI Endpoint Configuration)
 - delete_endpoint_sagemaker (Delete a SageMaker AI Endpoint)
 - delete_endpoint_config_sagemaker (Delete a SageMaker AI Endpoint Configuration)
 
 ## List of Tools for SageMaker AI Jobs
-- list_training_jobs_sagemaker (List all SageMaker AI Training Jobs)
-- list_processing_jobs_sagemaker (List all SageMaker AI Processing Jobs)
-- list_transform_jobs_sagemaker (List all SageMaker AI Transform Jobs)
-- list_inference_recommender_jobs_sagemaker (List all SageMaker AI Inference Recommender Jobs)
+- list_training_jobs_sagemaker (List the most recent SageMaker AI Training Jobs, up to max_results)
+- list_processing_jobs_sagemaker (List the most recent SageMaker AI Processing Jobs, up to max_results)
+- list_transform_jobs_sagemaker (List the most recent SageMaker AI Transform Jobs, up to max_results)
+- list_training_jobs_with_details_sagemaker (List the most recent SageMaker AI Training Jobs with their details)
+- list_processing_jobs_with_details_sagemaker (List the most recent SageMaker AI Processing Jobs with their details)
+- list_transform_jobs_with_details_sagemaker (List the most recent SageMaker AI Transform Jobs with their details)
+- list_inference_recommender_jobs_sagemaker (List the most recent SageMaker AI Inference Recommender Jobs, up to max_results)
 - list_inference_recommender_job_steps_sagemaker (List all steps for a SageMaker AI Inference Recommender Job)
+- list_all_jobs_sagemaker (List the most recent SageMaker AI Training, Processing, Transform and Inference Recommender Jobs in one call, up to max_results of each)
 - describe_training_job_sagemaker (Describe a SageMaker AI Training Job)
 - describe_processing_job_sagemaker (Describe a SageMaker AI Processing Job)
 - describe_transform_job_sagemaker (Describe a SageMaker AI Transform Job)
@@ -118,8 +142,9 @@ SageMaker AI MCP server has tools to manage SageMaker resources, including:
 - stop_inference_recommender_job_sagemaker (Stop a SageMaker AI Inference Recommender Job)
 
 ## List of Tools for SageMaker AI Pipelines
-- list_pipelines_sagemaker (List all SageMaker AI Pipelines)
-- list_pipeline_executions_sagemaker (List all Pipeline Executions for a SageMaker AI Pipeline)
+- list_pipelines_sagemaker (List the most recent SageMaker AI Pipelines, up to max_results)
+- list_pipeline_executions_sagemaker (List the most recent Pipeline Executions of a SageMaker AI Pipeline, up to max_results)
+- list_pipeline_executions_with_details_sagemaker (List the most recent Pipeline Executions of a SageMaker AI Pipeline with their details)
 - list_pipeline_execution_steps_sagemaker (List all steps for a SageMaker AI Pipeline Execution)
 - list_pipeline_parameters_for_execution_sagemaker (List all parameters for a SageMaker AI Pipeline Execution)
 - describe_pipeline_sagemaker (Describe a SageMaker AI Pipeline)
@@ -149,12 +174,12 @@ SageMaker AI MCP server has tools to manage SageMaker resources, including:
 - delete_domain_sagemaker (Delete a SageMaker AI Domain)
 
 ## List of Tools for SageMaker AI Models
-- list_models_sagemaker (List all SageMaker AI Models)
+- list_models_sagemaker (List the most recent SageMaker AI Models, up to max_results)
 - describe_model_sagemaker (Describe a SageMaker AI Model)
 - delete_model_sagemaker (Delete a SageMaker AI Model)
 
 ## List of Tools for SageMaker AI Model Cards
-- list_model_cards_sagemaker (List all SageMaker AI Model Cards)
+- list_model_cards_sagemaker (List the most recent SageMaker AI Model Cards, up to max_results)
 - list_model_card_export_jobs_sagemaker (List all SageMaker AI Model Card Export Jobs)
 - list_model_card_versions_sagemaker (List all versions of a SageMaker AI Model Card)
 - describe_model_card_sagemaker (Describe a SageMaker AI Model Card)
@@ -170,9 +195,31 @@ SageMaker AI MCP server has tools to manage SageMaker resources, including:
 - delete_app_image_config_sagemaker (Delete a SageMaker AI App Image Config)
 """
 
+
+@asynccontextmanager
+async def server_lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Warm up the SageMaker client before serving.
+
+    The lifespan is entered for every session over HTTP transports, while the client and
+    thread pool are shared by the whole process, so they are released by main() instead.
+    The first connection is opened in the background, so the MCP handshake doesn't wait
+    on the network.
+
+    Args:
+        server (FastMCP): The MCP server.
+    """
+    await asyncio.to_thread(warmup)
+    priming = asyncio.ensure_future(prime_connection())
+    try:
+        yield
+    finally:
+        priming.cancel()
+
+
 mcp = FastMCP(
     'sagemaker-ai-mcp-server',
     instructions=SERVER_INSTRUCTIONS,
+    lifespan=server_lifespan,
     dependencies=[
         'pydantic',
         'loguru',
@@ -183,16 +230,34 @@ mcp = FastMCP(
 # ---SageMaker Endpoints Tools---
 
 
-@mcp.tool(name='list_endpoints_sagemaker', description='List all SageMaker Endpoints')
-async def list_endpoints_sagemaker() -> Dict[str, List]:
-    """Get a list of all SageMaker Endpoint.
+@mcp.tool(
+    name='list_endpoints_sagemaker',
+    description='List the most recent SageMaker Endpoints, up to max_results (default 100)',
+)
+@retry_on_expired_credentials
+async def list_endpoints_sagemaker(
+    name_contains: Annotated[
+        Optional[str],
+        Field(description='Only return Endpoints whose name contains this string'),
+    ] = None,
+    max_results: Annotated[
+        int, Field(description='The maximum number of Endpoints to return', ge=1)
+    ] = 100,
+) -> Dict[str, List]:
+    """List the most recent SageMaker Endpoints, up to `max_results` of them.
 
     ## Usage
 
-    Use this tool to retrieve a list of all SageMaker Endpoints in your account
+    Use this tool to retrieve a list of the SageMaker Endpoints in your account
     in the current region. This is typically used first to see what endpoints
     are available before performing operations on them.
 
+    Results are returned most recent first and capped at `max_results` (100 by
+    default). A result with exactly `max_results` items may be incomplete, so raise
+    `max_results` or narrow the query to see the rest.
+
+    Filter by name with `name_contains`, applied by SageMaker.
+
     ## Example
 
     ```python
@@ -204,13 +269,13 @@ async def list_endpoints_sagemaker() -> Dict[str, List]:
 
     The output is a dictionary with the following structure:
     - 'endpoints': A list of dictionaries, each representing a SageMaker
-      Endpoint with its details.
+      Endpoint with its details, at most `max_results` of them.
 
     ## Returns
     A dictionary containing a list of SageMaker Endpoints.
     """
     try:
-        endpoints = await list_endpoints()
+        endpoints = await list_endpoints(max_results, name_contains)
         return {'endpoints': endpoints}
     except Exception as e:
         logger.error(f'Error listing SageMaker endpoints: {e}')
@@ -219,17 +284,33 @@ async def list_endpoints_sagemaker() -> Dict[str, List]:
 
 @mcp.tool(
     name='list_endpoint_configs_sagemaker',
-    description='List all SageMaker Endpoint Configurations',
+    description='List the most recent SageMaker Endpoint Configurations'
+    ', up to max_results (default 100)',
 )
-async def list_endpoint_configs_sagemaker() -> Dict[str, List]:
-    """Get a list of all SageMaker Endpoint Configurations.
+@retry_on_expired_credentials
+async def list_endpoint_configs_sagemaker(
+    name_contains: Annotated[
+        Optional[str],
+        Field(description='Only return Endpoint Configurations whose name contains this string'),
+    ] = None,
+    max_results: Annotated[
+        int, Field(description='The maximum number of Endpoint Configurations to return', ge=1)
+    ] = 100,
+) -> Dict[str, List]:
+    """List the most recent SageMaker Endpoint Configurations, up to `max_results` of them.
 
     ## Usage
 
-    Use this tool to retrieve a list of all SageMaker Endpoint Configurations
+    Use this tool to retrieve a list of the SageMaker Endpoint Configurations
     in your account in the current region. This helps you identify available
     endpoint configurations before performing operations on them.
 
+    Results are returned most recent first and capped at `max_results` (100 by
+    default). A result with exactly `max_results` items may be incomplete, so raise
+    `max_results` or narrow the query to see the rest.
+
+    Filter by name with `name_contains`, applied by SageMaker.
+
     ## Example
 
     ```python
@@ -241,24 +322,85 @@ async def list_endpoint_configs_sagemaker() -> Dict[str, List]:
 
     The output is a dictionary with the following structure:
     - 'endpoint_configs': A list of dictionaries, each representing a SageMaker
-      Endpoint Configuration with its details.
+      Endpoint Configuration with its details, at most `max_results` of them.
 
     ## Returns
     A dictionary containing a list of SageMaker Endpoint Configurations.
     """
     try:
-        configs = await list_endpoint_configs()
+        configs = await list_endpoint_configs(max_results, name_contains)
         return {'endpoint_configs': configs}
     except Exception as e:
         logger.error(f'Error listing endpoint configurations: {e}')
         raise ValueError(f'Failed to list endpoint configs: {e}')
 
 
+@mcp.tool(
+    name='list_all_endpoints_sagemaker',
+    description='List the most recent SageMaker Endpoints and Endpoint Configurations in one '
+    'call, up to max_results (default 100) of each',
+)
+@retry_on_expired_credentials
+async def list_all_endpoints_sagemaker(
+    max_results: Annotated[
+        int,
+        Field(
+            description='The maximum number of Endpoints and of Endpoint Configurations to return',
+            ge=1,
+        ),
+    ] = 100,
+) -> Dict[str, List]:
+    """List the most recent SageMaker Endpoints and Endpoint Configurations at once.
+
+    ## Usage
+
+    Use this tool when you need both the Endpoints and the Endpoint Configurations
+    in your account in the current region. Both lists are fetched concurrently, so
+    this is faster than calling the two list tools one after the other.
+
+    Each list is returned most recent first and capped at `max_results` (100 by
+    default). A list with exactly `max_results` items may be incomplete, so raise
+    `max_results` or use the dedicated list tools to see the rest.
+
+    ## Example
+
+    ```python
+    inventory = await list_all_endpoints_sagemaker()
+    print(inventory['Endpoints'])
+    ```
+
+    ## Output Format
+
+    The output is a dictionary with the following structure:
+    - 'Endpoints': A list of dictionaries, each representing a SageMaker Endpoint,
+      at most `max_results` of them.
+    - 'EndpointConfigs': A list of dictionaries, each representing a SageMaker
+      Endpoint Configuration, at most `max_results` of them.
+
+    ## Returns
+    A dictionary containing the SageMaker Endpoints and Endpoint Configurations.
+    """
+    try:
+        return await list_all_endpoints(max_results)
+    except Exception as e:
+        logger.error(f'Error listing endpoints and endpoint configurations: {e}')
+        raise ValueError(f'Failed to list endpoints and endpoint configs: {e}')
+
+
 @mcp.tool(name='describe_endpoint_sagemaker', description='Describe a SageMaker Endpoint')
+@retry_on_expired_credentials
 async def describe_endpoint_sagemaker(
     endpoint_name: Annotated[
         str, Field(description='The name of the SageMaker Endpoint to describe')
     ],
+    fields: Annotated[
+        Optional[List[str]],
+        Field(
+            description='Fields to return, as top-level names or dotted paths, e.g. '
+            'EndpointStatus and ProductionVariants.CurrentInstanceCount. Returns '
+            'every field when omitted'
+        ),
+    ] = None,
 ) -> Dict[str, Any]:
     """Describe a specified SageMaker Endpoint.
 
@@ -272,20 +414,22 @@ async def describe_endpoint_sagemaker(
 
     ```python
     details = await describe_endpoint_sagemaker(endpoint_name='my-endpoint')
-    print(details)
+    status = await describe_endpoint_sagemaker(
+        endpoint_name='my-endpoint', fields=['EndpointStatus', 'FailureReason']
+    )
     ```
 
     ## Output Format
 
     The output is a dictionary containing all the details of the SageMaker
-    Endpoint.
+    Endpoint, or only the requested fields when `fields` is given.
 
     ## Returns
     A dictionary containing the endpoint details.
     """
     try:
         endpoint_details = await describe_endpoint(endpoint_name)
-        return {'endpoint_details': endpoint_details}
+        return {'endpoint_details': project(endpoint_details, fields)}
     except Exception as e:
         logger.error(f'Error describing endpoint {endpoint_name}: {e}')
         raise ValueError(f'Failed to describe endpoint {endpoint_name}: {e}')
@@ -295,6 +439,7 @@ async def describe_endpoint_sagemaker(
     name='describe_endpoint_config_sagemaker',
     description='Describe a SageMaker Endpoint Configuration',
 )
+@retry_on_expired_credentials
 async def describe_endpoint_config_sagemaker(
     endpoint_config_name: Annotated[
         str, Field(description='The name of the SageMaker Endpoint Configuration to describe')
@@ -336,6 +481,7 @@ async def describe_endpoint_config_sagemaker(
 
 
 @mcp.tool(name='delete_endpoint_sagemaker', description='Delete a SageMaker Endpoint')
+@retry_on_expired_credentials
 async def delete_endpoint_sagemaker(
     endpoint_name: Annotated[
         str, Field(description='The name of the SageMaker Endpoint to delete')
@@ -374,6 +520,7 @@ async def delete_endpoint_sagemaker(
     name='delete_endpoint_config_sagemaker',
     description='Delete a SageMaker Endpoint Configuration',
 )
+@retry_on_expired_credentials
 async def delete_endpoint_config_sagemaker(
     endpoint_config_name: Annotated[
         str, Field(description='The name of the SageMaker Endpoint Configuration to delete')
@@ -413,16 +560,34 @@ async def delete_endpoint_config_sagemaker(
 # ---SageMaker Jobs Tools---
 
 
-@mcp.tool(name='list_training_jobs_sagemaker', description='List SageMaker Training Jobs')
-async def list_training_jobs_sagemaker() -> Dict[str, List]:
-    """List all SageMaker Training Jobs.
+@mcp.tool(
+    name='list_training_jobs_sagemaker',
+    description='List the most recent SageMaker Training Jobs, up to max_results (default 100)',
+)
+@retry_on_expired_credentials
+async def list_training_jobs_sagemaker(
+    name_contains: Annotated[
+        Optional[str],
+        Field(description='Only return Training Jobs whose name contains this string'),
+    ] = None,
+    max_results: Annotated[
+        int, Field(description='The maximum number of Training Jobs to return', ge=1)
+    ] = 100,
+) -> Dict[str, List]:
+    """List the most recent SageMaker Training Jobs, up to `max_results` of them.
 
     ## Usage
 
-    Use this tool to retrieve a list of all SageMaker Training Jobs in your
+    Use this tool to retrieve a list of the SageMaker Training Jobs in your
     account in the current region. This is typically used to see what training
     jobs are available before performing operations on them.
 
+    Results are returned most recent first and capped at `max_results` (100 by
+    default). A result with exactly `max_results` items may be incomplete, so raise
+    `max_results` or narrow the query to see the rest.
+
+    Filter by name with `name_contains`, applied by SageMaker.
+
     ## Example
 
     ```python
@@ -434,29 +599,47 @@ async def list_training_jobs_sagemaker() -> Dict[str, List]:
 
     The output is a dictionary with the following structure:
     - 'training_jobs': A list of dictionaries, each representing a SageMaker
-      Training Job with its details.
+      Training Job with its details, at most `max_results` of them.
 
     ## Returns
     A dictionary containing a list of SageMaker Training Jobs.
     """
     try:
-        jobs = await list_training_jobs()
+        jobs = await list_training_jobs(max_results, name_contains=name_contains)
         return {'training_jobs': jobs}
     except Exception as e:
         logger.error(f'Error listing training jobs: {e}')
         raise ValueError(f'Failed to list training jobs: {e}')
 
 
-@mcp.tool(name='list_processing_jobs_sagemaker', description='List SageMaker Processing Jobs')
-async def list_processing_jobs_sagemaker() -> Dict[str, List]:
-    """List all SageMaker Processing Jobs.
+@mcp.tool(
+    name='list_processing_jobs_sagemaker',
+    description='List the most recent SageMaker Processing Jobs, up to max_results (default 100)',
+)
+@retry_on_expired_credentials
+async def list_processing_jobs_sagemaker(
+    name_contains: Annotated[
+        Optional[str],
+        Field(description='Only return Processing Jobs whose name contains this string'),
+    ] = None,
+    max_results: Annotated[
+        int, Field(description='The maximum number of Processing Jobs to return', ge=1)
+    ] = 100,
+) -> Dict[str, List]:
+    """List the most recent SageMaker Processing Jobs, up to `max_results` of them.
 
     ## Usage
 
-    Use this tool to retrieve a list of all SageMaker Processing Jobs in your
+    Use this tool to retrieve a list of the SageMaker Processing Jobs in your
     account in the current region. This is typically used to see what processing
     jobs are available before performing operations on them.
 
+    Results are returned most recent first and capped at `max_results` (100 by
+    default). A result with exactly `max_results` items may be incomplete, so raise
+    `max_results` or narrow the query to see the rest.
+
+    Filter by name with `name_contains`, applied by SageMaker.
+
     ## Example
 
     ```python
@@ -468,29 +651,47 @@ async def list_processing_jobs_sagemaker() -> Dict[str, List]:
 
     The output is a dictionary with the following structure:
     - 'processing_jobs': A list of dictionaries, each representing a SageMaker
-      Processing Job with its details.
+      Processing Job with its details, at most `max_results` of them.
 
     ## Returns
     A dictionary containing a list of SageMaker Processing Jobs.
     """
     try:
-        jobs = await list_processing_jobs()
+        jobs = await list_processing_jobs(max_results, name_contains=name_contains)
         return {'processing_jobs': jobs}
     except Exception as e:
         logger.error(f'Error listing processing jobs: {e}')
         raise ValueError(f'Failed to list processing jobs: {e}')
 
 
-@mcp.tool(name='list_transform_jobs_sagemaker', description='List SageMaker Transform Jobs')
-async def list_transform_jobs_sagemaker() -> Dict[str, List]:
-    """List all SageMaker Transform Jobs.
+@mcp.tool(
+    name='list_transform_jobs_sagemaker',
+    description='List the most recent SageMaker Transform Jobs, up to max_results (default 100)',
+)
+@retry_on_expired_credentials
+async def list_transform_jobs_sagemaker(
+    name_contains: Annotated[
+        Optional[str],
+        Field(description='Only return Transform Jobs whose name contains this string'),
+    ] = None,
+    max_results: Annotated[
+        int, Field(description='The maximum number of Transform Jobs to return', ge=1)
+    ] = 100,
+) -> Dict[str, List]:
+    """List the most recent SageMaker Transform Jobs, up to `max_results` of them.
 
     ## Usage
 
-    Use this tool to retrieve a list of all SageMaker Transform Jobs in your
+    Use this tool to retrieve a list of the SageMaker Transform Jobs in your
     account in the current region. This is typically used to see what transform
     jobs are available before performing operations on them.
 
+    Results are returned most recent first and capped at `max_results` (100 by
+    default). A result with exactly `max_results` items may be incomplete, so raise
+    `max_results` or narrow the query to see the rest.
+
+    Filter by name with `name_contains`, applied by SageMaker.
+
     ## Example
 
     ```python
@@ -502,32 +703,176 @@ async def list_transform_jobs_sagemaker() -> Dict[str, List]:
 
     The output is a dictionary with the following structure:
     - 'transform_jobs': A list of dictionaries, each representing a SageMaker
-      Transform Job with its details.
+      Transform Job with its details, at most `max_results` of them.
 
     ## Returns
     A dictionary containing a list of SageMaker Transform Jobs.
     """
     try:
-        jobs = await list_transform_jobs()
+        jobs = await list_transform_jobs(max_results, name_contains=name_contains)
         return {'transform_jobs': jobs}
     except Exception as e:
         logger.error(f'Error listing transform jobs: {e}')
         raise ValueError(f'Failed to list transform jobs: {e}')
 
 
+@mcp.tool(
+    name='list_training_jobs_with_details_sagemaker',
+    description='List the most recent SageMaker Training Jobs with their full details',
+)
+@retry_on_expired_credentials
+async def list_training_jobs_with_details_sagemaker(
+    max_results: Annotated[
+        int, Field(description='The maximum number of Training Jobs to describe', ge=1)
+    ] = 20,
+) -> Dict[str, Any]:
+    """List the most recent SageMaker Training Jobs and describe each of them.
+
+    ## Usage
+
+    Use this tool instead of calling list_training_jobs_sagemaker and then
+    describe_training_job_sagemaker for every job. The describe calls are sent
+    concurrently, so all the details arrive in about the time of a single call.
+
+    ## Example
+
+    ```python
+    jobs = await list_training_jobs_with_details_sagemaker(max_results=10)
+    print(jobs)
+    ```
+
+    ## Output Format
+
+    The output is a dictionary with the following structure:
+    - 'training_jobs': A dictionary mapping each Training Job name to its details,
+      or to {'Error': message} if it could not be described.
+
+    ## Returns
+    A dictionary containing the details of the most recent Training Jobs.
+    """
+    try:
+        jobs = await list_training_jobs_with_details(max_results)
+        return {'training_jobs': jobs}
+    except Exception as e:
+        logger.error(f'Error listing training jobs with details: {e}')
+        raise ValueError(f'Failed to list training jobs with details: {e}')
+
+
+@mcp.tool(
+    name='list_processing_jobs_with_details_sagemaker',
+    description='List the most recent SageMaker Processing Jobs with their full details',
+)
+@retry_on_expired_credentials
+async def list_processing_jobs_with_details_sagemaker(
+    max_results: Annotated[
+        int, Field(description='The maximum number of Processing Jobs to describe', ge=1)
+    ] = 20,
+) -> Dict[str, Any]:
+    """List the most recent SageMaker Processing Jobs and describe each of them.
+
+    ## Usage
+
+    Use this tool instead of calling list_processing_jobs_sagemaker and then
+    describe_processing_job_sagemaker for every job. The describe calls are sent
+    concurrently, so all the details arrive in about the time of a single call.
+
+    ## Example
+
+    ```python
+    jobs = await list_processing_jobs_with_details_sagemaker(max_results=10)
+    print(jobs)
+    ```
+
+    ## Output Format
+
+    The output is a dictionary with the following structure:
+    - 'processing_jobs': A dictionary mapping each Processing Job name to its details,
+      or to {'Error': message} if it could not be described.
+
+    ## Returns
+    A dictionary containing the details of the most recent Processing Jobs.
+    """
+    try:
+        jobs = await list_processing_jobs_with_details(max_results)
+        return {'processing_jobs': jobs}
+    except Exception as e:
+        logger.error(f'Error listing processing jobs with details: {e}')
+        raise ValueError(f'Failed to list processing jobs with details: {e}')
+
+
+@mcp.tool(
+    name='list_transform_jobs_with_details_sagemaker',
+    description='List the most recent SageMaker Transform Jobs with their full details',
+)
+@retry_on_expired_credentials
+async def list_transform_jobs_with_details_sagemaker(
+    max_results: Annotated[
+        int, Field(description='The maximum number of Transform Jobs to describe', ge=1)
+    ] = 20,
+) -> Dict[str, Any]:
+    """List the most recent SageMaker Transform Jobs and describe each of them.
+
+    ## Usage
+
+    Use this tool instead of calling list_transform_jobs_sagemaker and then
+    describe_transform_job_sagemaker for every job. The describe calls are sent
+    concurrently, so all the details arrive in about the time of a single call.
+
+    ## Example
+
+    ```python
+    jobs = await list_transform_jobs_with_details_sagemaker(max_results=10)
+    print(jobs)
+    ```
+
+    ## Output Format
+
+    The output is a dictionary with the following structure:
+    - 'transform_jobs': A dictionary mapping each Transform Job name to its details,
+      or to {'Error': message} if it could not be described.
+
+    ## Returns
+    A dictionary containing the details of the most recent Transform Jobs.
+    """
+    try:
+        jobs = await list_transform_jobs_with_details(max_results)
+        return {'transform_jobs': jobs}
+    except Exception as e:
+        logger.error(f'Error listing transform jobs with details: {e}')
+        raise ValueError(f'Failed to list transform jobs with details: {e}')
+
+
 @mcp.tool(
     name='list_inference_recommendations_jobs_sagemaker',
-    description='List all SageMaker Inference Recommender Jobs',
+    description='List the most recent SageMaker Inference Recommender Jobs, up to max_results '
+    '(default 100)',
 )
-async def list_inference_recommendations_jobs_sagemaker() -> Dict[str, List]:
-    """List all SageMaker Inference Recommender Jobs.
+@retry_on_expired_credentials
+async def list_inference_recommendations_jobs_sagemaker(
+    name_contains: Annotated[
+        Optional[str],
+        Field(
+            description='Only return Inference Recommender Jobs whose name contains this string'
+        ),
+    ] = None,
+    max_results: Annotated[
+        int, Field(description='The maximum number of Inference Recommender Jobs to return', ge=1)
+    ] = 100,
+) -> Dict[str, List]:
+    """List the most recent SageMaker Inference Recommender Jobs, up to `max_results` of them.
 
     ## Usage
 
-    Use this tool to retrieve a list of all SageMaker Inference Recommender Jobs
+    Use this tool to retrieve a list of the SageMaker Inference Recommender Jobs
     in your account in the current region. This is typically used to see what
     inference recommender jobs are available before performing operations on them.
 
+    Results are returned most recent first and capped at `max_results` (100 by
+    default). A result with exactly `max_results` items may be incomplete, so raise
+    `max_results` or narrow the query to see the rest.
+
+    Filter by name with `name_contains`, applied by SageMaker.
+
     ## Example
 
     ```python
@@ -539,23 +884,75 @@ async def list_inference_recommendations_jobs_sagemaker() -> Dict[str, List]:
 
     The output is a dictionary with the following structure:
     - 'inference_recommendations_jobs': A list of dictionaries, each representing
-      a SageMaker Inference Recommender Job with its details.
+      a SageMaker Inference Recommender Job with its details, at most `max_results`
+      of them.
 
     ## Returns
     A dictionary containing a list of SageMaker Inference Recommender Jobs.
     """
     try:
-        jobs = await list_inference_recommendations_jobs()
+        jobs = await list_inference_recommendations_jobs(max_results, name_contains)
         return {'inference_recommendations_jobs': jobs}
     except Exception as e:
         logger.error(f'Error listing inference recommender jobs: {e}')
         raise ValueError(f'Failed to list inference recommender jobs: {e}')
 
 
+@mcp.tool(
+    name='list_all_jobs_sagemaker',
+    description='List the most recent SageMaker Training, Processing, Transform and Inference '
+    'Recommender Jobs, up to max_results (default 100) of each',
+)
+@retry_on_expired_credentials
+async def list_all_jobs_sagemaker(
+    max_results: Annotated[
+        int, Field(description='The maximum number of Jobs of each type to return', ge=1)
+    ] = 100,
+) -> Dict[str, List]:
+    """List the most recent SageMaker Jobs of every type at once.
+
+    ## Usage
+
+    Use this tool when you need an inventory of the SageMaker Jobs in your
+    account in the current region. The four job lists are fetched concurrently,
+    so this is faster than calling each list tool in turn.
+
+    Each list is returned most recent first and capped at `max_results` (100 by
+    default). A list with exactly `max_results` items may be incomplete, so raise
+    `max_results` or use the dedicated list tools to see the rest.
+
+    ## Example
+
+    ```python
+    jobs = await list_all_jobs_sagemaker()
+    print(jobs['TrainingJobs'])
+    ```
+
+    ## Output Format
+
+    The output is a dictionary with the following structure:
+    - 'TrainingJobs': A list of SageMaker Training Jobs.
+    - 'ProcessingJobs': A list of SageMaker Processing Jobs.
+    - 'TransformJobs': A list of SageMaker Transform Jobs.
+    - 'InferenceRecommendationsJobs': A list of SageMaker Inference Recommender Jobs.
+
+    Each list holds at most `max_results` jobs.
+
+    ## Returns
+    A dictionary containing the SageMaker Jobs of each type.
+    """
+    try:
+        return await list_all_jobs(max_results)
+    except Exception as e:
+        logger.error(f'Error listing SageMaker jobs: {e}')
+        raise ValueError(f'Failed to list jobs: {e}')
+
+
 @mcp.tool(
     name='list_inference_recommendations_job_steps_sagemaker',
     description='List steps for a SageMaker Inference Recommender Job',
 )
+@retry_on_expired_credentials
 async def list_inference_recommendations_job_steps_sagemaker(
     job_name: Annotated[
         str,
@@ -594,10 +991,19 @@ async def list_inference_recommendations_job_steps_sagemaker(
 
 
 @mcp.tool(name='describe_training_job_sagemaker', description='Describe a SageMaker Training Job')
+@retry_on_expired_credentials
 async def describe_training_job_sagemaker(
     training_job_name: Annotated[
         str, Field(description='The name of the SageMaker Training Job to describe')
     ],
+    fields: Annotated[
+        Optional[List[str]],
+        Field(
+            description='Fields to return, as top-level names or dotted paths, e.g. '
+            'TrainingJobStatus and ResourceConfig.InstanceType. Returns every field '
+            'when omitted'
+        ),
+    ] = None,
 ) -> Dict[str, Any]:
     """Describe a specified SageMaker Training Job.
 
@@ -611,20 +1017,22 @@ async def describe_training_job_sagemaker(
 
     ```python
     job_details = await describe_training_job_sagemaker(training_job_name='my-training-job')
-    print(job_details)
+    status = await describe_training_job_sagemaker(
+        training_job_name='my-training-job', fields=['TrainingJobStatus', 'SecondaryStatus']
+    )
     ```
 
     ## Output Format
 
     The output is a dictionary containing all the details of the SageMaker
-    Training Job.
+    Training Job, or only the requested fields when `fields` is given.
 
     ## Returns
     A dictionary containing the training job details.
     """
     try:
         job_details = await describe_training_job(training_job_name)
-        return {'training_job_details': job_details}
+        return {'training_job_details': project(job_details, fields)}
     except Exception as e:
         logger.error(f'Error describing training job {training_job_name}: {e}')
         raise ValueError(f'Failed to describe training job {training_job_name}: {e}')
@@ -633,6 +1041,7 @@ async def describe_training_job_sagemaker(
 @mcp.tool(
     name='describe_processing_job_sagemaker', description='Describe a SageMaker Processing Job'
 )
+@retry_on_expired_credentials
 async def describe_processing_job_sagemaker(
     processing_job_name: Annotated[
         str, Field(description='The name of the SageMaker Processing Job to describe')
@@ -672,6 +1081,7 @@ async def describe_processing_job_sagemaker(
 @mcp.tool(
     name='describe_transform_job_sagemaker', description='Describe a SageMaker Transform Job'
 )
+@retry_on_expired_credentials
 async def describe_transform_job_sagemaker(
     transform_job_name: Annotated[
         str, Field(description='The name of the SageMaker Transform Job to describe')
@@ -712,6 +1122,7 @@ async def describe_transform_job_sagemaker(
     name='describe_inference_recommendations_job_sagemaker',
     description='Describe a SageMaker Inference Recommender Job',
 )
+@retry_on_expired_credentials
 async def describe_inference_recommendations_job_sagemaker(
     job_name: Annotated[
         str, Field(description='The name of the SageMaker Inference Recommender Job to describe')
@@ -751,6 +1162,7 @@ async def describe_inference_recommendations_job_sagemaker(
 
 
 @mcp.tool(name='stop_training_job_sagemaker', description='Stop a SageMaker Training Job')
+@retry_on_expired_credentials
 async def stop_training_job_sagemaker(
     training_job_name: Annotated[
         str, Field(description='The name of the SageMaker Training Job to stop')
@@ -787,6 +1199,7 @@ async def stop_training_job_sagemaker(
 
 
 @mcp.tool(name='stop_processing_job_sagemaker', description='Stop a SageMaker Processing Job')
+@retry_on_expired_credentials
 async def stop_processing_job_sagemaker(
     processing_job_name: Annotated[
         str, Field(description='The name of the SageMaker Processing Job to stop')
@@ -823,6 +1236,7 @@ async def stop_processing_job_sagemaker(
 
 
 @mcp.tool(name='stop_transform_job_sagemaker', description='Stop a SageMaker Transform Job')
+@retry_on_expired_credentials
 async def stop_transform_job_sagemaker(
     transform_job_name: Annotated[
         str, Field(description='The name of the SageMaker Transform Job to stop')
@@ -862,6 +1276,7 @@ async def stop_transform_job_sagemaker(
     name='stop_inference_recommendations_job_sagemaker',
     description='Stop a SageMaker Inference Recommender Job',
 )
+@retry_on_expired_credentials
 async def stop_inference_recommendations_job_sagemaker(
     job_name: Annotated[
         str, Field(description='The name of the SageMaker Inference Recommender Job to stop')
@@ -900,16 +1315,34 @@ async def stop_inference_recommendations_job_sagemaker(
 # ---SageMaker Pipelines Tools---
 
 
-@mcp.tool(name='list_pipelines_sagemaker', description='List SageMaker Pipelines')
-async def list_pipelines_sagemaker() -> Dict[str, List]:
-    """List all SageMaker Pipelines.
+@mcp.tool(
+    name='list_pipelines_sagemaker',
+    description='List the most recent SageMaker Pipelines, up to max_results (default 100)',
+)
+@retry_on_expired_credentials
+async def list_pipelines_sagemaker(
+    name_prefix: Annotated[
+        Optional[str],
+        Field(description='Only return Pipelines whose name starts with this prefix'),
+    ] = None,
+    max_results: Annotated[
+        int, Field(description='The maximum number of Pipelines to return', ge=1)
+    ] = 100,
+) -> Dict[str, List]:
+    """List the most recent SageMaker Pipelines, up to `max_results` of them.
 
     ## Usage
 
-    Use this tool to retrieve a list of all SageMaker Pipelines in your account
+    Use this tool to retrieve a list of the SageMaker Pipelines in your account
     in the current region. This is typically used to see what pipelines are
     available before performing operations on them.
 
+    Results are returned most recent first and capped at `max_results` (100 by
+    default). A result with exactly `max_results` items may be incomplete, so raise
+    `max_results` or narrow the query to see the rest.
+
+    Filter by name with `name_prefix`, applied by SageMaker.
+
     ## Example
 
     ```python
@@ -921,13 +1354,13 @@ async def list_pipelines_sagemaker() -> Dict[str, List]:
 
     The output is a dictionary with the following structure:
     - 'pipelines': A list of dictionaries, each representing a SageMaker
-      Pipeline with its details.
+      Pipeline with its details, at most `max_results` of them.
 
     ## Returns
     A dictionary containing a list of SageMaker Pipelines.
     """
     try:
-        pipelines = await list_pipelines()
+        pipelines = await list_pipelines(max_results, name_prefix)
         return {'pipelines': pipelines}
     except Exception as e:
         logger.error(f'Error listing pipelines: {e}')
@@ -936,21 +1369,30 @@ async def list_pipelines_sagemaker() -> Dict[str, List]:
 
 @mcp.tool(
     name='list_pipeline_executions_sagemaker',
-    description='List all Pipeline Executions for a SageMaker Pipeline',
+    description='List the most recent Pipeline Executions of a SageMaker Pipeline'
+    ', up to max_results (default 100)',
 )
+@retry_on_expired_credentials
 async def list_pipeline_executions_sagemaker(
     pipeline_name: Annotated[
         str, Field(description='The name of the SageMaker Pipeline to list executions for')
     ],
+    max_results: Annotated[
+        int, Field(description='The maximum number of Pipeline Executions to return', ge=1)
+    ] = 100,
 ) -> Dict[str, List]:
-    """List all Pipeline Executions for a specified SageMaker Pipeline.
+    """List the most recent Pipeline Executions of a SageMaker Pipeline, up to `max_results` of them.
 
     ## Usage
 
-    Use this tool to retrieve a list of all executions for a specific SageMaker
+    Use this tool to retrieve a list of the executions for a specific SageMaker
     Pipeline by providing its name. This helps you track the execution history
     of the pipeline.
 
+    Results are returned most recent first and capped at `max_results` (100 by
+    default). A result with exactly `max_results` items may be incomplete, so raise
+    `max_results` or narrow the query to see the rest.
+
     ## Example
 
     ```python
@@ -962,23 +1404,73 @@ async def list_pipeline_executions_sagemaker(
 
     The output is a dictionary with the following structure:
     - 'pipeline_executions': A list of dictionaries, each representing a
-      SageMaker Pipeline Execution with its details.
+      SageMaker Pipeline Execution with its details, at most `max_results` of them.
 
     ## Returns
     A dictionary containing a list of Pipeline Executions.
     """
     try:
-        executions = await list_pipeline_executions(pipeline_name)
+        executions = await list_pipeline_executions(pipeline_name, max_items=max_results)
         return {'pipeline_executions': executions}
     except Exception as e:
         logger.error(f'Error listing pipeline executions for {pipeline_name}: {e}')
         raise ValueError(f'Failed to list pipeline executions for {pipeline_name}: {e}')
 
 
+@mcp.tool(
+    name='list_pipeline_executions_with_details_sagemaker',
+    description='List the most recent executions of a SageMaker Pipeline with their full details',
+)
+@retry_on_expired_credentials
+async def list_pipeline_executions_with_details_sagemaker(
+    pipeline_name: Annotated[
+        str, Field(description='The name of the SageMaker Pipeline to list executions for')
+    ],
+    max_results: Annotated[
+        int, Field(description='The maximum number of Pipeline Executions to describe', ge=1)
+    ] = 20,
+) -> Dict[str, Any]:
+    """List the most recent executions of a SageMaker Pipeline and describe each of them.
+
+    ## Usage
+
+    Use this tool instead of calling list_pipeline_executions_sagemaker and then
+    describe_pipeline_execution_sagemaker for every execution. The describe calls
+    are sent concurrently, so all the details arrive in about the time of a single call.
+
+    ## Example
+
+    ```python
+    executions = await list_pipeline_executions_with_details_sagemaker(
+        pipeline_name='my-pipeline', max_results=10
+    )
+    print(executions)
+    ```
+
+    ## Output Format
+
+    The output is a dictionary with the following structure:
+    - 'pipeline_executions': A dictionary mapping each Pipeline Execution ARN to
+      its details, or to {'Error': message} if it could not be described.
+
+    ## Returns
+    A dictionary containing the details of the most recent Pipeline Executions.
+    """
+    try:
+        executions = await list_pipeline_executions_with_details(pipeline_name, max_results)
+        return {'pipeline_executions': executions}
+    except Exception as e:
+        logger.error(f'Error listing pipeline executions with details for {pipeline_name}: {e}')
+        raise ValueError(
+            f'Failed to list pipeline executions with details for {pipeline_name}: {e}'
+        )
+
+
 @mcp.tool(
     name='list_pipeline_execution_steps_sagemaker',
     description='List all Pipeline Execution Steps for a SageMaker Pipeline Execution',
 )
+@retry_on_expired_credentials
 async def list_pipeline_execution_steps_sagemaker(
     pipeline_execution_arn: Annotated[
         str, Field(description='The ARN of the SageMaker Pipeline Execution to list steps for')
@@ -1024,6 +1516,7 @@ async def list_pipeline_execution_steps_sagemaker(
     name='list_pipeline_parameters_for_execution_sagemaker',
     description='List Pipeline Parameters for a SageMaker Pipeline Execution',
 )
+@retry_on_expired_credentials
 async def list_pipeline_parameters_for_execution_sagemaker(
     pipeline_execution_arn: Annotated[
         str,
@@ -1065,10 +1558,25 @@ async def list_pipeline_parameters_for_execution_sagemaker(
 
 
 @mcp.tool(name='describe_pipeline_sagemaker', description='Describe a SageMaker Pipeline')
+@retry_on_expired_credentials
 async def describe_pipeline_sagemaker(
     pipeline_name: Annotated[
         str, Field(description='The name of the SageMaker Pipeline to describe')
     ],
+    fields: Annotated[
+        Optional[List[str]],
+        Field(
+            description='Fields to return, as top-level names or dotted paths, e.g. '
+            'PipelineStatus and LastModifiedTime. Returns every field when omitted'
+        ),
+    ] = None,
+    definition_digest: Annotated[
+        bool,
+        Field(
+            description='Return a SHA-256 digest of the pipeline definition as '
+            'PipelineDefinitionSha256 instead of the definition itself'
+        ),
+    ] = False,
 ) -> Dict[str, Any]:
     """Describe a specified SageMaker Pipeline.
 
@@ -1082,20 +1590,24 @@ async def describe_pipeline_sagemaker(
 
     ```python
     pipeline_details = await describe_pipeline_sagemaker(pipeline_name='my-pipeline')
-    print(pipeline_details)
+    changed = await describe_pipeline_sagemaker(
+        pipeline_name='my-pipeline', fields=['PipelineDefinitionSha256'], definition_digest=True
+    )
     ```
 
     ## Output Format
 
     The output is a dictionary containing all the details of the SageMaker
-    Pipeline.
+    Pipeline, or only the requested fields when `fields` is given.
 
     ## Returns
     A dictionary containing the pipeline details.
     """
     try:
         pipeline_details = await describe_pipeline(pipeline_name)
-        return {'pipeline_details': pipeline_details}
+        if definition_digest:
+            pipeline_details = digest_definition(pipeline_details)
+        return {'pipeline_details': project(pipeline_details, fields)}
     except Exception as e:
         logger.error(f'Error describing pipeline {pipeline_name}: {e}')
         raise ValueError(f'Failed to describe pipeline {pipeline_name}: {e}')
@@ -1105,6 +1617,7 @@ async def describe_pipeline_sagemaker(
     name='describe_pipeline_definition_for_execution_sagemaker',
     description='Describe Pipeline Definition for a SageMaker Pipeline Execution',
 )
+@retry_on_expired_credentials
 async def describe_pipeline_definition_for_execution_sagemaker(
     pipeline_execution_arn: Annotated[
         str,
@@ -1112,6 +1625,20 @@ async def describe_pipeline_definition_for_execution_sagemaker(
             description='The ARN of the SageMaker Pipeline Execution to describe definition for'
         ),
     ],
+    fields: Annotated[
+        Optional[List[str]],
+        Field(
+            description='Fields to return, as top-level names or dotted paths, e.g. '
+            'PipelineDefinitionSummary and CreationTime. Returns every field when omitted'
+        ),
+    ] = None,
+    definition_digest: Annotated[
+        bool,
+        Field(
+            description='Return a SHA-256 digest of the pipeline definition as '
+            'PipelineDefinitionSha256 instead of the definition itself'
+        ),
+    ] = False,
 ) -> Dict[str, Any]:
     """Describe the Pipeline Definition for a specified SageMaker Pipeline Execution.
 
@@ -1132,14 +1659,17 @@ async def describe_pipeline_definition_for_execution_sagemaker(
     ## Output Format
 
     The output is a dictionary with the following structure:
-    - 'pipeline_definition': A dictionary representing the definition of the SageMaker Pipeline Execution.
+    - 'pipeline_definition': A dictionary representing the definition of the SageMaker Pipeline Execution,
+      with only the requested fields when `fields` is given.
 
     ## Returns
     A dictionary containing the Pipeline Definition.
     """
     try:
         definition = await describe_pipeline_definition_for_execution(pipeline_execution_arn)
-        return {'pipeline_definition': definition}
+        if definition_digest:
+            definition = digest_definition(definition)
+        return {'pipeline_definition': project(definition, fields)}
     except Exception as e:
         logger.error(f'Error describing pipeline definition for {pipeline_execution_arn}: {e}')
         raise ValueError(
@@ -1151,11 +1681,20 @@ async def describe_pipeline_definition_for_execution_sagemaker(
     name='describe_pipeline_execution_sagemaker',
     description='Describe a SageMaker Pipeline Execution',
 )
+@retry_on_expired_credentials
 async def describe_pipeline_execution_sagemaker(
     pipeline_execution_arn: Annotated[
         str,
         Field(description='The ARN of the SageMaker Pipeline Execution to describe'),
     ],
+    fields: Annotated[
+        Optional[List[str]],
+        Field(
+            description='Fields to return, as top-level names or dotted paths, e.g. '
+            'PipelineExecutionStatus and PipelineExperimentConfig.TrialName. Returns '
+            'every field when omitted'
+        ),
+    ] = None,
 ) -> Dict[str, Any]:
     """Describe a specified SageMaker Pipeline Execution.
 
@@ -1171,19 +1710,22 @@ async def describe_pipeline_execution_sagemaker(
     execution_details = await describe_pipeline_execution_sagemaker(
         pipeline_execution_arn='arn:aws:sagemaker:...'
     )
-    print(execution_details)
+    status = await describe_pipeline_execution_sagemaker(
+        pipeline_execution_arn='arn:aws:sagemaker:...', fields=['PipelineExecutionStatus']
+    )
     ```
 
     ## Output Format
 
-    The output is a dictionary containing all the details of the SageMaker Pipeline Execution.
+    The output is a dictionary containing all the details of the SageMaker Pipeline Execution,
+    or only the requested fields when `fields` is given.
 
     ## Returns
     A dictionary containing the pipeline execution details.
     """
     try:
         execution_details = await describe_pipeline_execution(pipeline_execution_arn)
-        return {'pipeline_execution_details': execution_details}
+        return {'pipeline_execution_details': project(execution_details, fields)}
     except Exception as e:
         logger.error(f'Error describing pipeline execution {pipeline_execution_arn}: {e}')
         raise ValueError(f'Failed to describe pipeline execution {pipeline_execution_arn}: {e}')
@@ -1192,6 +1734,7 @@ async def describe_pipeline_execution_sagemaker(
 @mcp.tool(
     name='start_pipeline_execution_sagemaker', description='Start a SageMaker Pipeline Execution'
 )
+@retry_on_expired_credentials
 async def start_pipeline_execution_sagemaker(
     pipeline_name: Annotated[
         str, Field(description='The name of the SageMaker Pipeline to start execution for')
@@ -1237,6 +1780,7 @@ async def start_pipeline_execution_sagemaker(
 @mcp.tool(
     name='stop_pipeline_execution_sagemaker', description='Stop a SageMaker Pipeline Execution'
 )
+@retry_on_expired_credentials
 async def stop_pipeline_execution_sagemaker(
     pipeline_execution_arn: Annotated[
         str, Field(description='The ARN of the SageMaker Pipeline Execution to stop')
@@ -1275,6 +1819,7 @@ async def stop_pipeline_execution_sagemaker(
 
 
 @mcp.tool(name='delete_pipeline_sagemaker', description='Delete a SageMaker Pipeline')
+@retry_on_expired_credentials
 async def delete_pipeline_sagemaker(
     pipeline_name: Annotated[
         str, Field(description='The name of the SageMaker Pipeline to delete')
@@ -1313,6 +1858,7 @@ async def delete_pipeline_sagemaker(
 
 
 @mcp.tool(name='list_user_profiles_sagemaker', description='List all SageMaker User Profiles')
+@retry_on_expired_credentials
 async def list_user_profiles_sagemaker() -> Dict[str, List]:
     """List all SageMaker User Profiles.
 
@@ -1345,6 +1891,7 @@ async def list_user_profiles_sagemaker() -> Dict[str, List]:
 
 
 @mcp.tool(name='list_spaces_sagemaker', description='List all SageMaker Spaces')
+@retry_on_expired_credentials
 async def list_spaces_sagemaker() -> Dict[str, List]:
     """List all SageMaker Spaces.
 
@@ -1383,6 +1930,7 @@ async def list_spaces_sagemaker() -> Dict[str, List]:
     name='list_mlflow_tracking_servers_sagemaker',
     description='List all Managed MLflow Tracking Servers in SageMaker',
 )
+@retry_on_expired_credentials
 async def list_mlflow_tracking_servers_sagemaker() -> Dict[str, List]:
     """List all Managed MLflow Tracking Servers in SageMaker.
 
@@ -1418,6 +1966,7 @@ async def list_mlflow_tracking_servers_sagemaker() -> Dict[str, List]:
     name='create_mlflow_tracking_server_sagemaker',
     description='Create a Managed MLflow Tracking Server in SageMaker',
 )
+@retry_on_expired_credentials
 async def create_mlflow_tracking_server_sagemaker(
     tracking_server_name: Annotated[
         str, Field(description='The name of the MLflow Tracking Server to create')
@@ -1470,6 +2019,7 @@ async def create_mlflow_tracking_server_sagemaker(
     name='create_presigned_url_for_mlflow_tracking_server_sagemaker',
     description='Create a presigned URL for a Managed MLflow Tracking Server in SageMaker',
 )
+@retry_on_expired_credentials
 async def create_presigned_url_for_mlflow_tracking_server_sagemaker(
     tracking_server_name: Annotated[
         str,
@@ -1522,6 +2072,7 @@ async def create_presigned_url_for_mlflow_tracking_server_sagemaker(
     name='describe_mlflow_tracking_server_sagemaker',
     description='Describe a Managed MLflow Tracking Server in SageMaker',
 )
+@retry_on_expired_credentials
 async def describe_mlflow_tracking_server_sagemaker(
     tracking_server_name: Annotated[
         str, Field(description='The name of the MLflow Tracking Server to describe')
@@ -1563,6 +2114,7 @@ async def describe_mlflow_tracking_server_sagemaker(
     name='start_mlflow_tracking_server_sagemaker',
     description='Start a Managed MLflow Tracking Server in SageMaker',
 )
+@retry_on_expired_credentials
 async def start_mlflow_tracking_server_sagemaker(
     tracking_server_name: Annotated[
         str, Field(description='The name of the MLflow Tracking Server to start')
@@ -1603,6 +2155,7 @@ async def start_mlflow_tracking_server_sagemaker(
     name='stop_mlflow_tracking_server_sagemaker',
     description='Stop a Managed MLflow Tracking Server in SageMaker',
 )
+@retry_on_expired_credentials
 async def stop_mlflow_tracking_server_sagemaker(
     tracking_server_name: Annotated[
         str, Field(description='The name of the MLflow Tracking Server to stop')
@@ -1641,6 +2194,7 @@ async def stop_mlflow_tracking_server_sagemaker(
     name='delete_mlflow_tracking_server_sagemaker',
     description='Delete a Managed MLflow Tracking Server in SageMaker',
 )
+@retry_on_expired_credentials
 async def delete_mlflow_tracking_server_sagemaker(
     tracking_server_name: Annotated[
         str, Field(description='The name of the MLflow Tracking Server to delete')
@@ -1681,6 +2235,7 @@ async def delete_mlflow_tracking_server_sagemaker(
 
 
 @mcp.tool(name='list_domains_sagemaker', description='List all SageMaker Domains')
+@retry_on_expired_credentials
 async def list_domains_sagemaker() -> Dict[str, List]:
     """List all SageMaker Domains.
 
@@ -1716,6 +2271,7 @@ async def list_domains_sagemaker() -> Dict[str, List]:
     name='create_presigned_url_for_domain_sagemaker',
     description='Create a presigned URL for a SageMaker Domain',
 )
+@retry_on_expired_credentials
 async def create_presigned_url_for_domain_sagemaker(
     domain_id: Annotated[str, Field(description='The ID of the SageMaker Domain')],
     user_profile_name: Annotated[str, Field(description='The name of the user profile')],
@@ -1760,6 +2316,7 @@ async def create_presigned_url_for_domain_sagemaker(
 
 
 @mcp.tool(name='describe_domain_sagemaker', description='Describe a SageMaker Domain')
+@retry_on_expired_credentials
 async def describe_domain_sagemaker(
     domain_id: Annotated[str, Field(description='The ID of the SageMaker Domain to describe')],
 ) -> Dict[str, Any]:
@@ -1793,6 +2350,7 @@ async def describe_domain_sagemaker(
 
 
 @mcp.tool(name='delete_domain_sagemaker', description='Delete a SageMaker Domain')
+@retry_on_expired_credentials
 async def delete_domain_sagemaker(
     domain_id: Annotated[str, Field(description='The ID of the SageMaker Domain to delete')],
 ) -> Dict[str, str]:
@@ -1828,15 +2386,33 @@ async def delete_domain_sagemaker(
 # ---SageMaker Model Tools---
 
 
-@mcp.tool(name='list_models_sagemaker', description='List all SageMaker Models')
-async def list_models_sagemaker() -> Dict[str, List]:
-    """List all SageMaker Models.
+@mcp.tool(
+    name='list_models_sagemaker',
+    description='List the most recent SageMaker Models, up to max_results (default 100)',
+)
+@retry_on_expired_credentials
+async def list_models_sagemaker(
+    name_contains: Annotated[
+        Optional[str],
+        Field(description='Only return Models whose name contains this string'),
+    ] = None,
+    max_results: Annotated[
+        int, Field(description='The maximum number of Models to return', ge=1)
+    ] = 100,
+) -> Dict[str, List]:
+    """List the most recent SageMaker Models, up to `max_results` of them.
 
     ## Usage
 
-    Use this tool to retrieve a list of all SageMaker Models in your account in the current region.
+    Use this tool to retrieve a list of the SageMaker Models in your account in the current region.
     This is typically used to see what models are available before performing operations on them.
 
+    Results are returned most recent first and capped at `max_results` (100 by
+    default). A result with exactly `max_results` items may be incomplete, so raise
+    `max_results` or narrow the query to see the rest.
+
+    Filter by name with `name_contains`, applied by SageMaker.
+
     ## Example
 
     ```python
@@ -1847,13 +2423,14 @@ async def list_models_sagemaker() -> Dict[str, List]:
     ## Output Format
 
     The output is a dictionary with the following structure:
-    - 'models': A list of dictionaries, each representing a SageMaker Model with its details.
+    - 'models': A list of dictionaries, each representing a SageMaker Model with its details,
+      at most `max_results` of them.
 
     ## Returns
     A dictionary containing a list of SageMaker Models.
     """
     try:
-        models = await list_models()
+        models = await list_models(max_results, name_contains)
         return {'models': models}
     except Exception as e:
         logger.error(f'Error listing models: {e}')
@@ -1861,6 +2438,7 @@ async def list_models_sagemaker() -> Dict[str, List]:
 
 
 @mcp.tool(name='describe_model_sagemaker', description='Describe a SageMaker Model')
+@retry_on_expired_credentials
 async def describe_model_sagemaker(
     model_name: Annotated[str, Field(description='The name of the SageMaker Model to describe')],
 ) -> Dict[str, Any]:
@@ -1894,6 +2472,7 @@ async def describe_model_sagemaker(
 
 
 @mcp.tool(name='delete_model_sagemaker', description='Delete a SageMaker Model')
+@retry_on_expired_credentials
 async def delete_model_sagemaker(
     model_name: Annotated[str, Field(description='The name of the SageMaker Model to delete')],
 ) -> Dict[str, str]:
@@ -1929,15 +2508,33 @@ async def delete_model_sagemaker(
 # ---SageMaker Model Card Tools---
 
 
-@mcp.tool(name='list_model_cards_sagemaker', description='List all SageMaker Model Cards')
-async def list_model_cards_sagemaker() -> Dict[str, List]:
-    """List all SageMaker Model Cards.
+@mcp.tool(
+    name='list_model_cards_sagemaker',
+    description='List the most recent SageMaker Model Cards, up to max_results (default 100)',
+)
+@retry_on_expired_credentials
+async def list_model_cards_sagemaker(
+    name_contains: Annotated[
+        Optional[str],
+        Field(description='Only return Model Cards whose name contains this string'),
+    ] = None,
+    max_results: Annotated[
+        int, Field(description='The maximum number of Model Cards to return', ge=1)
+    ] = 100,
+) -> Dict[str, List]:
+    """List the most recent SageMaker Model Cards, up to `max_results` of them.
 
     ## Usage
 
-    Use this tool to retrieve a list of all SageMaker Model Cards in your account in the current region.
+    Use this tool to retrieve a list of the SageMaker Model Cards in your account in the current region.
     This is typically used to see what model cards are available before performing operations on them.
 
+    Results are returned most recent first and capped at `max_results` (100 by
+    default). A result with exactly `max_results` items may be incomplete, so raise
+    `max_results` or narrow the query to see the rest.
+
+    Filter by name with `name_contains`, applied by SageMaker.
+
     ## Example
 
     ```python
@@ -1948,13 +2545,14 @@ async def list_model_cards_sagemaker() -> Dict[str, List]:
     ## Output Format
 
     The output is a dictionary with the following structure:
-    - 'model_cards': A list of dictionaries, each representing a SageMaker Model Card with its details.
+    - 'model_cards': A list of dictionaries, each representing a SageMaker Model Card with its details,
+      at most `max_results` of them.
 
     ## Returns
     A dictionary containing a list of SageMaker Model Cards.
     """
     try:
-        model_cards = await list_model_cards()
+        model_cards = await list_model_cards(max_results, name_contains)
         return {'model_cards': model_cards}
     except Exception as e:
         logger.error(f'Error listing model cards: {e}')
@@ -1965,6 +2563,7 @@ async def list_model_cards_sagemaker() -> Dict[str, List]:
     name='list_model_card_export_jobs_sagemaker',
     description='List Model Card Export Jobs for a SageMaker Model Card',
 )
+@retry_on_expired_credentials
 async def list_model_card_export_jobs_sagemaker(
     model_card_name: Annotated[
         str, Field(description='The name of the SageMaker Model Card to list export jobs for')
@@ -2004,6 +2603,7 @@ async def list_model_card_export_jobs_sagemaker(
     name='list_model_card_versions_sagemaker',
     description='List all versions of a SageMaker Model Card',
 )
+@retry_on_expired_credentials
 async def list_model_card_versions_sagemaker(
     model_card_name: Annotated[
         str, Field(description='The name of the SageMaker Model Card to list versions for')
@@ -2040,6 +2640,7 @@ async def list_model_card_versions_sagemaker(
 
 
 @mcp.tool(name='describe_model_card_sagemaker', description='Describe a SageMaker Model Card')
+@retry_on_expired_credentials
 async def describe_model_card_sagemaker(
     model_card_name: Annotated[
         str, Field(description='The name of the SageMaker Model Card to describe')
@@ -2075,6 +2676,7 @@ async def describe_model_card_sagemaker(
 
 
 @mcp.tool(name='delete_model_card_sagemaker', description='Delete a SageMaker Model Card')
+@retry_on_expired_credentials
 async def delete_model_card_sagemaker(
     model_card_name: Annotated[
         str, Field(description='The name of the SageMaker Model Card to delete')
@@ -2116,6 +2718,7 @@ async def delete_model_card_sagemaker(
     name='list_apps_sagemaker',
     description='List all SageMaker Apps',
 )
+@retry_on_expired_credentials
 async def list_apps_sagemaker() -> Dict[str, List]:
     """List all SageMaker Apps.
 
@@ -2151,6 +2754,7 @@ async def list_apps_sagemaker() -> Dict[str, List]:
     name='create_app_sagemaker',
     description='Create a SageMaker App',
 )
+@retry_on_expired_credentials
 async def create_app_sagemaker(
     domain_id: Annotated[
         str, Field(description='The ID of the domain in which to create the app')
@@ -2160,17 +2764,7 @@ async def create_app_sagemaker(
         Field(description='The name of the user profile in which to create the app'),
     ],
     app_type: Annotated[
-        Literal[
-            'JupyterServer',
-            'KernelGateway',
-            'RStudioServerPro',
-            'RSessionGateway',
-            'Canvas',
-            'JupyterLab',
-            'CodeEditor',
-            'TensorBoard',
-            'DetailedProfiler',
-        ],
+        AppType,
         Field(description='The type of app to create'),
     ],
     app_name: Annotated[str, Field(description='The name of the app')],
@@ -2224,6 +2818,7 @@ async def create_app_sagemaker(
     name='create_presigned_notebook_instance_url_sagemaker',
     description='Create a presigned URL for a SageMaker Notebook Instance',
 )
+@retry_on_expired_credentials
 async def create_presigned_notebook_instance_url_sagemaker(
     notebook_instance_name: Annotated[
         str, Field(description='The name of the SageMaker Notebook Instance')
@@ -2276,6 +2871,7 @@ async def create_presigned_notebook_instance_url_sagemaker(
     name='describe_app_sagemaker',
     description='Describe a SageMaker App',
 )
+@retry_on_expired_credentials
 async def describe_app_sagemaker(
     domain_id: Annotated[str, Field(description='The ID of the domain in which the app resides')],
     user_profile_name: Annotated[
@@ -2283,17 +2879,7 @@ async def describe_app_sagemaker(
         Field(description='The name of the user profile that owns the app'),
     ],
     app_type: Annotated[
-        Literal[
-            'JupyterServer',
-            'KernelGateway',
-            'RStudioServerPro',
-            'RSessionGateway',
-            'Canvas',
-            'JupyterLab',
-            'CodeEditor',
-            'TensorBoard',
-            'DetailedProfiler',
-        ],
+        AppType,
         Field(description='The type of app'),
     ],
     app_name: Annotated[str, Field(description='The name of the app')],
@@ -2341,6 +2927,7 @@ async def describe_app_sagemaker(
     name='describe_app_image_config_sagemaker',
     description='Describe a SageMaker App Image Config',
 )
+@retry_on_expired_credentials
 async def describe_app_image_config_sagemaker(
     app_image_config_name: Annotated[
         str, Field(description='The name of the SageMaker App Image Config to describe')
@@ -2381,6 +2968,7 @@ async def describe_app_image_config_sagemaker(
     name='delete_app_sagemaker',
     description='Delete a SageMaker App',
 )
+@retry_on_expired_credentials
 async def delete_app_sagemaker(
     domain_id: Annotated[str, Field(description='The ID of the domain in which the app resides')],
     user_profile_name: Annotated[
@@ -2388,17 +2976,7 @@ async def delete_app_sagemaker(
         Field(description='The name of the user profile that owns the app'),
     ],
     app_type: Annotated[
-        Literal[
-            'JupyterServer',
-            'KernelGateway',
-            'RStudioServerPro',
-            'RSessionGateway',
-            'Canvas',
-            'JupyterLab',
-            'CodeEditor',
-            'TensorBoard',
-            'DetailedProfiler',
-        ],
+        AppType,
         Field(description='The type of app to delete'),
     ],
     app_name: Annotated[str, Field(description='The name of the app to delete')],
@@ -2446,6 +3024,7 @@ async def delete_app_sagemaker(
     name='delete_app_image_config_sagemaker',
     description='Delete a SageMaker App Image Config',
 )
+@retry_on_expired_credentials
 async def delete_app_image_config_sagemaker(
     app_image_config_name: Annotated[
         str, Field(description='The name of the SageMaker App Image Config to delete')
@@ -2481,8 +3060,14 @@ async def delete_app_image_config_sagemaker(
 
 def main():
     """Run the SageMaker AI MCP Server."""
+    # Log through a background thread so formatting and writing don't block tool calls.
+    logger.remove()
+    logger.add(sys.stderr, level=os.environ.get('SAGEMAKER_MCP_LOG_LEVEL', 'INFO'), enqueue=True)
     logger.info('Welcome to the SageMaker AI MCP Server!')
-    mcp.run()
+    try:
+        mcp.run()
+    finally:
+        shutdown()
 
 
 if __name__ == '__main__':
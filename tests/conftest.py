@@ -0,0 +1,15 @@
+"""Shared fixtures for the SageMaker AI MCP Server tests."""
+
+import pytest
+from sagemaker_ai_mcp_server.helpers.cache import clear_cache
+from sagemaker_ai_mcp_server.helpers.utils import refresh_env
+
+
+@pytest.fixture(autouse=True)
+def reset_caches():
+    """Make sure no cached setting, client or response leaks from one test into another."""
+    refresh_env()
+    clear_cache()
+    yield
+    refresh_env()
+    clear_cache()
@@ -18,26 +18,28 @@ from unittest.mock import MagicMock, patch
 async def test_list_apps(mock_get_sagemaker_client):
     """Test listing SageMaker AI Apps."""
     mock_client = MagicMock()
-    mock_client.list_apps.return_value = {
-        'Apps': [
-            {
-                'DomainId': 'test-domain',
-                'UserProfileName': 'test-user',
-                'AppType': 'JupyterServer',
-                'AppName': 'test-app-1',
-            },
-            {
-                'DomainId': 'test-domain',
-                'UserProfileName': 'test-user',
-                'AppType': 'KernelGateway',
-                'AppName': 'test-app-2',
-            },
-        ]
-    }
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {
+            'Apps': [
+                {
+                    'DomainId': 'test-domain',
+                    'UserProfileName': 'test-user',
+                    'AppType': 'JupyterServer',
+                    'AppName': 'test-app-1',
+                },
+                {
+                    'DomainId': 'test-domain',
+                    'UserProfileName': 'test-user',
+                    'AppType': 'KernelGateway',
+                    'AppName': 'test-app-2',
+                },
+            ]
+        }
+    ]
     mock_get_sagemaker_client.return_value = mock_client
     apps = await list_apps()
     mock_get_sagemaker_client.assert_called_once()
-    mock_client.list_apps.assert_called_once()
+    mock_client.get_paginator.assert_called_once_with('list_apps')
     assert len(apps) == 2
     assert apps[0]['AppName'] == 'test-app-1'
     assert apps[1]['AppName'] == 'test-app-2'
@@ -118,6 +120,22 @@ async def test_describe_app(mock_get_sagemaker_client):
     assert response == expected_response
 
 
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.apps.get_sagemaker_client')
+async def test_describe_app_is_cached_until_deleted(mock_get_sagemaker_client):
+    """Test that describe_app is served from the cache until the app is deleted."""
+    mock_client = MagicMock()
+    mock_client.describe_app.return_value = {'AppName': 'test-app', 'Status': 'InService'}
+    mock_get_sagemaker_client.return_value = mock_client
+    args = ('test-domain', 'test-user', 'JupyterServer', 'test-app')
+    await describe_app(*args)
+    await describe_app(*args)
+    assert mock_client.describe_app.call_count == 1
+    await delete_app(*args)
+    await describe_app(*args)
+    assert mock_client.describe_app.call_count == 2
+
+
 @pytest.mark.asyncio
 @patch('sagemaker_ai_mcp_server.helpers.apps.get_sagemaker_client')
 async def test_describe_app_image_config(mock_get_sagemaker_client):
@@ -166,3 +184,21 @@ async def test_delete_app_image_config(mock_get_sagemaker_client):
     await delete_app_image_config(config_name)
     mock_get_sagemaker_client.assert_called_once()
     mock_client.delete_app_image_config.assert_called_once_with(AppImageConfigName=config_name)
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.apps.get_sagemaker_client')
+async def test_create_app_rejects_unknown_app_type(mock_get_sagemaker_client):
+    """Test that an unknown app type is rejected before calling SageMaker."""
+    with pytest.raises(ValueError, match='Invalid app type'):
+        await create_app('test-domain', 'test-user', 'NotAnApp', 'test-app')
+    mock_get_sagemaker_client.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.apps.get_sagemaker_client')
+async def test_delete_app_rejects_unknown_app_type(mock_get_sagemaker_client):
+    """Test that deleting an app of an unknown type is rejected before calling SageMaker."""
+    with pytest.raises(ValueError, match='Invalid app type'):
+        await delete_app('test-domain', 'test-user', 'NotAnApp', 'test-app')
+    mock_get_sagemaker_client.assert_not_called()
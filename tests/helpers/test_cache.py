@@ -0,0 +1,394 @@
+"""Tests for the TTL cache of SageMaker API responses."""
+
+import asyncio
+import os
+import pytest
+import threading
+from botocore.exceptions import ClientError
+from sagemaker_ai_mcp_server.helpers.cache import (
+    IMMUTABLE_TTL_SECONDS,
+    NEGATIVE_TTL_SECONDS,
+    SHORT_TTL_SECONDS,
+    TTLCache,
+    clear_cache,
+    invalidate,
+    ttl_by_status,
+    ttl_cache,
+)
+from sagemaker_ai_mcp_server.helpers.utils import refresh_env
+from unittest.mock import AsyncMock, patch
+
+
+class TestTTLCache:
+    """Tests for the TTLCache class."""
+
+    def test_get_and_set(self):
+        """Test that a stored value is returned until it expires."""
+        cache = TTLCache()
+        with patch('sagemaker_ai_mcp_server.helpers.cache.time.monotonic', return_value=100.0):
+            cache.set('key', 'value', ttl=10)
+            assert cache.get('key') == (True, 'value')
+        with patch('sagemaker_ai_mcp_server.helpers.cache.time.monotonic', return_value=110.0):
+            assert cache.get('key') == (False, None)
+        assert len(cache) == 0
+
+    def test_get_missing_key(self):
+        """Test looking up a key that was never stored."""
+        assert TTLCache().get('missing') == (False, None)
+
+    def test_evicts_least_recently_used(self):
+        """Test that the least recently used entry is evicted when the cache is full."""
+        cache = TTLCache(maxsize=2)
+        cache.set('a', 1, ttl=60)
+        cache.set('b', 2, ttl=60)
+        cache.get('a')
+        cache.set('c', 3, ttl=60)
+
+        assert cache.get('a') == (True, 1)
+        assert cache.get('b') == (False, None)
+        assert cache.get('c') == (True, 3)
+
+    def test_invalidate_and_clear(self):
+        """Test removing one entry and then all entries."""
+        cache = TTLCache()
+        cache.set('a', 1, ttl=60)
+        cache.set('b', 2, ttl=60)
+
+        cache.invalidate('a')
+        cache.invalidate('missing')
+        assert cache.keys() == ['b']
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_get_stale(self):
+        """Test that an expired value is kept for its stale period only."""
+        cache = TTLCache()
+        with patch('sagemaker_ai_mcp_server.helpers.cache.time.monotonic', return_value=100.0):
+            cache.set('key', 'value', ttl=10, stale_ttl=50)
+        with patch('sagemaker_ai_mcp_server.helpers.cache.time.monotonic', return_value=120.0):
+            assert cache.get('key') == (False, None)
+            assert cache.get_stale('key') == (True, 'value')
+        with patch('sagemaker_ai_mcp_server.helpers.cache.time.monotonic', return_value=160.0):
+            assert cache.get_stale('key') == (False, None)
+
+
+class TestTTLCacheDecorator:
+    """Tests for the ttl_cache decorator and its invalidation helpers."""
+
+    @pytest.mark.asyncio
+    async def test_caches_by_arguments(self):
+        """Test that repeated calls with the same arguments are served from the cache."""
+        fetch = AsyncMock(side_effect=lambda name: {'Name': name})
+
+        @ttl_cache()
+        async def describe_thing(name: str):
+            return await fetch(name)
+
+        assert await describe_thing('a') == {'Name': 'a'}
+        assert await describe_thing(name='a') == {'Name': 'a'}
+        assert await describe_thing('b') == {'Name': 'b'}
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_is_keyed_by_region(self):
+        """Test that results cached for one region are not served for another."""
+        fetch = AsyncMock(return_value={})
+
+        @ttl_cache()
+        async def describe_thing(name: str):
+            return await fetch(name)
+
+        with patch.dict(os.environ, {'AWS_REGION': 'us-east-1'}):
+            await describe_thing('a')
+        with patch.dict(os.environ, {'AWS_REGION': 'eu-west-1'}):
+            refresh_env()
+            await describe_thing('a')
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self):
+        """Test that a failed call is retried on the next invocation."""
+        fetch = AsyncMock(side_effect=[RuntimeError('boom'), {'Name': 'a'}])
+
+        @ttl_cache()
+        async def describe_thing(name: str):
+            return await fetch(name)
+
+        with pytest.raises(RuntimeError):
+            await describe_thing('a')
+        assert await describe_thing('a') == {'Name': 'a'}
+
+    @pytest.mark.asyncio
+    async def test_not_found_errors_are_cached_briefly(self):
+        """Test that a not-found error is raised again without calling SageMaker."""
+        not_found = ClientError(
+            {'Error': {'Code': 'ValidationException', 'Message': 'Could not find endpoint'}},
+            'DescribeThing',
+        )
+        fetch = AsyncMock(side_effect=[not_found, {'Name': 'a'}])
+
+        @ttl_cache()
+        async def describe_thing(name: str):
+            return await fetch(name)
+
+        errors = []
+        for _ in range(2):
+            with pytest.raises(ClientError, match='Could not find endpoint') as exc_info:
+                await describe_thing('a')
+            errors.append(exc_info.value)
+        assert fetch.await_count == 1
+        assert errors[0] is not errors[1]
+        assert errors[1].response['Error']['Code'] == 'ValidationException'
+
+        invalidate('describe_thing', 'a')
+        assert await describe_thing('a') == {'Name': 'a'}
+
+    @pytest.mark.asyncio
+    async def test_not_found_errors_expire(self):
+        """Test that a cached not-found error expires after NEGATIVE_TTL_SECONDS."""
+        not_found = ClientError({'Error': {'Code': 'ResourceNotFound'}}, 'DescribeThing')
+        fetch = AsyncMock(side_effect=[not_found, {'Name': 'a'}])
+
+        @ttl_cache()
+        async def describe_thing(name: str):
+            return await fetch(name)
+
+        with patch('sagemaker_ai_mcp_server.helpers.cache.time.monotonic', return_value=0):
+            with pytest.raises(ClientError):
+                await describe_thing('a')
+        with patch(
+            'sagemaker_ai_mcp_server.helpers.cache.time.monotonic',
+            return_value=NEGATIVE_TTL_SECONDS,
+        ):
+            assert await describe_thing('a') == {'Name': 'a'}
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self):
+        """Test that invalidate drops a single cached call."""
+        fetch = AsyncMock(return_value={})
+
+        @ttl_cache()
+        async def describe_thing(name: str):
+            return await fetch(name)
+
+        await describe_thing('a')
+        await describe_thing('b')
+        invalidate('describe_thing', 'a')
+        await describe_thing('a')
+        await describe_thing('b')
+        assert fetch.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_clear_cache_by_operation(self):
+        """Test that clear_cache can drop the results of a single helper."""
+        fetch = AsyncMock(return_value={})
+
+        @ttl_cache()
+        async def describe_thing(name: str):
+            return await fetch(name)
+
+        @ttl_cache()
+        async def describe_other(name: str):
+            return await fetch(name)
+
+        await describe_thing('a')
+        await describe_other('a')
+        clear_cache('describe_thing')
+        await describe_thing('a')
+        await describe_other('a')
+        assert fetch.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_stale_result_is_served_when_throttled(self):
+        """Test that an expired result is returned, marked stale, when SageMaker throttles."""
+        throttled = ClientError(
+            {'Error': {'Code': 'ThrottlingException', 'Message': 'Rate exceeded'}},
+            'DescribeThing',
+        )
+        fetch = AsyncMock(side_effect=[{'Name': 'a'}, throttled, RuntimeError('boom')])
+
+        @ttl_cache(ttl=0, stale=60)
+        async def describe_thing(name: str):
+            return await fetch(name)
+
+        assert await describe_thing('a') == {'Name': 'a'}
+        assert await describe_thing('a') == {'Name': 'a', '_stale': True}
+        with pytest.raises(RuntimeError):
+            await describe_thing('a')
+
+    @pytest.mark.asyncio
+    async def test_stale_result_needs_a_previous_success(self):
+        """Test that a transient error is raised when nothing was cached before."""
+        fetch = AsyncMock(
+            side_effect=ClientError(
+                {'Error': {'Code': 'ThrottlingException', 'Message': 'Rate exceeded'}},
+                'DescribeThing',
+            )
+        )
+
+        @ttl_cache(stale=60)
+        async def describe_thing(name: str):
+            return await fetch(name)
+
+        with pytest.raises(ClientError):
+            await describe_thing('a')
+
+
+class TestTTLByStatus:
+    """Tests for status-dependent TTLs."""
+
+    def test_terminal_status_uses_immutable_ttl(self):
+        """Test that finished jobs are cached for longer than running ones."""
+        get_ttl = ttl_by_status('TrainingJobStatus')
+
+        assert get_ttl({'TrainingJobStatus': 'Completed'}) == IMMUTABLE_TTL_SECONDS
+        assert get_ttl({'TrainingJobStatus': 'InProgress'}) == SHORT_TTL_SECONDS
+        assert get_ttl(None) == SHORT_TTL_SECONDS
+
+    @pytest.mark.asyncio
+    async def test_ttl_cache_uses_ttl_of_result(self):
+        """Test that ttl_cache computes the TTL from the returned value."""
+        fetch = AsyncMock(
+            side_effect=[{'Status': 'InProgress'}, {'Status': 'Completed'}, {'Status': 'Failed'}]
+        )
+
+        @ttl_cache(ttl=ttl_by_status('Status'))
+        async def describe_thing(name: str):
+            return await fetch(name)
+
+        with patch('sagemaker_ai_mcp_server.helpers.cache.time.monotonic', return_value=100.0):
+            assert await describe_thing('a') == {'Status': 'InProgress'}
+        with patch('sagemaker_ai_mcp_server.helpers.cache.time.monotonic', return_value=110.0):
+            assert await describe_thing('a') == {'Status': 'Completed'}
+        with patch('sagemaker_ai_mcp_server.helpers.cache.time.monotonic', return_value=500.0):
+            assert await describe_thing('a') == {'Status': 'Completed'}
+        assert fetch.await_count == 2
+
+
+class TestSingleFlight:
+    """Tests for sharing concurrent identical calls."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_request(self):
+        """Test that identical calls made while one is in flight don't call SageMaker again."""
+        release = asyncio.Event()
+        calls = []
+
+        @ttl_cache()
+        async def describe_thing(name: str):
+            calls.append(name)
+            await release.wait()
+            return {'Name': name}
+
+        tasks = [asyncio.ensure_future(describe_thing('a')) for _ in range(3)]
+        other = asyncio.ensure_future(describe_thing('b'))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*tasks) == [{'Name': 'a'}] * 3
+        assert await other == {'Name': 'b'}
+        assert calls == ['a', 'b']
+
+    @pytest.mark.asyncio
+    async def test_invalidate_detaches_in_flight_call(self):
+        """Test that a call after invalidate() starts a new request."""
+        release = asyncio.Event()
+        fetch = AsyncMock(return_value={'Name': 'a'})
+
+        @ttl_cache()
+        async def describe_thing(name: str):
+            await release.wait()
+            return await fetch(name)
+
+        first = asyncio.ensure_future(describe_thing('a'))
+        await asyncio.sleep(0)
+        invalidate('describe_thing', 'a')
+        second = asyncio.ensure_future(describe_thing('a'))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(first, second) == [{'Name': 'a'}, {'Name': 'a'}]
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidated_call_does_not_cache_its_response(self):
+        """Test that a response read before invalidate() is not served afterwards."""
+        release = asyncio.Event()
+        fetch = AsyncMock(side_effect=[{'Status': 'InProgress'}, {'Status': 'Stopping'}])
+
+        @ttl_cache()
+        async def describe_thing(name: str):
+            await release.wait()
+            return await fetch(name)
+
+        first = asyncio.ensure_future(describe_thing('a'))
+        await asyncio.sleep(0)
+        invalidate('describe_thing', 'a')
+        release.set()
+
+        assert await first == {'Status': 'InProgress'}
+        assert await describe_thing('a') == {'Status': 'Stopping'}
+        assert fetch.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cleared_call_does_not_cache_its_response(self):
+        """Test that a response read before clear_cache() is not served afterwards."""
+        release = asyncio.Event()
+        fetch = AsyncMock(side_effect=[{'Status': 'InProgress'}, {'Status': 'Stopping'}])
+
+        @ttl_cache()
+        async def describe_thing(name: str):
+            await release.wait()
+            return await fetch(name)
+
+        first = asyncio.ensure_future(describe_thing('a'))
+        await asyncio.sleep(0)
+        clear_cache()
+        release.set()
+
+        await first
+        assert await describe_thing('a') == {'Status': 'Stopping'}
+
+    @pytest.mark.asyncio
+    async def test_calls_are_not_shared_across_event_loops(self):
+        """Test that a call pending on another event loop is not awaited from this one."""
+        release = threading.Event()
+        started = threading.Event()
+        calls = []
+
+        @ttl_cache()
+        async def describe_thing(name: str):
+            calls.append(name)
+            if len(calls) == 1:
+                started.set()
+                await asyncio.to_thread(release.wait, 5)
+            return {'Name': name}
+
+        thread = threading.Thread(target=asyncio.run, args=(describe_thing('a'),))
+        thread.start()
+        try:
+            assert started.wait(5)
+            assert await describe_thing('a') == {'Name': 'a'}
+        finally:
+            release.set()
+            thread.join(5)
+        assert calls == ['a', 'a']
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_call(self):
+        """Test that cancelling one caller leaves the shared request to the others."""
+        release = asyncio.Event()
+
+        @ttl_cache()
+        async def describe_thing(name: str):
+            await release.wait()
+            return {'Name': name}
+
+        first = asyncio.ensure_future(describe_thing('a'))
+        second = asyncio.ensure_future(describe_thing('a'))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == {'Name': 'a'}
@@ -17,10 +17,10 @@ async def test_list_domains(mock_get_sagemaker_client):
     mock_client = MagicMock()
     mock_get_sagemaker_client.return_value = mock_client
     mock_response = {'Domains': [{'DomainId': 'test-domain', 'DomainName': 'Test Domain'}]}
-    mock_client.list_domains.return_value = mock_response
+    mock_client.get_paginator.return_value.paginate.return_value = [mock_response]
     domains = await list_domains()
     mock_get_sagemaker_client.assert_called_once()
-    mock_client.list_domains.assert_called_once()
+    mock_client.get_paginator.assert_called_once_with('list_domains')
     expected = [{'DomainId': 'test-domain', 'DomainName': 'Test Domain'}]
     assert domains == expected
 
@@ -4,8 +4,12 @@ import pytest
 from sagemaker_ai_mcp_server.helpers.endpoints import (
     delete_endpoint,
     delete_endpoint_config,
+    delete_endpoint_configs,
+    delete_endpoints,
     describe_endpoint,
     describe_endpoint_config,
+    describe_endpoints_many,
+    list_all_endpoints,
     list_endpoint_configs,
     list_endpoints,
 )
@@ -17,11 +21,13 @@ from unittest.mock import MagicMock, patch
 async def test_list_endpoints(mock_get_sagemaker_client):
     """Test listing SageMaker AI Endpoints."""
     mock_client = MagicMock()
-    mock_client.list_endpoints.return_value = {'Endpoints': [{'EndpointName': 'test-endpoint'}]}
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {'Endpoints': [{'EndpointName': 'test-endpoint'}]}
+    ]
     mock_get_sagemaker_client.return_value = mock_client
     endpoints = await list_endpoints()
     mock_get_sagemaker_client.assert_called_once()
-    mock_client.list_endpoints.assert_called_once()
+    mock_client.get_paginator.assert_called_once_with('list_endpoints')
     assert endpoints == [{'EndpointName': 'test-endpoint'}]
 
 
@@ -30,16 +36,52 @@ async def test_list_endpoints(mock_get_sagemaker_client):
 async def test_list_endpoint_configs(mock_get_sagemaker_client):
     """Test listing SageMaker AI Endpoint Configurations."""
     mock_client = MagicMock()
-    mock_client.list_endpoint_configs.return_value = {
-        'EndpointConfigs': [{'EndpointConfigName': 'test-config'}]
-    }
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {'EndpointConfigs': [{'EndpointConfigName': 'test-config'}]}
+    ]
     mock_get_sagemaker_client.return_value = mock_client
     configs = await list_endpoint_configs()
     mock_get_sagemaker_client.assert_called_once()
-    mock_client.list_endpoint_configs.assert_called_once()
+    mock_client.get_paginator.assert_called_once_with('list_endpoint_configs')
     assert configs == [{'EndpointConfigName': 'test-config'}]
 
 
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.endpoints.get_sagemaker_client')
+async def test_list_endpoints_with_filters(mock_get_sagemaker_client):
+    """Test that the name filter and the item limit are sent to SageMaker."""
+    mock_client = MagicMock()
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {'Endpoints': [{'EndpointName': 'prod-endpoint'}]}
+    ]
+    mock_get_sagemaker_client.return_value = mock_client
+    endpoints = await list_endpoints(10, name_contains='prod')
+    mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+        PaginationConfig={'PageSize': 100, 'MaxItems': 10}, NameContains='prod'
+    )
+    assert endpoints == [{'EndpointName': 'prod-endpoint'}]
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.endpoints.get_sagemaker_client')
+async def test_list_all_endpoints(mock_get_sagemaker_client):
+    """Test listing SageMaker AI Endpoints and Endpoint Configurations together."""
+    pages = {
+        'list_endpoints': [{'Endpoints': [{'EndpointName': 'test-endpoint'}]}],
+        'list_endpoint_configs': [{'EndpointConfigs': [{'EndpointConfigName': 'test-config'}]}],
+    }
+    mock_client = MagicMock()
+    mock_client.get_paginator.side_effect = lambda name: MagicMock(
+        paginate=MagicMock(return_value=pages[name])
+    )
+    mock_get_sagemaker_client.return_value = mock_client
+    result = await list_all_endpoints()
+    assert result == {
+        'Endpoints': [{'EndpointName': 'test-endpoint'}],
+        'EndpointConfigs': [{'EndpointConfigName': 'test-config'}],
+    }
+
+
 @pytest.mark.asyncio
 @patch('sagemaker_ai_mcp_server.helpers.endpoints.get_sagemaker_client')
 async def test_describe_endpoint(mock_get_sagemaker_client):
@@ -88,3 +130,57 @@ async def test_delete_endpoint_config(mock_get_sagemaker_client):
     await delete_endpoint_config('test-config')
     mock_get_sagemaker_client.assert_called_once()
     mock_client.delete_endpoint_config.assert_called_once_with(EndpointConfigName='test-config')
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.endpoints.get_sagemaker_client')
+async def test_describe_endpoint_is_cached_until_deleted(mock_get_sagemaker_client):
+    """Test that describe_endpoint is served from the cache until the endpoint is deleted."""
+    mock_client = MagicMock()
+    mock_client.describe_endpoint.return_value = {'EndpointName': 'test-endpoint'}
+    mock_get_sagemaker_client.return_value = mock_client
+    await describe_endpoint('test-endpoint')
+    await describe_endpoint('test-endpoint')
+    mock_client.describe_endpoint.assert_called_once_with(EndpointName='test-endpoint')
+
+    await delete_endpoint('test-endpoint')
+    await describe_endpoint('test-endpoint')
+    assert mock_client.describe_endpoint.call_count == 2
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.endpoints.get_sagemaker_client')
+async def test_delete_endpoints(mock_get_sagemaker_client):
+    """Test deleting several SageMaker AI Endpoints at once."""
+    mock_client = MagicMock()
+    mock_client.delete_endpoint.side_effect = [None, Exception('Endpoint not found')]
+    mock_get_sagemaker_client.return_value = mock_client
+    results = await delete_endpoints(['endpoint-1', 'endpoint-2'], concurrency=1)
+    assert results == {'endpoint-1': None, 'endpoint-2': 'Endpoint not found'}
+    assert mock_client.delete_endpoint.call_count == 2
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.endpoints.get_sagemaker_client')
+async def test_delete_endpoint_configs(mock_get_sagemaker_client):
+    """Test deleting several SageMaker AI Endpoint Configs at once."""
+    mock_client = MagicMock()
+    mock_get_sagemaker_client.return_value = mock_client
+    results = await delete_endpoint_configs(['config-1', 'config-2'])
+    assert results == {'config-1': None, 'config-2': None}
+    mock_client.delete_endpoint_config.assert_any_call(EndpointConfigName='config-1')
+    mock_client.delete_endpoint_config.assert_any_call(EndpointConfigName='config-2')
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.endpoints.get_sagemaker_client')
+async def test_describe_endpoints_many(mock_get_sagemaker_client):
+    """Test describing several SageMaker AI Endpoints at once."""
+    mock_client = MagicMock()
+    mock_client.describe_endpoint.side_effect = lambda EndpointName: {'EndpointName': EndpointName}
+    mock_get_sagemaker_client.return_value = mock_client
+    results = await describe_endpoints_many(['endpoint-1', 'endpoint-2'])
+    assert results == {
+        'endpoint-1': {'EndpointName': 'endpoint-1'},
+        'endpoint-2': {'EndpointName': 'endpoint-2'},
+    }
@@ -1,20 +1,31 @@
 """Tests for SageMaker AI Jobs (Training, Processing, Transform, Inference Recommender)."""
 
 import pytest
+from botocore.exceptions import ClientError
+from datetime import datetime
 from sagemaker_ai_mcp_server.helpers.jobs import (
     describe_inference_recommendations_job,
     describe_processing_job,
+    describe_processing_jobs_many,
     describe_training_job,
     describe_transform_job,
+    iter_training_jobs,
+    list_all_jobs,
     list_inference_recommendations_job_steps,
     list_inference_recommendations_jobs,
     list_processing_jobs,
     list_training_jobs,
+    list_training_jobs_fast,
+    list_training_jobs_with_details,
     list_transform_jobs,
+    list_transform_jobs_with_details,
     stop_inference_recommendations_job,
     stop_processing_job,
+    stop_processing_jobs,
     stop_training_job,
+    stop_training_jobs,
     stop_transform_job,
+    stop_transform_jobs,
 )
 from unittest.mock import MagicMock, patch
 
@@ -24,13 +35,13 @@ from unittest.mock import MagicMock, patch
 async def test_list_training_jobs(mock_get_sagemaker_client):
     """Test listing SageMaker AI Training Jobs."""
     mock_client = MagicMock()
-    mock_client.list_training_jobs.return_value = {
-        'TrainingJobSummaries': [{'TrainingJobName': 'test-job'}]
-    }
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {'TrainingJobSummaries': [{'TrainingJobName': 'test-job'}]}
+    ]
     mock_get_sagemaker_client.return_value = mock_client
     jobs = await list_training_jobs()
     mock_get_sagemaker_client.assert_called_once()
-    mock_client.list_training_jobs.assert_called_once()
+    mock_client.get_paginator.assert_called_once_with('list_training_jobs')
     assert jobs == [{'TrainingJobName': 'test-job'}]
 
 
@@ -39,13 +50,13 @@ async def test_list_training_jobs(mock_get_sagemaker_client):
 async def test_list_processing_jobs(mock_get_sagemaker_client):
     """Test listing SageMaker AI Processing Jobs."""
     mock_client = MagicMock()
-    mock_client.list_processing_jobs.return_value = {
-        'ProcessingJobSummaries': [{'ProcessingJobName': 'test-processing-job'}]
-    }
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {'ProcessingJobSummaries': [{'ProcessingJobName': 'test-processing-job'}]}
+    ]
     mock_get_sagemaker_client.return_value = mock_client
     jobs = await list_processing_jobs()
     mock_get_sagemaker_client.assert_called_once()
-    mock_client.list_processing_jobs.assert_called_once()
+    mock_client.get_paginator.assert_called_once_with('list_processing_jobs')
     assert jobs == [{'ProcessingJobName': 'test-processing-job'}]
 
 
@@ -54,33 +65,75 @@ async def test_list_processing_jobs(mock_get_sagemaker_client):
 async def test_list_transform_jobs(mock_get_sagemaker_client):
     """Test listing SageMaker AI Transform Jobs."""
     mock_client = MagicMock()
-    mock_client.list_transform_jobs.return_value = {
-        'TransformJobSummaries': [{'TransformJobName': 'test-transform-job'}]
-    }
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {'TransformJobSummaries': [{'TransformJobName': 'test-transform-job'}]}
+    ]
     mock_get_sagemaker_client.return_value = mock_client
     jobs = await list_transform_jobs()
     mock_get_sagemaker_client.assert_called_once()
-    mock_client.list_transform_jobs.assert_called_once()
+    mock_client.get_paginator.assert_called_once_with('list_transform_jobs')
     assert jobs == [{'TransformJobName': 'test-transform-job'}]
 
 
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.jobs.get_sagemaker_client')
+async def test_list_all_jobs(mock_get_sagemaker_client):
+    """Test listing every type of SageMaker AI Job at once."""
+    pages = {
+        'list_training_jobs': [{'TrainingJobSummaries': [{'TrainingJobName': 'train'}]}],
+        'list_processing_jobs': [{'ProcessingJobSummaries': [{'ProcessingJobName': 'process'}]}],
+        'list_transform_jobs': [{'TransformJobSummaries': [{'TransformJobName': 'transform'}]}],
+        'list_inference_recommendations_jobs': [{'InferenceRecommendationsJobs': []}],
+    }
+    mock_client = MagicMock()
+    mock_client.get_paginator.side_effect = lambda name: MagicMock(
+        paginate=MagicMock(return_value=pages[name])
+    )
+    mock_get_sagemaker_client.return_value = mock_client
+    jobs = await list_all_jobs(max_items=10)
+    assert jobs == {
+        'TrainingJobs': [{'TrainingJobName': 'train'}],
+        'ProcessingJobs': [{'ProcessingJobName': 'process'}],
+        'TransformJobs': [{'TransformJobName': 'transform'}],
+        'InferenceRecommendationsJobs': [],
+    }
+
+
 @pytest.mark.asyncio
 @patch('sagemaker_ai_mcp_server.helpers.jobs.get_sagemaker_client')
 async def test_list_inference_recommendations_jobs(mock_get_sagemaker_client):
     """Test listing SageMaker AI Inference Recommendations Jobs."""
     mock_client = MagicMock()
-    mock_client.list_inference_recommendations_jobs.return_value = {
-        'InferenceRecommendationsJobs': [
-            {'JobName': 'test-job-1', 'Status': 'Completed'},
-            {'JobName': 'test-job-2', 'Status': 'InProgress'},
-        ]
-    }
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {
+            'InferenceRecommendationsJobs': [
+                {'JobName': 'test-job-1', 'Status': 'Completed'},
+                {'JobName': 'test-job-2', 'Status': 'InProgress'},
+            ]
+        }
+    ]
     mock_get_sagemaker_client.return_value = mock_client
     result = await list_inference_recommendations_jobs()
     assert len(result) == 2
     assert result[0]['JobName'] == 'test-job-1'
     assert result[1]['JobName'] == 'test-job-2'
-    mock_client.list_inference_recommendations_jobs.assert_called_once()
+    mock_client.get_paginator.assert_called_once_with('list_inference_recommendations_jobs')
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.jobs.get_sagemaker_client')
+async def test_list_inference_recommendations_jobs_with_filters(mock_get_sagemaker_client):
+    """Test that Inference Recommendations Jobs are filtered and capped by SageMaker."""
+    mock_client = MagicMock()
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {'InferenceRecommendationsJobs': [{'JobName': 'test-job-1'}]}
+    ]
+    mock_get_sagemaker_client.return_value = mock_client
+    result = await list_inference_recommendations_jobs(max_items=5, name_contains='test')
+    assert result == [{'JobName': 'test-job-1'}]
+    mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+        PaginationConfig={'PageSize': 100, 'MaxItems': 5}, NameContains='test'
+    )
 
 
 @pytest.mark.asyncio
@@ -89,18 +142,23 @@ async def test_list_inference_recommendations_job_steps(mock_get_sagemaker_clien
     """Test listing steps for a SageMaker AI Inference Recommendations Job."""
     job_name = 'test-job'
     mock_client = MagicMock()
-    mock_client.list_inference_recommendations_job_steps.return_value = {
-        'Steps': [
-            {'StepName': 'step-1', 'Status': 'Completed'},
-            {'StepName': 'step-2', 'Status': 'InProgress'},
-        ]
-    }
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {
+            'Steps': [
+                {'StepName': 'step-1', 'Status': 'Completed'},
+                {'StepName': 'step-2', 'Status': 'InProgress'},
+            ]
+        }
+    ]
     mock_get_sagemaker_client.return_value = mock_client
     result = await list_inference_recommendations_job_steps(job_name)
     assert len(result) == 2
     assert result[0]['StepName'] == 'step-1'
     assert result[1]['StepName'] == 'step-2'
-    mock_client.list_inference_recommendations_job_steps.assert_called_once_with(JobName=job_name)
+    mock_client.get_paginator.assert_called_once_with('list_inference_recommendations_job_steps')
+    mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+        PaginationConfig={'PageSize': 100}, JobName=job_name
+    )
 
 
 @pytest.mark.asyncio
@@ -219,3 +277,247 @@ async def test_stop_inference_recommendations_job(mock_get_sagemaker_client):
     mock_get_sagemaker_client.return_value = mock_client
     await stop_inference_recommendations_job(job_name)
     mock_client.stop_inference_recommendations_job.assert_called_once_with(JobName=job_name)
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.jobs.get_sagemaker_client')
+async def test_describe_training_job_is_cached_until_stopped(mock_get_sagemaker_client):
+    """Test that describe_training_job is served from the cache until the job is stopped."""
+    mock_client = MagicMock()
+    mock_client.describe_training_job.return_value = {'TrainingJobName': 'test-job'}
+    mock_get_sagemaker_client.return_value = mock_client
+    await describe_training_job('test-job')
+    await describe_training_job('test-job')
+    mock_client.describe_training_job.assert_called_once_with(TrainingJobName='test-job')
+
+    await stop_training_job('test-job')
+    await describe_training_job('test-job')
+    assert mock_client.describe_training_job.call_count == 2
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.jobs.get_sagemaker_client')
+async def test_iter_training_jobs(mock_get_sagemaker_client):
+    """Test iterating over SageMaker AI Training Jobs across pages with filters."""
+    mock_client = MagicMock()
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {'TrainingJobSummaries': [{'TrainingJobName': 'job-1'}]},
+        {'TrainingJobSummaries': [{'TrainingJobName': 'job-2'}]},
+    ]
+    mock_get_sagemaker_client.return_value = mock_client
+    jobs = [job async for job in iter_training_jobs(max_items=2, StatusEquals='Completed')]
+    mock_client.get_paginator.assert_called_once_with('list_training_jobs')
+    mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+        PaginationConfig={'PageSize': 100, 'MaxItems': 2}, StatusEquals='Completed'
+    )
+    assert jobs == [{'TrainingJobName': 'job-1'}, {'TrainingJobName': 'job-2'}]
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.jobs.get_sagemaker_client')
+async def test_list_training_jobs_fast(mock_get_sagemaker_client):
+    """Test listing SageMaker AI Training Jobs over parallel time windows."""
+    old = {'TrainingJobArn': 'arn-1', 'CreationTime': datetime(2024, 1, 1)}
+    new = {'TrainingJobArn': 'arn-2', 'CreationTime': datetime(2024, 1, 2)}
+    mock_client = MagicMock()
+    mock_client.get_paginator.return_value.paginate.side_effect = [
+        [{'TrainingJobSummaries': [old]}],
+        [{'TrainingJobSummaries': [old, new]}],
+        [{'TrainingJobSummaries': []}],
+    ]
+    mock_get_sagemaker_client.return_value = mock_client
+    jobs = await list_training_jobs_fast(days=3, buckets=3)
+    assert mock_client.get_paginator.return_value.paginate.call_count == 3
+    windows = [
+        call.kwargs for call in mock_client.get_paginator.return_value.paginate.call_args_list
+    ]
+    assert all(w['CreationTimeAfter'] < w['CreationTimeBefore'] for w in windows)
+    assert jobs == [new, old]
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.jobs.get_sagemaker_client')
+async def test_list_training_jobs_fast_retries_throttled_windows(mock_get_sagemaker_client):
+    """Test that throttled time windows are scanned again serially."""
+    throttled = ClientError(
+        {'Error': {'Code': 'ThrottlingException', 'Message': 'Rate exceeded'}},
+        'ListTrainingJobs',
+    )
+    job = {'TrainingJobArn': 'arn-1', 'CreationTime': datetime(2024, 1, 1)}
+    mock_client = MagicMock()
+    mock_client.get_paginator.return_value.paginate.side_effect = [
+        throttled,
+        [{'TrainingJobSummaries': []}],
+        [{'TrainingJobSummaries': [job]}],
+    ]
+    mock_get_sagemaker_client.return_value = mock_client
+    jobs = await list_training_jobs_fast(days=2, buckets=2)
+    assert mock_client.get_paginator.return_value.paginate.call_count == 3
+    assert jobs == [job]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'error',
+    [
+        ClientError({'Error': {'Code': 'TooManyRequestsException'}}, 'ListTrainingJobs'),
+        ClientError(
+            {
+                'Error': {'Code': 'ServiceUnavailable'},
+                'ResponseMetadata': {'HTTPStatusCode': 503},
+            },
+            'ListTrainingJobs',
+        ),
+    ],
+)
+@patch('sagemaker_ai_mcp_server.helpers.jobs.get_sagemaker_client')
+async def test_list_training_jobs_fast_retries_transient_errors(mock_get_sagemaker_client, error):
+    """Test that windows failing with any transient error are scanned again."""
+    job = {'TrainingJobArn': 'arn-1', 'CreationTime': datetime(2024, 1, 1)}
+    mock_client = MagicMock()
+    mock_client.get_paginator.return_value.paginate.side_effect = [
+        [{'TrainingJobSummaries': [job]}],
+        error,
+        [{'TrainingJobSummaries': []}],
+    ]
+    mock_get_sagemaker_client.return_value = mock_client
+    jobs = await list_training_jobs_fast(days=2, buckets=2)
+    assert mock_client.get_paginator.return_value.paginate.call_count == 3
+    assert jobs == [job]
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.jobs.get_sagemaker_client')
+async def test_list_training_jobs_fast_raises_other_errors(mock_get_sagemaker_client):
+    """Test that a window failing with a non-transient error fails the scan."""
+    denied = ClientError({'Error': {'Code': 'AccessDeniedException'}}, 'ListTrainingJobs')
+    mock_client = MagicMock()
+    mock_client.get_paginator.return_value.paginate.side_effect = [
+        [{'TrainingJobSummaries': []}],
+        denied,
+    ]
+    mock_get_sagemaker_client.return_value = mock_client
+    with pytest.raises(ClientError):
+        await list_training_jobs_fast(days=2, buckets=2)
+
+
+@pytest.mark.asyncio
+async def test_list_training_jobs_fast_invalid_days():
+    """Test that a non-positive number of days is rejected."""
+    with pytest.raises(ValueError):
+        await list_training_jobs_fast(days=0)
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.jobs.get_sagemaker_client')
+async def test_stop_training_jobs(mock_get_sagemaker_client):
+    """Test stopping several SageMaker AI Training Jobs at once."""
+    mock_client = MagicMock()
+    mock_client.stop_training_job.side_effect = [None, Exception('Job already completed')]
+    mock_get_sagemaker_client.return_value = mock_client
+    results = await stop_training_jobs(['job-1', 'job-2'], concurrency=1)
+    assert results == {'job-1': None, 'job-2': 'Job already completed'}
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.jobs.get_sagemaker_client')
+async def test_stop_processing_jobs(mock_get_sagemaker_client):
+    """Test stopping several SageMaker AI Processing Jobs at once."""
+    mock_client = MagicMock()
+    mock_get_sagemaker_client.return_value = mock_client
+    results = await stop_processing_jobs(['job-1', 'job-2'])
+    assert results == {'job-1': None, 'job-2': None}
+    assert mock_client.stop_processing_job.call_count == 2
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.jobs.get_sagemaker_client')
+async def test_stop_transform_jobs(mock_get_sagemaker_client):
+    """Test stopping several SageMaker AI Transform Jobs at once."""
+    mock_client = MagicMock()
+    mock_get_sagemaker_client.return_value = mock_client
+    results = await stop_transform_jobs(['job-1'])
+    assert results == {'job-1': None}
+    mock_client.stop_transform_job.assert_called_once_with(TransformJobName='job-1')
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.jobs.get_sagemaker_client')
+async def test_describe_processing_jobs_many(mock_get_sagemaker_client):
+    """Test describing several SageMaker AI Processing Jobs, keeping failures per name."""
+    mock_client = MagicMock()
+
+    def describe(ProcessingJobName):
+        if ProcessingJobName == 'job-2':
+            raise Exception('Job not found')
+        return {'ProcessingJobName': ProcessingJobName}
+
+    mock_client.describe_processing_job.side_effect = describe
+    mock_get_sagemaker_client.return_value = mock_client
+    results = await describe_processing_jobs_many(['job-1', 'job-2'])
+    assert results == {
+        'job-1': {'ProcessingJobName': 'job-1'},
+        'job-2': {'Error': 'Job not found'},
+    }
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.jobs.get_sagemaker_client')
+async def test_list_training_jobs_with_details(mock_get_sagemaker_client):
+    """Test listing the most recent SageMaker AI Training Jobs and describing each of them."""
+    mock_client = MagicMock()
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {'TrainingJobSummaries': [{'TrainingJobName': 'job-1'}, {'TrainingJobName': 'job-2'}]}
+    ]
+    mock_client.describe_training_job.side_effect = lambda TrainingJobName: {
+        'TrainingJobName': TrainingJobName,
+        'TrainingJobStatus': 'Completed',
+    }
+    mock_get_sagemaker_client.return_value = mock_client
+    results = await list_training_jobs_with_details(max_items=2)
+    mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+        PaginationConfig={'PageSize': 100, 'MaxItems': 2}
+    )
+    assert results == {
+        'job-1': {'TrainingJobName': 'job-1', 'TrainingJobStatus': 'Completed'},
+        'job-2': {'TrainingJobName': 'job-2', 'TrainingJobStatus': 'Completed'},
+    }
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.jobs.get_sagemaker_client')
+async def test_list_transform_jobs_with_details(mock_get_sagemaker_client):
+    """Test that a Transform Job that fails to describe is reported under its name."""
+    mock_client = MagicMock()
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {'TransformJobSummaries': [{'TransformJobName': 'job-1'}, {'TransformJobName': 'job-2'}]}
+    ]
+
+    def describe(TransformJobName):
+        if TransformJobName == 'job-2':
+            raise Exception('Job not found')
+        return {'TransformJobName': TransformJobName}
+
+    mock_client.describe_transform_job.side_effect = describe
+    mock_get_sagemaker_client.return_value = mock_client
+    results = await list_transform_jobs_with_details()
+    assert results == {
+        'job-1': {'TransformJobName': 'job-1'},
+        'job-2': {'Error': 'Job not found'},
+    }
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.jobs.get_sagemaker_client')
+async def test_list_processing_jobs_with_filters(mock_get_sagemaker_client):
+    """Test that list filters are sent to SageMaker and unset ones are left out."""
+    mock_client = MagicMock()
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {'ProcessingJobSummaries': [{'ProcessingJobName': 'job-1'}]}
+    ]
+    mock_get_sagemaker_client.return_value = mock_client
+    jobs = await list_processing_jobs(status_equals='Failed', name_contains='job')
+    mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+        PaginationConfig={'PageSize': 100}, StatusEquals='Failed', NameContains='job'
+    )
+    assert jobs == [{'ProcessingJobName': 'job-1'}]
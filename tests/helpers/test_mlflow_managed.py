@@ -1,6 +1,7 @@
 """Tests for SageMaker AI MLFlow Managed Tracking Servers."""
 
 import pytest
+from botocore.exceptions import ClientError
 from sagemaker_ai_mcp_server.helpers.mlflow_managed import (
     create_mlflow_tracking_server,
     create_presigned_mlflow_tracking_server_url,
@@ -24,10 +25,10 @@ async def test_list_mlflow_tracking_servers(mock_get_sagemaker_client):
             {'TrackingServerName': 'test-mlflow-server', 'Status': 'InService'}
         ]
     }
-    mock_client.list_mlflow_tracking_servers.return_value = mock_response
+    mock_client.get_paginator.return_value.paginate.return_value = [mock_response]
     servers = await list_mlflow_tracking_servers()
     mock_get_sagemaker_client.assert_called_once()
-    mock_client.list_mlflow_tracking_servers.assert_called_once()
+    mock_client.get_paginator.assert_called_once_with('list_mlflow_tracking_servers')
     expected = [{'TrackingServerName': 'test-mlflow-server', 'Status': 'InService'}]
     assert servers == expected
 
@@ -52,6 +53,27 @@ async def test_create_mlflow_tracking_server(mock_get_role_arn, mock_get_sagemak
     )
 
 
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.mlflow_managed.get_sagemaker_client')
+@patch('sagemaker_ai_mcp_server.helpers.mlflow_managed.get_sagemaker_execution_role_arn')
+async def test_create_mlflow_tracking_server_clears_cached_not_found(
+    mock_get_role_arn, mock_get_sagemaker_client
+):
+    """Test that a not-found describe cached before the create is not served after it."""
+    mock_client = MagicMock()
+    mock_client.describe_mlflow_tracking_server.side_effect = [
+        ClientError({'Error': {'Code': 'ResourceNotFound'}}, 'DescribeMlflowTrackingServer'),
+        {'TrackingServerName': 'test-mlflow-server', 'TrackingServerStatus': 'Creating'},
+    ]
+    mock_get_sagemaker_client.return_value = mock_client
+    mock_get_role_arn.return_value = 'arn:aws:iam::123456789012:role/AmazonSageMaker-ExecutionRole'
+    with pytest.raises(ClientError):
+        await describe_mlflow_tracking_server('test-mlflow-server')
+    await create_mlflow_tracking_server('test-mlflow-server', 's3://bucket/artifacts', 'Small')
+    result = await describe_mlflow_tracking_server('test-mlflow-server')
+    assert result['TrackingServerStatus'] == 'Creating'
+
+
 @pytest.mark.asyncio
 @patch('sagemaker_ai_mcp_server.helpers.mlflow_managed.get_sagemaker_client')
 async def test_create_presigned_mlflow_tracking_server_url_default(mock_get_sagemaker_client):
@@ -107,6 +129,24 @@ async def test_describe_mlflow_tracking_server(mock_get_sagemaker_client):
     assert response == expected_response
 
 
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.mlflow_managed.get_sagemaker_client')
+async def test_describe_mlflow_tracking_server_is_invalidated_on_stop(mock_get_sagemaker_client):
+    """Test that stopping a Tracking Server drops its cached description."""
+    mock_client = MagicMock()
+    mock_get_sagemaker_client.return_value = mock_client
+    mock_client.describe_mlflow_tracking_server.side_effect = [
+        {'TrackingServerName': 'test-mlflow-server', 'TrackingServerStatus': 'Started'},
+        {'TrackingServerName': 'test-mlflow-server', 'TrackingServerStatus': 'Stopping'},
+    ]
+    await describe_mlflow_tracking_server('test-mlflow-server')
+    cached = await describe_mlflow_tracking_server('test-mlflow-server')
+    assert cached['TrackingServerStatus'] == 'Started'
+    await stop_mlflow_tracking_server('test-mlflow-server')
+    response = await describe_mlflow_tracking_server('test-mlflow-server')
+    assert response['TrackingServerStatus'] == 'Stopping'
+
+
 @pytest.mark.asyncio
 @patch('sagemaker_ai_mcp_server.helpers.mlflow_managed.get_sagemaker_client')
 async def test_start_mlflow_tracking_server(mock_get_sagemaker_client):
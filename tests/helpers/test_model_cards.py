@@ -20,10 +20,10 @@ async def test_list_model_cards(mock_get_sagemaker_client):
     mock_response = {
         'ModelCardSummaries': [{'ModelCardName': 'test-card', 'ModelCardArn': 'arn:aws:...'}]
     }
-    mock_client.list_model_cards.return_value = mock_response
+    mock_client.get_paginator.return_value.paginate.return_value = [mock_response]
     cards = await list_model_cards()
     mock_get_sagemaker_client.assert_called_once()
-    mock_client.list_model_cards.assert_called_once()
+    mock_client.get_paginator.assert_called_once_with('list_model_cards')
     expected = [{'ModelCardName': 'test-card', 'ModelCardArn': 'arn:aws:...'}]
     assert cards == expected
 
@@ -39,10 +39,10 @@ async def test_list_model_card_export_jobs(mock_get_sagemaker_client):
             {'ModelCardExportJobName': 'test-export-job', 'ModelCardArn': 'arn:aws:...'}
         ]
     }
-    mock_client.list_model_card_export_jobs.return_value = mock_response
+    mock_client.get_paginator.return_value.paginate.return_value = [mock_response]
     jobs = await list_model_card_export_jobs()
     mock_get_sagemaker_client.assert_called_once()
-    mock_client.list_model_card_export_jobs.assert_called_once()
+    mock_client.get_paginator.assert_called_once_with('list_model_card_export_jobs')
     expected = [{'ModelCardExportJobName': 'test-export-job', 'ModelCardArn': 'arn:aws:...'}]
     assert jobs == expected
 
@@ -56,10 +56,13 @@ async def test_list_model_card_versions(mock_get_sagemaker_client):
     mock_response = {
         'ModelCardVersionSummaryList': [{'ModelCardVersion': '1.0', 'ModelCardArn': 'arn:aws:...'}]
     }
-    mock_client.list_model_card_versions.return_value = mock_response
+    mock_client.get_paginator.return_value.paginate.return_value = [mock_response]
     versions = await list_model_card_versions('test-card')
     mock_get_sagemaker_client.assert_called_once()
-    mock_client.list_model_card_versions.assert_called_once_with(ModelCardName='test-card')
+    mock_client.get_paginator.assert_called_once_with('list_model_card_versions')
+    mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+        PaginationConfig={'PageSize': 100}, ModelCardName='test-card'
+    )
     expected = [{'ModelCardVersion': '1.0', 'ModelCardArn': 'arn:aws:...'}]
     assert versions == expected
 
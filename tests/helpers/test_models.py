@@ -1,7 +1,12 @@
 """Tests for SageMaker AI Models."""
 
 import pytest
-from sagemaker_ai_mcp_server.helpers.models import delete_model, describe_model, list_models
+from sagemaker_ai_mcp_server.helpers.models import (
+    delete_model,
+    describe_model,
+    iter_models,
+    list_models,
+)
 from unittest.mock import MagicMock, patch
 
 
@@ -14,14 +19,30 @@ async def test_list_models(mock_get_sagemaker_client):
     mock_response = {
         'Models': [{'ModelName': 'test-model', 'CreationTime': '2023-01-01T00:00:00Z'}]
     }
-    mock_client.list_models.return_value = mock_response
+    mock_client.get_paginator.return_value.paginate.return_value = [mock_response]
     models = await list_models()
     mock_get_sagemaker_client.assert_called_once()
-    mock_client.list_models.assert_called_once()
+    mock_client.get_paginator.assert_called_once_with('list_models')
     expected = [{'ModelName': 'test-model', 'CreationTime': '2023-01-01T00:00:00Z'}]
     assert models == expected
 
 
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.models.get_sagemaker_client')
+async def test_list_models_with_filters(mock_get_sagemaker_client):
+    """Test that SageMaker AI Models are filtered and capped by SageMaker."""
+    mock_client = MagicMock()
+    mock_get_sagemaker_client.return_value = mock_client
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {'Models': [{'ModelName': 'test-model'}]}
+    ]
+    models = await list_models(max_items=10, name_contains='test')
+    mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+        PaginationConfig={'PageSize': 100, 'MaxItems': 10}, NameContains='test'
+    )
+    assert models == [{'ModelName': 'test-model'}]
+
+
 @pytest.mark.asyncio
 @patch('sagemaker_ai_mcp_server.helpers.models.get_sagemaker_client')
 async def test_describe_model(mock_get_sagemaker_client):
@@ -51,3 +72,39 @@ async def test_delete_model(mock_get_sagemaker_client):
     await delete_model('test-model')
     mock_get_sagemaker_client.assert_called_once()
     mock_client.delete_model.assert_called_once_with(ModelName='test-model')
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.models.get_sagemaker_client')
+async def test_list_models_is_cached_until_a_model_is_deleted(mock_get_sagemaker_client):
+    """Test that list_models is served from the cache until a Model is deleted."""
+    mock_client = MagicMock()
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {'Models': [{'ModelName': 'test-model'}]}
+    ]
+    mock_get_sagemaker_client.return_value = mock_client
+    await list_models()
+    await list_models()
+    mock_client.get_paginator.assert_called_once_with('list_models')
+
+    await delete_model('test-model')
+    assert await list_models() == [{'ModelName': 'test-model'}]
+    assert mock_client.get_paginator.call_count == 2
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.models.get_sagemaker_client')
+async def test_iter_models(mock_get_sagemaker_client):
+    """Test iterating over SageMaker AI Models across pages with filters."""
+    mock_client = MagicMock()
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {'Models': [{'ModelName': 'model-1'}]},
+        {'Models': [{'ModelName': 'model-2'}]},
+    ]
+    mock_get_sagemaker_client.return_value = mock_client
+    models = [model async for model in iter_models(NameContains='model')]
+    mock_client.get_paginator.assert_called_once_with('list_models')
+    mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+        PaginationConfig={'PageSize': 100}, NameContains='model'
+    )
+    assert models == [{'ModelName': 'model-1'}, {'ModelName': 'model-2'}]
@@ -1,17 +1,27 @@
 """Tests for SageMaker AI Pipelines."""
 
+import hashlib
 import pytest
+from datetime import datetime
 from sagemaker_ai_mcp_server.helpers.pipelines import (
     delete_pipeline,
+    describe_all_pipelines,
     describe_pipeline,
     describe_pipeline_definition_for_execution,
     describe_pipeline_execution,
+    digest_definition,
+    iter_pipeline_execution_steps,
+    iter_pipeline_executions,
+    iter_pipelines,
+    list_all_executions_for_pipelines,
     list_pipeline_execution_steps,
     list_pipeline_executions,
+    list_pipeline_executions_with_details,
     list_pipeline_parameters_for_execution,
     list_pipelines,
     start_pipeline_execution,
     stop_pipeline_execution,
+    stop_pipeline_executions,
 )
 from unittest.mock import MagicMock, patch
 
@@ -21,13 +31,13 @@ from unittest.mock import MagicMock, patch
 async def test_list_pipelines(mock_get_sagemaker_client):
     """Test listing SageMaker AI Pipelines."""
     mock_client = MagicMock()
-    mock_client.list_pipelines.return_value = {
-        'PipelineSummaries': [{'PipelineName': 'test-pipeline'}]
-    }
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {'PipelineSummaries': [{'PipelineName': 'test-pipeline'}]}
+    ]
     mock_get_sagemaker_client.return_value = mock_client
     pipelines = await list_pipelines()
     mock_get_sagemaker_client.assert_called_once()
-    mock_client.list_pipelines.assert_called_once()
+    mock_client.get_paginator.assert_called_once_with('list_pipelines')
     assert pipelines == [{'PipelineName': 'test-pipeline'}]
 
 
@@ -36,17 +46,22 @@ async def test_list_pipelines(mock_get_sagemaker_client):
 async def test_list_pipeline_executions(mock_get_sagemaker_client):
     """Test listing SageMaker AI Pipeline Executions."""
     mock_client = MagicMock()
-    mock_client.list_pipeline_executions.return_value = {
-        'PipelineExecutionSummaries': [
-            {
-                'PipelineExecutionArn': 'arn:aws:sagemaker:us-west-2:123456789012:pipeline/test-pipeline/execution/test-execution'
-            }
-        ]
-    }
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {
+            'PipelineExecutionSummaries': [
+                {
+                    'PipelineExecutionArn': 'arn:aws:sagemaker:us-west-2:123456789012:pipeline/test-pipeline/execution/test-execution'
+                }
+            ]
+        }
+    ]
     mock_get_sagemaker_client.return_value = mock_client
     executions = await list_pipeline_executions('test-pipeline')
     mock_get_sagemaker_client.assert_called_once()
-    mock_client.list_pipeline_executions.assert_called_once_with(PipelineName='test-pipeline')
+    mock_client.get_paginator.assert_called_once_with('list_pipeline_executions')
+    mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+        PaginationConfig={'PageSize': 100}, PipelineName='test-pipeline'
+    )
     assert executions == [
         {
             'PipelineExecutionArn': 'arn:aws:sagemaker:us-west-2:123456789012:pipeline/test-pipeline/execution/test-execution'
@@ -59,14 +74,15 @@ async def test_list_pipeline_executions(mock_get_sagemaker_client):
 async def test_list_pipeline_execution_steps(mock_get_sagemaker_client):
     """Test listing SageMaker AI Pipeline Execution Steps."""
     mock_client = MagicMock()
-    mock_client.list_pipeline_execution_steps.return_value = {
-        'PipelineExecutionSteps': [{'StepName': 'test-step', 'StepStatus': 'Succeeded'}]
-    }
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {'PipelineExecutionSteps': [{'StepName': 'test-step', 'StepStatus': 'Succeeded'}]}
+    ]
     mock_get_sagemaker_client.return_value = mock_client
     steps = await list_pipeline_execution_steps('test-execution')
     mock_get_sagemaker_client.assert_called_once()
-    mock_client.list_pipeline_execution_steps.assert_called_once_with(
-        PipelineExecutionArn='test-execution'
+    mock_client.get_paginator.assert_called_once_with('list_pipeline_execution_steps')
+    mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+        PaginationConfig={'PageSize': 100}, PipelineExecutionArn='test-execution'
     )
     assert steps == [{'StepName': 'test-step', 'StepStatus': 'Succeeded'}]
 
@@ -76,14 +92,15 @@ async def test_list_pipeline_execution_steps(mock_get_sagemaker_client):
 async def test_list_pipeline_parameters_for_execution(mock_get_sagemaker_client):
     """Test listing SageMaker AI Pipeline Parameters for Execution."""
     mock_client = MagicMock()
-    mock_client.list_pipeline_parameters_for_execution.return_value = {
-        'PipelineParameters': [{'Name': 'param1', 'Value': 'value1'}]
-    }
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {'PipelineParameters': [{'Name': 'param1', 'Value': 'value1'}]}
+    ]
     mock_get_sagemaker_client.return_value = mock_client
     parameters = await list_pipeline_parameters_for_execution('test-execution')
     mock_get_sagemaker_client.assert_called_once()
-    mock_client.list_pipeline_parameters_for_execution.assert_called_once_with(
-        PipelineExecutionArn='test-execution'
+    mock_client.get_paginator.assert_called_once_with('list_pipeline_parameters_for_execution')
+    mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+        PaginationConfig={'PageSize': 100}, PipelineExecutionArn='test-execution'
     )
     assert parameters == [{'Name': 'param1', 'Value': 'value1'}]
 
@@ -152,9 +169,7 @@ async def test_start_pipeline_execution_without_parameters(mock_get_sagemaker_cl
     mock_get_sagemaker_client.return_value = mock_client
     response = await start_pipeline_execution('test-pipeline')
     mock_get_sagemaker_client.assert_called_once()
-    mock_client.start_pipeline_execution.assert_called_once_with(
-        PipelineName='test-pipeline', PipelineParameters=[]
-    )
+    mock_client.start_pipeline_execution.assert_called_once_with(PipelineName='test-pipeline')
     assert response == expected_response
 
 
@@ -194,6 +209,17 @@ async def test_stop_pipeline_execution(mock_get_sagemaker_client):
     mock_client.stop_pipeline_execution.assert_called_once_with(PipelineExecutionArn=execution_arn)
 
 
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.pipelines.get_sagemaker_client')
+async def test_stop_pipeline_executions(mock_get_sagemaker_client):
+    """Test stopping several SageMaker AI Pipeline Executions at once."""
+    mock_client = MagicMock()
+    mock_client.stop_pipeline_execution.side_effect = [None, Exception('Execution not found')]
+    mock_get_sagemaker_client.return_value = mock_client
+    results = await stop_pipeline_executions(['arn-1', 'arn-2'], concurrency=1)
+    assert results == {'arn-1': None, 'arn-2': 'Execution not found'}
+
+
 @pytest.mark.asyncio
 @patch('sagemaker_ai_mcp_server.helpers.pipelines.get_sagemaker_client')
 async def test_delete_pipeline(mock_get_sagemaker_client):
@@ -203,3 +229,199 @@ async def test_delete_pipeline(mock_get_sagemaker_client):
     await delete_pipeline('test-pipeline')
     mock_get_sagemaker_client.assert_called_once()
     mock_client.delete_pipeline.assert_called_once_with(PipelineName='test-pipeline')
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.pipelines.get_sagemaker_client')
+async def test_list_pipeline_executions_is_cached_until_an_execution_starts(
+    mock_get_sagemaker_client,
+):
+    """Test that starting an execution drops the cached executions of its Pipeline."""
+    mock_client = MagicMock()
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {'PipelineExecutionSummaries': []}
+    ]
+    mock_get_sagemaker_client.return_value = mock_client
+    await list_pipeline_executions('test-pipeline')
+    await list_pipeline_executions('test-pipeline')
+    mock_client.get_paginator.assert_called_once_with('list_pipeline_executions')
+    mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+        PaginationConfig={'PageSize': 100}, PipelineName='test-pipeline'
+    )
+
+    await start_pipeline_execution('test-pipeline')
+    await list_pipeline_executions('test-pipeline')
+    assert mock_client.get_paginator.call_count == 2
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.pipelines.get_sagemaker_client')
+async def test_list_pipeline_executions_with_filters(mock_get_sagemaker_client):
+    """Test that execution filters are sent to SageMaker."""
+    mock_client = MagicMock()
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {'PipelineExecutionSummaries': []}
+    ]
+    mock_get_sagemaker_client.return_value = mock_client
+    created_after = datetime(2024, 1, 1)
+    await list_pipeline_executions(
+        'test-pipeline', created_after=created_after, sort_order='Ascending'
+    )
+    mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+        PaginationConfig={'PageSize': 100},
+        PipelineName='test-pipeline',
+        CreatedAfter=created_after,
+        SortOrder='Ascending',
+    )
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.pipelines.get_sagemaker_client')
+async def test_list_pipelines_with_filters(mock_get_sagemaker_client):
+    """Test that pipeline filters and the item cap are sent to SageMaker."""
+    mock_client = MagicMock()
+    mock_client.get_paginator.return_value.paginate.return_value = [{'PipelineSummaries': []}]
+    mock_get_sagemaker_client.return_value = mock_client
+    await list_pipelines(max_items=10, name_prefix='train', sort_by='Name')
+    mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+        PaginationConfig={'PageSize': 100, 'MaxItems': 10},
+        PipelineNamePrefix='train',
+        SortBy='Name',
+    )
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.pipelines.get_sagemaker_client')
+async def test_describe_all_pipelines(mock_get_sagemaker_client):
+    """Test describing every SageMaker AI Pipeline in the account."""
+    mock_client = MagicMock()
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {'PipelineSummaries': [{'PipelineName': 'pipeline-1'}, {'PipelineName': 'pipeline-2'}]}
+    ]
+    mock_client.describe_pipeline.side_effect = lambda PipelineName: {'PipelineName': PipelineName}
+    mock_get_sagemaker_client.return_value = mock_client
+    results = await describe_all_pipelines()
+    assert results == {
+        'pipeline-1': {'PipelineName': 'pipeline-1'},
+        'pipeline-2': {'PipelineName': 'pipeline-2'},
+    }
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.pipelines.get_sagemaker_client')
+async def test_list_pipeline_executions_with_details(mock_get_sagemaker_client):
+    """Test listing the executions of a SageMaker AI Pipeline and describing each of them."""
+    mock_client = MagicMock()
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {
+            'PipelineExecutionSummaries': [
+                {'PipelineExecutionArn': 'arn-1'},
+                {'PipelineExecutionArn': 'arn-2'},
+            ]
+        }
+    ]
+    mock_client.describe_pipeline_execution.side_effect = lambda PipelineExecutionArn: {
+        'PipelineExecutionArn': PipelineExecutionArn,
+        'PipelineExecutionStatus': 'Succeeded',
+    }
+    mock_get_sagemaker_client.return_value = mock_client
+    results = await list_pipeline_executions_with_details('test-pipeline', max_items=2)
+    mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+        PaginationConfig={'PageSize': 100, 'MaxItems': 2}, PipelineName='test-pipeline'
+    )
+    assert results == {
+        'arn-1': {'PipelineExecutionArn': 'arn-1', 'PipelineExecutionStatus': 'Succeeded'},
+        'arn-2': {'PipelineExecutionArn': 'arn-2', 'PipelineExecutionStatus': 'Succeeded'},
+    }
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.pipelines.get_sagemaker_client')
+async def test_list_all_executions_for_pipelines(mock_get_sagemaker_client):
+    """Test listing the executions of several SageMaker AI Pipelines at once."""
+
+    def paginate(PaginationConfig, PipelineName):
+        if PipelineName == 'missing':
+            raise Exception('Pipeline not found')
+        return [{'PipelineExecutionSummaries': [{'PipelineExecutionArn': f'{PipelineName}/1'}]}]
+
+    mock_client = MagicMock()
+    mock_client.get_paginator.return_value.paginate.side_effect = paginate
+    mock_get_sagemaker_client.return_value = mock_client
+    results = await list_all_executions_for_pipelines(['pipeline-1', 'missing'])
+    assert results == {
+        'pipeline-1': [{'PipelineExecutionArn': 'pipeline-1/1'}],
+        'missing': {'Error': 'Pipeline not found'},
+    }
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.pipelines.get_sagemaker_client')
+async def test_iter_pipelines(mock_get_sagemaker_client):
+    """Test iterating over SageMaker AI Pipelines across pages with filters."""
+    mock_client = MagicMock()
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {'PipelineSummaries': [{'PipelineName': 'pipeline-1'}]},
+        {'PipelineSummaries': [{'PipelineName': 'pipeline-2'}]},
+    ]
+    mock_get_sagemaker_client.return_value = mock_client
+    pipelines = [p async for p in iter_pipelines(max_items=5, PipelineNamePrefix='pipe')]
+    mock_client.get_paginator.assert_called_once_with('list_pipelines')
+    mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+        PaginationConfig={'PageSize': 100, 'MaxItems': 5}, PipelineNamePrefix='pipe'
+    )
+    assert pipelines == [{'PipelineName': 'pipeline-1'}, {'PipelineName': 'pipeline-2'}]
+
+
+def test_digest_definition():
+    """Test that the pipeline definition is replaced by its SHA-256 digest."""
+    response = {'PipelineName': 'test-pipeline', 'PipelineDefinition': '{"Steps": []}'}
+    digested = digest_definition(response)
+    assert digested == {
+        'PipelineName': 'test-pipeline',
+        'PipelineDefinitionSha256': hashlib.sha256(b'{"Steps": []}').hexdigest(),
+    }
+    assert response['PipelineDefinition'] == '{"Steps": []}'
+    assert digest_definition({'PipelineName': 'test-pipeline'}) == {
+        'PipelineName': 'test-pipeline'
+    }
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.pipelines.get_sagemaker_client')
+async def test_iter_pipeline_executions(mock_get_sagemaker_client):
+    """Test iterating over the executions of a SageMaker AI Pipeline across pages."""
+    mock_client = MagicMock()
+    mock_client.get_paginator.return_value.paginate.return_value = [
+        {'PipelineExecutionSummaries': [{'PipelineExecutionArn': 'arn-1'}]},
+        {'PipelineExecutionSummaries': [{'PipelineExecutionArn': 'arn-2'}]},
+    ]
+    mock_get_sagemaker_client.return_value = mock_client
+    executions = [
+        e async for e in iter_pipeline_executions('test-pipeline', SortBy='CreationTime')
+    ]
+    mock_client.get_paginator.assert_called_once_with('list_pipeline_executions')
+    mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+        PaginationConfig={'PageSize': 100}, PipelineName='test-pipeline', SortBy='CreationTime'
+    )
+    assert executions == [{'PipelineExecutionArn': 'arn-1'}, {'PipelineExecutionArn': 'arn-2'}]
+
+
+@pytest.mark.asyncio
+@patch('sagemaker_ai_mcp_server.helpers.pipelines.get_sagemaker_client')
+async def test_iter_pipeline_execution_steps_stops_early(mock_get_sagemaker_client):
+    """Test that steps are fetched lazily, so later pages are never requested."""
+    pages_read = []
+
+    def pages():
+        for number in range(3):
+            pages_read.append(number)
+            yield {'PipelineExecutionSteps': [{'StepName': f'step-{number}'}]}
+
+    mock_client = MagicMock()
+    mock_client.get_paginator.return_value.paginate.return_value = pages()
+    mock_get_sagemaker_client.return_value = mock_client
+    async for step in iter_pipeline_execution_steps('arn-1'):
+        assert step == {'StepName': 'step-0'}
+        break
+    assert pages_read == [0]
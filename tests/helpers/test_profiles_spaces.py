@@ -14,10 +14,10 @@ async def test_list_user_profiles(mock_get_sagemaker_client):
     mock_response = {
         'UserProfiles': [{'UserProfileName': 'test-user', 'UserProfileArn': 'arn:aws:...'}]
     }
-    mock_client.list_user_profiles.return_value = mock_response
+    mock_client.get_paginator.return_value.paginate.return_value = [mock_response]
     profiles = await list_user_profiles()
     mock_get_sagemaker_client.assert_called_once()
-    mock_client.list_user_profiles.assert_called_once()
+    mock_client.get_paginator.assert_called_once_with('list_user_profiles')
     expected = [{'UserProfileName': 'test-user', 'UserProfileArn': 'arn:aws:...'}]
     assert profiles == expected
 
@@ -29,9 +29,9 @@ async def test_list_spaces(mock_get_sagemaker_client):
     mock_client = MagicMock()
     mock_get_sagemaker_client.return_value = mock_client
     mock_response = {'Spaces': [{'SpaceName': 'test-space', 'SpaceId': 'space-id-123'}]}
-    mock_client.list_spaces.return_value = mock_response
+    mock_client.get_paginator.return_value.paginate.return_value = [mock_response]
     spaces = await list_spaces()
     mock_get_sagemaker_client.assert_called_once()
-    mock_client.list_spaces.assert_called_once()
+    mock_client.get_paginator.assert_called_once_with('list_spaces')
     expected = [{'SpaceName': 'test-space', 'SpaceId': 'space-id-123'}]
     assert spaces == expected
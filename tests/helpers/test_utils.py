@@ -1,13 +1,43 @@
 """Tests for the helper functions in the SageMaker AI MCP Server."""
 
+import asyncio
+import boto3
 import os
+import pytest
+import threading
+import time
+from botocore.exceptions import ClientError, EndpointConnectionError
+from botocore.stub import Stubber
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from sagemaker_ai_mcp_server.helpers.endpoints import describe_endpoint
 from sagemaker_ai_mcp_server.helpers.utils import (
+    WARMUP_PAGINATORS,
+    _get_executor,
+    describe_batch,
+    gather_bounded,
     get_aws_session,
+    get_client_config,
     get_region,
     get_sagemaker_client,
     get_sagemaker_execution_role_arn,
+    is_credential_error,
+    is_transient_error,
+    iterate,
+    paginate,
+    prime_connection,
+    project,
+    refresh_env,
+    reset_client_cache,
+    retry_on_expired_credentials,
+    run_batch,
+    run_hedged,
+    run_in_executor,
+    shutdown,
+    use_sagemaker_client,
+    warmup,
 )
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 
 class TestUtils:
@@ -34,6 +64,21 @@ class TestUtils:
             role_arn = get_sagemaker_execution_role_arn()
             assert role_arn == 'arn:aws:iam::123456789012:role/SageMakerExecutionRole'
 
+    def test_get_sagemaker_execution_role_arn_is_read_once(self):
+        """Test that the execution role ARN is cached until refresh_env is called."""
+        with patch.dict(os.environ, {'SAGEMAKER_EXECUTION_ROLE_ARN': 'arn:role/first'}):
+            assert get_sagemaker_execution_role_arn() == 'arn:role/first'
+        with patch.dict(os.environ, {'SAGEMAKER_EXECUTION_ROLE_ARN': 'arn:role/second'}):
+            assert get_sagemaker_execution_role_arn() == 'arn:role/first'
+            refresh_env()
+            assert get_sagemaker_execution_role_arn() == 'arn:role/second'
+
+    def test_get_sagemaker_execution_role_arn_not_set(self):
+        """Test that a missing execution role ARN is reported."""
+        with patch.dict(os.environ, {}, clear=True):
+            with pytest.raises(ValueError):
+                get_sagemaker_execution_role_arn()
+
     @patch('sagemaker_ai_mcp_server.helpers.utils.boto3.Session')
     def test_get_aws_session_with_profile(self, mock_session):
         """Test get_aws_session with AWS_PROFILE environment variable."""
@@ -68,6 +113,688 @@ class TestUtils:
 
         client = get_sagemaker_client('us-west-1')
 
-        mock_get_aws_session.assert_called_once_with('us-west-1')
-        mock_session.client.assert_called_once_with('sagemaker')
+        mock_get_aws_session.assert_called_once_with()
+        mock_session.client.assert_called_once_with(
+            'sagemaker', region_name='us-west-1', config=ANY
+        )
         assert client == mock_client
+
+    def test_get_client_config_defaults(self):
+        """Test the default retry, timeout and pool settings of the client config."""
+        with patch.dict(os.environ, {}, clear=True):
+            config = get_client_config()
+
+        assert config.retries == {'max_attempts': 10, 'mode': 'adaptive'}
+        assert config.connect_timeout == 5
+        assert config.read_timeout == 60
+        assert config.tcp_keepalive is True
+        assert config.max_pool_connections == 64
+        assert config.parameter_validation is True
+
+    def test_get_client_config_from_env(self):
+        """Test that the client config can be tuned through environment variables."""
+        env = {
+            'SAGEMAKER_MCP_MAX_ATTEMPTS': '4',
+            'SAGEMAKER_MCP_RETRY_MODE': 'standard',
+            'SAGEMAKER_MCP_CONNECT_TIMEOUT': '2',
+            'SAGEMAKER_MCP_READ_TIMEOUT': '30',
+            'SAGEMAKER_MCP_MAX_POOL_CONNECTIONS': '128',
+            'SAGEMAKER_MCP_PARAMETER_VALIDATION': 'false',
+        }
+        with patch.dict(os.environ, env, clear=True):
+            config = get_client_config()
+
+        assert config.retries == {'max_attempts': 4, 'mode': 'standard'}
+        assert config.connect_timeout == 2
+        assert config.read_timeout == 30
+        assert config.max_pool_connections == 128
+        assert config.parameter_validation is False
+
+    def test_get_client_config_invalid_bool_env(self):
+        """Test that invalid boolean settings are rejected."""
+        with patch.dict(os.environ, {'SAGEMAKER_MCP_PARAMETER_VALIDATION': 'maybe'}):
+            with pytest.raises(ValueError, match='SAGEMAKER_MCP_PARAMETER_VALIDATION'):
+                get_client_config()
+
+    @pytest.mark.parametrize('value', ['ten', '0'])
+    def test_get_client_config_invalid_env(self, value):
+        """Test that invalid numeric settings are rejected."""
+        with patch.dict(os.environ, {'SAGEMAKER_MCP_MAX_ATTEMPTS': value}):
+            with pytest.raises(ValueError, match='SAGEMAKER_MCP_MAX_ATTEMPTS'):
+                get_client_config()
+
+    @patch('sagemaker_ai_mcp_server.helpers.utils.get_aws_session')
+    def test_get_sagemaker_client_is_cached_per_region(self, mock_get_aws_session):
+        """Test that get_sagemaker_client reuses one client per region."""
+        mock_session = MagicMock()
+        mock_session.client.side_effect = lambda *args, **kwargs: MagicMock()
+        mock_get_aws_session.return_value = mock_session
+
+        first = get_sagemaker_client('us-west-1')
+        second = get_sagemaker_client('us-west-1')
+        other_region = get_sagemaker_client('eu-west-1')
+
+        assert first is second
+        assert other_region is not first
+        mock_get_aws_session.assert_called_once_with()
+        assert mock_session.client.call_count == 2
+
+    @patch('sagemaker_ai_mcp_server.helpers.utils.get_aws_session')
+    def test_get_sagemaker_client_is_built_once_across_threads(self, mock_get_aws_session):
+        """Test that concurrent first calls from several threads share one client."""
+        mock_session = MagicMock()
+
+        def slow_client(*args, **kwargs):
+            time.sleep(0.05)
+            return MagicMock()
+
+        mock_session.client.side_effect = slow_client
+        mock_get_aws_session.return_value = mock_session
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            clients = list(executor.map(lambda _: get_sagemaker_client('us-west-1'), range(4)))
+
+        assert all(client is clients[0] for client in clients)
+        mock_session.client.assert_called_once()
+
+    @patch('sagemaker_ai_mcp_server.helpers.utils.get_aws_session')
+    def test_get_sagemaker_client_defaults_to_env_region(self, mock_get_aws_session):
+        """Test that the default region is resolved before the cache lookup."""
+        mock_session = MagicMock()
+        mock_get_aws_session.return_value = mock_session
+
+        with patch.dict(os.environ, {'AWS_REGION': 'ap-south-1'}):
+            get_sagemaker_client()
+            get_sagemaker_client('ap-south-1')
+
+        mock_session.client.assert_called_once_with(
+            'sagemaker', region_name='ap-south-1', config=ANY
+        )
+
+    @patch('sagemaker_ai_mcp_server.helpers.utils.get_aws_session')
+    def test_warmup_builds_client_and_paginators(self, mock_get_aws_session):
+        """Test that warmup builds the client and paginators used by the first calls."""
+        mock_session = MagicMock()
+        mock_get_aws_session.return_value = mock_session
+
+        warmup()
+
+        client = mock_session.client.return_value
+        assert client.get_paginator.call_count == len(WARMUP_PAGINATORS)
+        client.list_pipelines.assert_not_called()
+        mock_session.get_credentials.assert_called_once_with()
+        assert get_sagemaker_client() is client
+
+    @pytest.mark.asyncio
+    @patch('sagemaker_ai_mcp_server.helpers.utils.get_aws_session')
+    async def test_prime_connection_sends_one_request(self, mock_get_aws_session):
+        """Test that the priming request is sent once, and again after the clients reset."""
+        client = mock_get_aws_session.return_value.client.return_value
+
+        await prime_connection()
+        await prime_connection()
+        client.list_pipelines.assert_called_once_with(MaxResults=1)
+
+        reset_client_cache()
+        await prime_connection()
+        assert client.list_pipelines.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch('sagemaker_ai_mcp_server.helpers.utils.get_aws_session')
+    async def test_prime_connection_ignores_errors(self, mock_get_aws_session):
+        """Test that a failing priming request is only logged."""
+        client = mock_get_aws_session.return_value.client.return_value
+        client.list_pipelines.side_effect = EndpointConnectionError(endpoint_url='https://x')
+
+        await prime_connection()
+
+    @pytest.mark.asyncio
+    @patch('sagemaker_ai_mcp_server.helpers.utils.get_aws_session')
+    async def test_warmup_request_can_be_disabled(self, mock_get_aws_session):
+        """Test that SAGEMAKER_MCP_WARMUP_REQUEST=false skips the priming request."""
+        with patch.dict(os.environ, {'SAGEMAKER_MCP_WARMUP_REQUEST': 'false'}):
+            await prime_connection()
+
+        mock_get_aws_session.return_value.client.return_value.list_pipelines.assert_not_called()
+
+    @patch('sagemaker_ai_mcp_server.helpers.utils.get_aws_session')
+    def test_shutdown_closes_clients_and_executor(self, mock_get_aws_session):
+        """Test that shutdown closes the cached clients and the shared thread pool."""
+        mock_session = MagicMock()
+        mock_session.client.side_effect = lambda *args, **kwargs: MagicMock()
+        mock_get_aws_session.return_value = mock_session
+        clients = [get_sagemaker_client('us-west-1'), get_sagemaker_client('eu-west-1')]
+        executor = _get_executor()
+
+        shutdown()
+
+        for client in clients:
+            client.close.assert_called_once_with()
+        assert get_sagemaker_client('us-west-1') is not clients[0]
+        assert _get_executor() is not executor
+        with pytest.raises(RuntimeError):
+            executor.submit(print)
+
+    @patch('sagemaker_ai_mcp_server.helpers.utils.get_aws_session')
+    def test_warmup_ignores_errors(self, mock_get_aws_session):
+        """Test that a failing warmup does not prevent the server from starting."""
+        mock_get_aws_session.return_value.client.side_effect = Exception('no model')
+
+        warmup()
+
+    @patch('sagemaker_ai_mcp_server.helpers.utils.get_aws_session')
+    def test_reset_client_cache(self, mock_get_aws_session):
+        """Test that reset_client_cache forces a new client to be built."""
+        mock_session = MagicMock()
+        mock_session.client.side_effect = lambda *args, **kwargs: MagicMock()
+        mock_get_aws_session.return_value = mock_session
+
+        first = get_sagemaker_client('us-west-1')
+        reset_client_cache()
+        second = get_sagemaker_client('us-west-1')
+
+        assert first is not second
+
+    def test_paginate_collects_all_pages(self):
+        """Test that paginate concatenates the items of every page."""
+        mock_client = MagicMock()
+        mock_client.get_paginator.return_value.paginate.return_value = [
+            {'Endpoints': [{'EndpointName': 'endpoint-1'}]},
+            {'Endpoints': [{'EndpointName': 'endpoint-2'}]},
+            {},
+        ]
+
+        items = paginate(mock_client, 'list_endpoints', 'Endpoints', NameContains='endpoint')
+
+        mock_client.get_paginator.assert_called_once_with('list_endpoints')
+        mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+            PaginationConfig={'PageSize': 100}, NameContains='endpoint'
+        )
+        assert items == [{'EndpointName': 'endpoint-1'}, {'EndpointName': 'endpoint-2'}]
+
+    def test_paginate_with_max_items(self):
+        """Test that paginate forwards max_items to the paginator."""
+        mock_client = MagicMock()
+        mock_client.get_paginator.return_value.paginate.return_value = [
+            {'Endpoints': [{'EndpointName': 'endpoint-1'}]},
+        ]
+
+        paginate(mock_client, 'list_endpoints', 'Endpoints', max_items=5)
+
+        mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+            PaginationConfig={'PageSize': 100, 'MaxItems': 5}
+        )
+
+    @pytest.mark.asyncio
+    async def test_run_in_executor_runs_off_the_event_loop(self):
+        """Test that run_in_executor calls the function on a worker thread."""
+
+        def blocking_call(value, suffix=''):
+            return threading.current_thread().name, f'{value}{suffix}'
+
+        thread_name, result = await run_in_executor(blocking_call, 'value', suffix='-done')
+
+        assert thread_name.startswith('sagemaker-mcp')
+        assert result == 'value-done'
+
+    def test_executor_size_from_env(self):
+        """Test that the thread pool is sized by SAGEMAKER_MCP_MAX_WORKERS."""
+        _get_executor.cache_clear()
+        try:
+            with patch.dict(os.environ, {'SAGEMAKER_MCP_MAX_WORKERS': '4'}):
+                assert _get_executor()._max_workers == 4
+            _get_executor().shutdown(wait=False)
+            _get_executor.cache_clear()
+            with patch.dict(
+                os.environ,
+                {'SAGEMAKER_MCP_MAX_WORKERS': '64', 'SAGEMAKER_MCP_MAX_POOL_CONNECTIONS': '20'},
+            ):
+                assert _get_executor()._max_workers == 20
+        finally:
+            _get_executor().shutdown(wait=False)
+            _get_executor.cache_clear()
+
+    @pytest.mark.asyncio
+    async def test_run_in_executor_overlaps_blocking_calls(self):
+        """Test that concurrent blocking calls run in parallel."""
+        start = time.monotonic()
+        await asyncio.gather(*(run_in_executor(time.sleep, 0.2) for _ in range(4)))
+
+        assert time.monotonic() - start < 0.6
+
+    @pytest.mark.asyncio
+    async def test_run_in_executor_caps_calls_in_flight(self):
+        """Test that SAGEMAKER_MCP_MAX_INFLIGHT bounds the concurrent calls."""
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+
+        def blocking_call():
+            with lock:
+                in_flight.append(None)
+                peak.append(len(in_flight))
+            time.sleep(0.05)
+            with lock:
+                in_flight.pop()
+
+        with patch.dict(os.environ, {'SAGEMAKER_MCP_MAX_INFLIGHT': '2'}):
+            refresh_env()
+            await asyncio.gather(*(run_in_executor(blocking_call) for _ in range(6)))
+
+        assert max(peak) == 2
+
+    @pytest.mark.asyncio
+    async def test_run_in_executor_limits_calls_per_second(self):
+        """Test that SAGEMAKER_MCP_MAX_RPS spaces out the calls."""
+        with patch.dict(os.environ, {'SAGEMAKER_MCP_MAX_RPS': '20'}):
+            refresh_env()
+            start = time.monotonic()
+            await asyncio.gather(*(run_in_executor(time.monotonic) for _ in range(5)))
+
+        assert time.monotonic() - start >= 0.15
+
+    @pytest.mark.asyncio
+    async def test_iterate_fetches_pages_lazily(self):
+        """Test that iterate only requests the pages that are consumed."""
+        requested = []
+
+        def pages():
+            for index in range(3):
+                requested.append(index)
+                yield {'TrainingJobSummaries': [{'TrainingJobName': f'job-{index}'}]}
+
+        mock_client = MagicMock()
+        mock_client.get_paginator.return_value.paginate.return_value = pages()
+
+        names = []
+        async for job in iterate(
+            mock_client, 'list_training_jobs', 'TrainingJobSummaries', StatusEquals='Failed'
+        ):
+            names.append(job['TrainingJobName'])
+            break
+
+        assert names == ['job-0']
+        assert requested == [0]
+        mock_client.get_paginator.return_value.paginate.assert_called_once_with(
+            PaginationConfig={'PageSize': 100}, StatusEquals='Failed'
+        )
+
+    @pytest.mark.asyncio
+    async def test_gather_bounded_limits_concurrency(self):
+        """Test that gather_bounded never exceeds the concurrency limit."""
+        in_flight = 0
+        peak = 0
+
+        async def work(item):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if item == 3:
+                raise RuntimeError('boom')
+            return item * 2
+
+        results = await gather_bounded(work, range(6), concurrency=2)
+
+        assert peak == 2
+        assert results[:3] == [0, 2, 4]
+        assert isinstance(results[3], RuntimeError)
+        assert results[4:] == [8, 10]
+
+    @pytest.mark.asyncio
+    async def test_gather_bounded_rejects_invalid_concurrency(self):
+        """Test that a non-positive concurrency is rejected."""
+
+        async def work(item):
+            return item
+
+        with pytest.raises(ValueError, match='concurrency'):
+            await gather_bounded(work, [1], concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_run_hedged_is_a_single_call_by_default(self):
+        """Test that run_hedged sends one request when hedging is not configured."""
+        describe = MagicMock(return_value={'Status': 'Completed'})
+
+        assert await run_hedged(describe, Name='job') == {'Status': 'Completed'}
+        describe.assert_called_once_with(Name='job')
+
+    @pytest.mark.asyncio
+    async def test_run_hedged_returns_the_faster_duplicate(self):
+        """Test that a slow call is hedged and the first success is returned."""
+        release = threading.Event()
+        responses = iter([('slow', True), ('fast', False)])
+
+        def describe():
+            name, slow = next(responses)
+            if slow:
+                release.wait(5)
+            return name
+
+        with patch.dict(os.environ, {'SAGEMAKER_MCP_HEDGE_AFTER_MS': '20'}):
+            assert await run_hedged(describe) == 'fast'
+        release.set()
+
+    @pytest.mark.asyncio
+    async def test_run_hedged_raises_when_every_call_fails(self):
+        """Test that run_hedged raises when neither the call nor its hedge succeeds."""
+
+        def describe():
+            time.sleep(0.05)
+            raise ValueError('not found')
+
+        with patch.dict(os.environ, {'SAGEMAKER_MCP_HEDGE_AFTER_MS': '1'}):
+            with pytest.raises(ValueError, match='not found'):
+                await run_hedged(describe)
+
+    @pytest.mark.asyncio
+    async def test_run_hedged_cancels_calls_when_cancelled(self):
+        """Test that cancelling the caller cancels both the call and its hedge."""
+        cancelled = []
+
+        async def slow_call(func, *args, **kwargs):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(func)
+                raise
+
+        with patch.dict(os.environ, {'SAGEMAKER_MCP_HEDGE_AFTER_MS': '1'}):
+            with patch('sagemaker_ai_mcp_server.helpers.utils.run_in_executor', slow_call):
+                task = asyncio.ensure_future(run_hedged(print))
+                await asyncio.sleep(0.05)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+                await asyncio.sleep(0)
+
+        assert cancelled == [print, print]
+
+    @pytest.mark.asyncio
+    async def test_run_hedged_reads_the_setting_once(self):
+        """Test that SAGEMAKER_MCP_HEDGE_AFTER_MS is only picked up again after refresh_env()."""
+        describe = MagicMock(return_value='done')
+        await run_hedged(describe)
+
+        with patch.dict(os.environ, {'SAGEMAKER_MCP_HEDGE_AFTER_MS': 'invalid'}):
+            assert await run_hedged(describe) == 'done'
+            refresh_env()
+            with pytest.raises(ValueError, match='SAGEMAKER_MCP_HEDGE_AFTER_MS'):
+                await run_hedged(describe)
+
+    @pytest.mark.asyncio
+    async def test_run_batch_reports_errors_per_name(self):
+        """Test that run_batch maps each name to None or its error message."""
+
+        async def stop(name):
+            if name == 'bad':
+                raise ValueError('not found')
+
+        results = await run_batch(stop, ['good', 'bad'])
+
+        assert results == {'good': None, 'bad': 'not found'}
+
+    @pytest.mark.asyncio
+    async def test_run_batch_without_wait_runs_in_background(self):
+        """Test that run_batch with wait=False returns before the calls finish."""
+        release = asyncio.Event()
+        stopped = []
+
+        async def stop(name):
+            await release.wait()
+            if name == 'bad':
+                raise ValueError('not found')
+            stopped.append(name)
+
+        with patch('sagemaker_ai_mcp_server.helpers.utils.logger') as mock_logger:
+            results = await run_batch(stop, ['good', 'bad'], wait=False)
+            assert results == {'good': None, 'bad': None}
+            assert stopped == []
+
+            release.set()
+            for _ in range(5):
+                await asyncio.sleep(0)
+
+        assert stopped == ['good']
+        mock_logger.warning.assert_called_once_with('{} failed for {}: {}', 'stop', 'bad', ANY)
+
+    @pytest.mark.asyncio
+    async def test_describe_batch_keeps_results_and_errors_per_name(self):
+        """Test that describe_batch maps each name to its description or its error."""
+
+        async def describe(name):
+            if name == 'bad':
+                raise ValueError('not found')
+            return {'Name': name}
+
+        results = await describe_batch(describe, ['good', 'bad'])
+
+        assert results == {'good': {'Name': 'good'}, 'bad': {'Error': 'not found'}}
+
+    @pytest.mark.parametrize(
+        'error,expected',
+        [
+            (ClientError({'Error': {'Code': 'ThrottlingException'}}, 'DescribeEndpoint'), True),
+            (
+                ClientError(
+                    {
+                        'Error': {'Code': 'InternalFailure'},
+                        'ResponseMetadata': {'HTTPStatusCode': 500},
+                    },
+                    'DescribeEndpoint',
+                ),
+                True,
+            ),
+            (EndpointConnectionError(endpoint_url='https://api.sagemaker'), True),
+            (ClientError({'Error': {'Code': 'ValidationException'}}, 'DescribeEndpoint'), False),
+            (ValueError('bad input'), False),
+        ],
+    )
+    def test_is_transient_error(self, error, expected):
+        """Test telling transient errors apart from permanent ones."""
+        assert is_transient_error(error) is expected
+
+    def test_is_credential_error(self):
+        """Test recognizing credential errors, also behind the ValueError raised by tools."""
+        expired = ClientError({'Error': {'Code': 'ExpiredToken'}}, 'DescribeEndpoint')
+        try:
+            try:
+                raise expired
+            except ClientError as e:
+                raise ValueError(f'Failed to describe endpoint: {e}')
+        except ValueError as e:
+            wrapped = e
+
+        assert is_credential_error(expired) is True
+        assert is_credential_error(wrapped) is True
+        assert (
+            is_credential_error(ClientError({'Error': {'Code': 'ValidationException'}}, 'Op'))
+            is False
+        )
+        assert is_credential_error(ValueError('bad input')) is False
+
+    @pytest.mark.asyncio
+    @patch('sagemaker_ai_mcp_server.helpers.utils.get_aws_session')
+    async def test_retry_on_expired_credentials(self, mock_get_aws_session):
+        """Test that a call rejected for its credentials is retried once with a new client."""
+        mock_session = MagicMock()
+        mock_session.client.side_effect = lambda *args, **kwargs: MagicMock()
+        mock_get_aws_session.return_value = mock_session
+        clients = []
+        error = ClientError({'Error': {'Code': 'InvalidSignatureException'}}, 'ListEndpoints')
+
+        @retry_on_expired_credentials
+        async def call():
+            clients.append(get_sagemaker_client('us-west-1'))
+            if len(clients) == 1:
+                raise error
+            return 'ok'
+
+        assert await call() == 'ok'
+        assert len(clients) == 2
+        assert clients[0] is not clients[1]
+        clients[0].close.assert_called_once_with()
+        assert mock_get_aws_session.call_count == 2
+
+    @pytest.mark.asyncio
+    @patch('sagemaker_ai_mcp_server.helpers.utils.get_aws_session')
+    async def test_concurrent_credential_errors_rebuild_once(self, mock_get_aws_session):
+        """Test that calls failing together with the same session rebuild it only once."""
+        mock_session = MagicMock()
+        mock_session.client.side_effect = lambda *args, **kwargs: MagicMock()
+        mock_get_aws_session.return_value = mock_session
+        first = get_sagemaker_client('us-west-1')
+        error = ClientError({'Error': {'Code': 'ExpiredToken'}}, 'ListEndpoints')
+        started = []
+        both_started = asyncio.Event()
+
+        @retry_on_expired_credentials
+        async def call():
+            client = get_sagemaker_client('us-west-1')
+            if client is first:
+                started.append(client)
+                if len(started) == 2:
+                    both_started.set()
+                await both_started.wait()
+                raise error
+            return client
+
+        second, third = await asyncio.gather(call(), call())
+
+        assert second is third
+        first.close.assert_called_once_with()
+        assert mock_get_aws_session.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_retry_on_expired_credentials_other_errors(self):
+        """Test that other errors and a second credential error are raised."""
+        other = ClientError({'Error': {'Code': 'ValidationException'}}, 'ListEndpoints')
+        expired = ClientError({'Error': {'Code': 'ExpiredToken'}}, 'ListEndpoints')
+        failing = AsyncMock(side_effect=other)
+        expiring = AsyncMock(side_effect=expired)
+
+        with pytest.raises(ClientError):
+            await retry_on_expired_credentials(failing)()
+        with pytest.raises(ClientError):
+            await retry_on_expired_credentials(expiring)()
+
+        assert failing.await_count == 1
+        assert expiring.await_count == 2
+
+    def test_project(self):
+        """Test keeping only the requested fields of a response."""
+        response = {'EndpointName': 'ep', 'EndpointStatus': 'InService', 'Tags': []}
+
+        assert project(response) is response
+        assert project(response, ['EndpointStatus', 'Missing']) == {'EndpointStatus': 'InService'}
+
+    def test_project_keeps_stale_marker(self):
+        """Test that a stale fallback response stays marked after projection."""
+        response = {'EndpointName': 'ep', 'EndpointStatus': 'InService', '_stale': True}
+
+        assert project(response, ['EndpointStatus']) == {
+            'EndpointStatus': 'InService',
+            '_stale': True,
+        }
+
+    def test_project_dotted_paths(self):
+        """Test keeping nested fields, including inside lists."""
+        response = {
+            'EndpointName': 'ep',
+            'ProductionVariants': [
+                {'VariantName': 'a', 'CurrentInstanceCount': 1, 'DeployedImages': []},
+                {'VariantName': 'b', 'CurrentInstanceCount': 2, 'DeployedImages': []},
+            ],
+            'DataCaptureConfig': {'EnableCapture': True, 'CaptureStatus': 'Started'},
+        }
+
+        assert project(
+            response,
+            [
+                'ProductionVariants.VariantName',
+                'ProductionVariants.CurrentInstanceCount',
+                'DataCaptureConfig.CaptureStatus',
+                'DataCaptureConfig.Missing',
+            ],
+        ) == {
+            'ProductionVariants': [
+                {'VariantName': 'a', 'CurrentInstanceCount': 1},
+                {'VariantName': 'b', 'CurrentInstanceCount': 2},
+            ],
+            'DataCaptureConfig': {'CaptureStatus': 'Started'},
+        }
+
+    def test_get_region_is_read_once(self):
+        """Test that get_region caches the region until refresh_env is called."""
+        with patch.dict(os.environ, {'AWS_REGION': 'eu-west-1'}):
+            assert get_region() == 'eu-west-1'
+        with patch.dict(os.environ, {'AWS_REGION': 'eu-central-1'}):
+            assert get_region() == 'eu-west-1'
+            refresh_env()
+            assert get_region() == 'eu-central-1'
+
+    @patch('sagemaker_ai_mcp_server.helpers.utils.boto3.Session')
+    def test_refresh_env_picks_up_new_profile(self, mock_session):
+        """Test that refresh_env re-reads AWS_PROFILE and drops cached clients."""
+        mock_session.side_effect = lambda **kwargs: MagicMock()
+
+        with patch.dict(os.environ, {'AWS_PROFILE': 'first'}):
+            first = get_sagemaker_client('us-east-1')
+        with patch.dict(os.environ, {'AWS_PROFILE': 'second'}):
+            refresh_env()
+            second = get_sagemaker_client('us-east-1')
+
+        assert first is not second
+        assert mock_session.call_args_list[-1].kwargs['profile_name'] == 'second'
+
+    @patch('sagemaker_ai_mcp_server.helpers.utils.get_aws_session')
+    def test_credentials_are_resolved_once(self, mock_get_aws_session):
+        """Test that credentials are resolved once for all regional clients."""
+        mock_session = MagicMock()
+        mock_get_aws_session.return_value = mock_session
+
+        get_sagemaker_client('us-east-1')
+        get_sagemaker_client('eu-west-1')
+
+        mock_session.get_credentials.assert_called_once_with()
+
+    @patch('sagemaker_ai_mcp_server.helpers.utils.logger')
+    @patch('sagemaker_ai_mcp_server.helpers.utils.get_aws_session')
+    def test_missing_credentials_are_reported(self, mock_get_aws_session, mock_logger):
+        """Test that a warning is logged when no credentials can be resolved."""
+        mock_session = MagicMock()
+        mock_session.get_credentials.return_value = None
+        mock_get_aws_session.return_value = mock_session
+
+        get_sagemaker_client('us-east-1')
+
+        mock_logger.warning.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_use_sagemaker_client_with_stubber():
+    """Test that helpers use an injected client, bypassing the response cache."""
+    client = boto3.client(
+        'sagemaker',
+        region_name='us-east-1',
+        aws_access_key_id='testing',
+        aws_secret_access_key='testing',
+    )
+    response = {
+        'EndpointName': 'test-endpoint',
+        'EndpointArn': 'arn:aws:sagemaker:us-east-1:123456789012:endpoint/test-endpoint',
+        'EndpointStatus': 'InService',
+        'CreationTime': datetime(2024, 1, 1),
+        'LastModifiedTime': datetime(2024, 1, 1),
+    }
+
+    with Stubber(client) as stubber, use_sagemaker_client(client):
+        stubber.add_response('describe_endpoint', response, {'EndpointName': 'test-endpoint'})
+        stubber.add_response('describe_endpoint', response, {'EndpointName': 'test-endpoint'})
+        assert get_sagemaker_client() is client
+        assert (await describe_endpoint('test-endpoint'))['EndpointStatus'] == 'InService'
+        assert (await describe_endpoint('test-endpoint'))['EndpointStatus'] == 'InService'
+        stubber.assert_no_pending_responses()
+
+    assert get_sagemaker_client() is not client
@@ -1,15 +1,18 @@
 """Tests for the main function in server.py."""
 
-from sagemaker_ai_mcp_server.server import main
+import asyncio
+import pytest
+from sagemaker_ai_mcp_server.server import main, mcp, server_lifespan
 from unittest.mock import patch
 
 
 class TestMain:
     """Tests for the main function."""
 
+    @patch('sagemaker_ai_mcp_server.server.shutdown')
     @patch('sagemaker_ai_mcp_server.server.mcp.run')
     @patch('sys.argv', ['sagemaker-ai-mcp-server'])
-    def test_main_default(self, mock_run):
+    def test_main_default(self, mock_run, mock_shutdown):
         """Test main function with default arguments."""
         # Call the main function
         main()
@@ -17,6 +20,28 @@ class TestMain:
         # Check that mcp.run was called with the correct arguments
         mock_run.assert_called_once()
         assert mock_run.call_args[1].get('transport') is None
+        # Check that the shared clients were released once the server stopped
+        mock_shutdown.assert_called_once_with()
+
+    @pytest.mark.asyncio
+    @patch('sagemaker_ai_mcp_server.server.prime_connection')
+    @patch('sagemaker_ai_mcp_server.server.shutdown')
+    @patch('sagemaker_ai_mcp_server.server.warmup')
+    async def test_server_lifespan(self, mock_warmup, mock_shutdown, mock_prime_connection):
+        """Test that the lifespan warms up the client and leaves it open for other sessions."""
+        started = asyncio.Event()
+
+        async def prime_connection():
+            started.set()
+            await asyncio.Event().wait()
+
+        mock_prime_connection.side_effect = prime_connection
+        async with server_lifespan(mcp):
+            mock_warmup.assert_called_once_with()
+            # The priming request runs in the background, without holding up the session.
+            await asyncio.wait_for(started.wait(), timeout=1)
+
+        mock_shutdown.assert_not_called()
 
     def test_module_execution(self):
         """Test the module execution when run as __main__."""
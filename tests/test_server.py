@@ -1,6 +1,8 @@
 """Tests for the server functions in the SageMaker AI MCP Server."""
 
+import hashlib
 import pytest
+from botocore.exceptions import ClientError
 from sagemaker_ai_mcp_server.server import (
     create_app_sagemaker,
     create_mlflow_tracking_server_sagemaker,
@@ -31,6 +33,8 @@ from sagemaker_ai_mcp_server.server import (
     describe_processing_job_sagemaker,
     describe_training_job_sagemaker,
     describe_transform_job_sagemaker,
+    list_all_endpoints_sagemaker,
+    list_all_jobs_sagemaker,
     list_apps_sagemaker,
     list_domains_sagemaker,
     list_endpoint_configs_sagemaker,
@@ -44,11 +48,13 @@ from sagemaker_ai_mcp_server.server import (
     list_models_sagemaker,
     list_pipeline_execution_steps_sagemaker,
     list_pipeline_executions_sagemaker,
+    list_pipeline_executions_with_details_sagemaker,
     list_pipeline_parameters_for_execution_sagemaker,
     list_pipelines_sagemaker,
     list_processing_jobs_sagemaker,
     list_spaces_sagemaker,
     list_training_jobs_sagemaker,
+    list_training_jobs_with_details_sagemaker,
     list_transform_jobs_sagemaker,
     list_user_profiles_sagemaker,
     start_mlflow_tracking_server_sagemaker,
@@ -75,6 +81,44 @@ async def test_list_endpoints_sagemaker():
         assert result == {'endpoints': [{'EndpointName': 'test-endpoint'}]}
 
 
+@pytest.mark.asyncio
+async def test_list_endpoints_sagemaker_with_filters():
+    """Test that the name filter and the result limit are passed to the helper."""
+    with patch('sagemaker_ai_mcp_server.server.list_endpoints') as mock_list_endpoints:
+        mock_list_endpoints.return_value = [{'EndpointName': 'prod-endpoint'}]
+
+        result = await list_endpoints_sagemaker(name_contains='prod', max_results=10)
+
+        mock_list_endpoints.assert_called_once_with(10, 'prod')
+        assert result == {'endpoints': [{'EndpointName': 'prod-endpoint'}]}
+
+
+@pytest.mark.asyncio
+async def test_list_training_jobs_sagemaker_with_filters():
+    """Test that the training job name filter and result limit are passed to the helper."""
+    with patch('sagemaker_ai_mcp_server.server.list_training_jobs') as mock_list_jobs:
+        mock_list_jobs.return_value = []
+
+        await list_training_jobs_sagemaker(name_contains='xgboost')
+
+        mock_list_jobs.assert_called_once_with(100, name_contains='xgboost')
+
+
+@pytest.mark.asyncio
+async def test_list_endpoints_sagemaker_retries_expired_credentials():
+    """Test that a tool is retried once when its credentials were rejected."""
+    expired = ClientError({'Error': {'Code': 'ExpiredToken'}}, 'ListEndpoints')
+    with patch('sagemaker_ai_mcp_server.server.list_endpoints') as mock_list_endpoints:
+        with patch('sagemaker_ai_mcp_server.helpers.utils.refresh_credentials') as mock_refresh:
+            mock_list_endpoints.side_effect = [expired, [{'EndpointName': 'test-endpoint'}]]
+
+            result = await list_endpoints_sagemaker()
+
+            assert mock_list_endpoints.call_count == 2
+            mock_refresh.assert_called_once()
+            assert result == {'endpoints': [{'EndpointName': 'test-endpoint'}]}
+
+
 @pytest.mark.asyncio
 async def test_list_endpoint_configs_sagemaker():
     """Test the list_endpoint_configs_sagemaker function."""
@@ -87,6 +131,76 @@ async def test_list_endpoint_configs_sagemaker():
         assert result == {'endpoint_configs': [{'EndpointConfigName': 'test-config'}]}
 
 
+@pytest.mark.asyncio
+async def test_list_all_endpoints_sagemaker():
+    """Test the list_all_endpoints_sagemaker function."""
+    inventory = {'Endpoints': [{'EndpointName': 'test-endpoint'}], 'EndpointConfigs': []}
+    with patch('sagemaker_ai_mcp_server.server.list_all_endpoints') as mock_list_all:
+        mock_list_all.return_value = inventory
+
+        result = await list_all_endpoints_sagemaker()
+
+        mock_list_all.assert_called_once_with(100)
+        assert result == inventory
+
+
+@pytest.mark.asyncio
+async def test_list_all_jobs_sagemaker_passes_max_results():
+    """Test that list_all_jobs_sagemaker caps every job list at max_results."""
+    jobs = {
+        'TrainingJobs': [{'TrainingJobName': 'job-1'}],
+        'ProcessingJobs': [],
+        'TransformJobs': [],
+        'InferenceRecommendationsJobs': [],
+    }
+    with patch('sagemaker_ai_mcp_server.server.list_all_jobs') as mock_list_all:
+        mock_list_all.return_value = jobs
+
+        result = await list_all_jobs_sagemaker(max_results=5)
+
+        mock_list_all.assert_called_once_with(5)
+        assert result == jobs
+
+
+@pytest.mark.asyncio
+async def test_list_all_jobs_sagemaker():
+    """Test the list_all_jobs_sagemaker function."""
+    with patch('sagemaker_ai_mcp_server.server.list_all_jobs') as mock_list_all:
+        mock_list_all.side_effect = Exception('throttled')
+
+        with pytest.raises(ValueError, match='Failed to list jobs: throttled'):
+            await list_all_jobs_sagemaker()
+
+
+@pytest.mark.asyncio
+async def test_list_training_jobs_with_details_sagemaker():
+    """Test the list_training_jobs_with_details_sagemaker function."""
+    details = {'job-1': {'TrainingJobName': 'job-1'}}
+    with patch(
+        'sagemaker_ai_mcp_server.server.list_training_jobs_with_details'
+    ) as mock_list_with_details:
+        mock_list_with_details.return_value = details
+
+        result = await list_training_jobs_with_details_sagemaker(max_results=5)
+
+        mock_list_with_details.assert_called_once_with(5)
+        assert result == {'training_jobs': details}
+
+
+@pytest.mark.asyncio
+async def test_list_pipeline_executions_with_details_sagemaker():
+    """Test the list_pipeline_executions_with_details_sagemaker function."""
+    with patch(
+        'sagemaker_ai_mcp_server.server.list_pipeline_executions_with_details'
+    ) as mock_list_with_details:
+        mock_list_with_details.side_effect = Exception('Pipeline not found')
+
+        with pytest.raises(ValueError, match='Failed to list pipeline executions with details'):
+            await list_pipeline_executions_with_details_sagemaker(pipeline_name='missing')
+
+        mock_list_with_details.assert_called_once_with('missing', 20)
+
+
 @pytest.mark.asyncio
 async def test_describe_endpoint_sagemaker():
     """Test the describe_endpoint_sagemaker function."""
@@ -105,6 +219,36 @@ async def test_describe_endpoint_sagemaker():
         assert result == {'endpoint_details': expected_result}
 
 
+@pytest.mark.asyncio
+async def test_describe_endpoint_sagemaker_with_fields():
+    """Test that describe_endpoint_sagemaker only returns the requested fields."""
+    with patch('sagemaker_ai_mcp_server.server.describe_endpoint') as mock_describe_endpoint:
+        mock_describe_endpoint.return_value = {
+            'EndpointName': 'test-endpoint',
+            'EndpointStatus': 'InService',
+            'ProductionVariants': [],
+        }
+
+        result = await describe_endpoint_sagemaker('test-endpoint', fields=['EndpointStatus'])
+
+        assert result == {'endpoint_details': {'EndpointStatus': 'InService'}}
+
+
+@pytest.mark.asyncio
+async def test_describe_endpoint_sagemaker_keeps_stale_marker_with_fields():
+    """Test that a stale fallback response stays marked when fields are requested."""
+    with patch('sagemaker_ai_mcp_server.server.describe_endpoint') as mock_describe_endpoint:
+        mock_describe_endpoint.return_value = {
+            'EndpointName': 'test-endpoint',
+            'EndpointStatus': 'InService',
+            '_stale': True,
+        }
+
+        result = await describe_endpoint_sagemaker('test-endpoint', fields=['EndpointStatus'])
+
+        assert result == {'endpoint_details': {'EndpointStatus': 'InService', '_stale': True}}
+
+
 @pytest.mark.asyncio
 async def test_describe_endpoint_config_sagemaker():
     """Test the describe_endpoint_config_sagemaker function."""
@@ -221,7 +365,7 @@ async def test_list_inference_recommendations_jobs_sagemaker():
         assert 'inference_recommendations_jobs' in result
         assert len(result['inference_recommendations_jobs']) == 2
         assert result['inference_recommendations_jobs'][0]['JobName'] == 'test-job-1'
-        mock_list_jobs.assert_called_once()
+        mock_list_jobs.assert_called_once_with(100, None)
 
 
 @pytest.mark.asyncio
@@ -408,7 +552,7 @@ async def test_list_pipeline_executions_sagemaker():
 
         result = await list_pipeline_executions_sagemaker('test-pipeline')
 
-        mock_list_executions.assert_called_once_with('test-pipeline')
+        mock_list_executions.assert_called_once_with('test-pipeline', max_items=100)
         assert result == {
             'pipeline_executions': [
                 {
@@ -500,6 +644,30 @@ async def test_describe_pipeline_definition_for_execution_sagemaker():
         assert result == {'pipeline_definition': expected_result}
 
 
+@pytest.mark.asyncio
+async def test_describe_pipeline_definition_for_execution_sagemaker_digest():
+    """Test that the definition can be returned as a digest, with fields projected."""
+    with patch(
+        'sagemaker_ai_mcp_server.server.describe_pipeline_definition_for_execution'
+    ) as mock_describe_definition:
+        mock_describe_definition.return_value = {
+            'PipelineDefinition': 'test-definition',
+            'CreationTime': '2023-01-01T00:00:00',
+        }
+
+        result = await describe_pipeline_definition_for_execution_sagemaker(
+            'arn:aws:sagemaker:us-west-2:123456789012:pipeline/test-pipeline/execution/test',
+            fields=['PipelineDefinitionSha256'],
+            definition_digest=True,
+        )
+
+        assert result == {
+            'pipeline_definition': {
+                'PipelineDefinitionSha256': hashlib.sha256(b'test-definition').hexdigest()
+            }
+        }
+
+
 @pytest.mark.asyncio
 async def test_describe_pipeline_execution_sagemaker():
     """Test the describe_pipeline_execution_sagemaker function."""
@@ -780,7 +948,7 @@ async def test_list_models_sagemaker():
 
         result = await list_models_sagemaker()
 
-        mock_list_models.assert_called_once()
+        mock_list_models.assert_called_once_with(100, None)
         assert result == {
             'models': [
                 {'ModelName': 'test-model-1'},
@@ -828,9 +996,9 @@ async def test_list_model_cards_sagemaker():
             {'ModelCardId': 'test-model-card-2'},
         ]
 
-        result = await list_model_cards_sagemaker()
+        result = await list_model_cards_sagemaker(name_contains='card', max_results=10)
 
-        mock_list_model_cards.assert_called_once()
+        mock_list_model_cards.assert_called_once_with(10, 'card')
         assert result == {
             'model_cards': [
                 {'ModelCardId': 'test-model-card-1'},